@@ -0,0 +1,101 @@
+"""Benchmark the JSON codecs of the DataScribe API client.
+
+Compares the installed codecs on realistic `DataTableRows` and `MaterialByIdResults` response bodies, timing
+response decoding on its own and followed by model validation, as well as filter encoding.
+
+Usage:
+    python benchmarks/bench_codec.py --rows 10000 --materials 200 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from datascribe_api.codec import available_codecs, get_codec
+from datascribe_api.filter import Filter
+from datascribe_api.models import DataTableRows, MaterialByIdResults
+from datascribe_api.utils import build_model
+
+ELEMENTS = ["Si", "O", "Fe", "Al", "Ti", "Li", "Mn", "Co", "Ni", "Cu"]
+
+
+def table_rows_body(rows: int) -> bytes:
+    """Build a `get_data_table_rows` response body with `rows` rows of mixed column types."""
+    rng = random.Random(0)
+    data = [
+        {
+            "id": i,
+            "name": f"sample-{i}",
+            "formula": "".join(rng.sample(ELEMENTS, 3)),
+            "density": rng.uniform(1, 20),
+            "band_gap": rng.uniform(0, 8),
+            "stable": bool(i % 2),
+            "spacegroup": rng.randint(1, 230),
+            "created_on": "2025-01-01T00:00:00Z",
+            "notes": None if i % 3 else "measured",
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({"success": True, "data": data}).encode()
+
+
+def materials_body(materials: int) -> bytes:
+    """Build a `get_material_by_id` response body with `materials` nested provider documents."""
+    rng = random.Random(0)
+    results = [
+        {
+            "provider": rng.choice(["MP", "AFLOW", "OQMD"]),
+            "id": f"mp-{i}",
+            "data": {
+                "formula_pretty": "".join(rng.sample(ELEMENTS, 2)),
+                "elements": rng.sample(ELEMENTS, 2),
+                "structure": {
+                    "lattice": {"matrix": [[rng.uniform(0, 10) for _ in range(3)] for _ in range(3)]},
+                    "sites": [
+                        {"species": rng.choice(ELEMENTS), "xyz": [rng.uniform(0, 10) for _ in range(3)]} for _ in range(24)
+                    ],
+                },
+                "energy_per_atom": rng.uniform(-10, 0),
+                "band_gap": rng.uniform(0, 8),
+            },
+        }
+        for i in range(materials)
+    ]
+    return json.dumps({"success": True, "data": {"results": results, "total": materials}}).encode()
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs of `func`, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a table of timings per codec."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Rows in the DataTableRows payload.")
+    parser.add_argument("--materials", type=int, default=200, help="Results in the MaterialByIdResults payload.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is reported.")
+    args = parser.parse_args()
+
+    payloads = {
+        "DataTableRows": (table_rows_body(args.rows), DataTableRows),
+        "MaterialByIdResults": (materials_body(args.materials), MaterialByIdResults),
+    }
+    filters = Filter.serialize([Filter("band_gap") > 1, Filter("formula").in_(ELEMENTS)])
+
+    print(f"{'codec':<10}{'payload':<22}{'MB':>8}{'decode ms':>12}{'decode+model ms':>18}")
+    for name in available_codecs():
+        codec = get_codec(name)
+        for label, (body, model) in payloads.items():
+            decode = best_of(lambda body=body, codec=codec: codec.loads(body), args.repeat)
+            total = best_of(lambda body=body, model=model, codec=codec: build_model(model, codec.loads(body)), args.repeat)
+            print(f"{name:<10}{label:<22}{len(body) / 1e6:>8.2f}{decode:>12.2f}{total:>18.2f}")
+        encode = best_of(lambda codec=codec: [codec.dumps(filters) for _ in range(10000)], args.repeat) / 10
+        print(f"{name:<10}{'filters (us/call)':<22}{'':>8}{encode:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 """DataScribe API Client.
 
-This module provides the DataScribeClient for interacting with the DataScribe API.
+This module provides the DataScribeClient and AsyncDataScribeClient for interacting with the DataScribe API.
 """
 
+from datascribe_api.async_client import AsyncDataScribeClient
 from datascribe_api.client import DataScribeClient
 
-_all__ = ["DataScribeClient"]
+_all__ = ["AsyncDataScribeClient", "DataScribeClient"]
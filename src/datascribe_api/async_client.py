@@ -0,0 +1,247 @@
+"""Asynchronous DataScribe API Client.
+
+This module provides the AsyncDataScribeClient, an asyncio-native counterpart of DataScribeClient built on httpx.
+It exposes the same endpoints and model mapping, so many requests can be kept in flight from one event loop.
+"""
+
+import asyncio
+import os
+from typing import Any
+
+from datascribe_api.cache import canonical_key
+from datascribe_api.codec import JSONCodec, get_codec
+from datascribe_api.columnar import build_frame, check_format, schema_dtypes
+from datascribe_api.models import DataTableRows
+from datascribe_api.ratelimit import parse_retry_after
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.routes import DEFAULT_TIMEOUT, ROUTES
+from datascribe_api.singleflight import AsyncSingleFlight
+from datascribe_api.utils import build_model, http_error, prepare_params, resolve_timeouts, response_data
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+
+class AsyncDataScribeClient:
+    """This client provides coroutine methods to interact with the DataScribe API.
+
+    Every endpoint in ROUTES is available as a coroutine, e.g. `await client.get_data_table_rows(...)`.
+    Calls can be cancelled like any other asyncio task, and each call accepts an optional `deadline`
+    in seconds that bounds the total time spent on the request, including retries.
+
+    Attributes:
+        api_key (str): The API key for authentication.
+        base (str): The base URL for the DataScribe API.
+        client (httpx.AsyncClient): The connection pool used for making HTTP requests.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base: str = "https://datascribe.cloud/",
+        max_connections: int = 100,
+        timeout: float = 600,
+        codec: JSONCodec | str | None = None,
+        coalesce: bool = True,
+        timeouts: dict[str, float | tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        lazy_validation: bool = False,
+    ) -> None:
+        """Initialize the asynchronous DataScribe API client.
+
+        Args:
+            api_key (str | None): The API key for authentication. If not provided, it will be read from the environment variable `DATASCRIBE_API_TOKEN`.
+            base (str): The base URL for the DataScribe API. Defaults to "https://datascribe.cloud/".
+            max_connections (int): The maximum number of concurrent connections to the API. Defaults to 100.
+            timeout (float): The longest timeout in seconds for a single HTTP request, capping the per-endpoint timeouts. Defaults to 600.
+            codec (JSONCodec | str | None): The JSON codec, or the name of its backend ("orjson", "msgspec" or "json"), used to encode filters and decode responses. Defaults to the `DATASCRIBE_JSON_CODEC` environment variable or the fastest installed backend.
+            coalesce (bool): Share one request between tasks that make the same call at the same time. Defaults to True.
+            timeouts (dict[str, float | tuple[float, float]] | None): Connect and read timeouts in seconds keyed by endpoint name, e.g. `{"get_data_table_metadata": (5, 20)}`. A single number sets the read timeout. Endpoints not listed use their defaults from `routes.TIMEOUTS`.
+            retry_policy (RetryPolicy | None): The policy deciding how often and how long to wait before retrying failed requests. Defaults to a RetryPolicy with default settings.
+            lazy_validation (bool): Build the rows, tables and materials of list responses without validating them, and validate each one into its model the first time it is accessed. Defaults to False.
+
+        Raises:
+            ImportError: If httpx is not installed.
+            ValueError: If the API key is not provided and not found in the environment variables, or `timeouts` names an unknown endpoint.
+        """
+        if httpx is None:
+            raise ImportError("AsyncDataScribeClient requires httpx. Install it with `pip install datascribe_api[async]`.")
+        self._api_key = api_key or os.getenv("DATASCRIBE_API_TOKEN")
+        if not self._api_key:
+            raise ValueError(
+                "A DataScribe API key is required. Check https://datascribe.cloud/profile to generate an API key.",
+            )
+        self._base = base.rstrip("/")
+        self._timeout = timeout
+        self._timeouts = resolve_timeouts(timeouts)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._lazy_validation = lazy_validation
+        self._table_dtypes: dict[str, dict[str, str]] = {}
+        self._codec = get_codec(codec)
+        self._flight = AsyncSingleFlight() if coalesce else None
+        self._client = httpx.AsyncClient(
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self._api_key}",
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def __aenter__(self) -> "AsyncDataScribeClient":
+        """Async context manager entry method for the AsyncDataScribeClient."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit method for the AsyncDataScribeClient. Closes the connection pool."""
+        await self.close()
+
+    async def _get(self, path: str, params: dict[str, Any]) -> Any:
+        """Make a GET request to the DataScribe API.
+
+        Concurrent identical requests share a single HTTP request when coalescing is enabled.
+
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            params (Dict[str, Any]): The query parameters for the request.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            HTTPError: If the request fails with a status code indicating an error.
+        """
+        params = prepare_params(params, self._codec)
+        if self._flight is None:
+            return await self._request(path, params)
+        return await self._flight.do(
+            canonical_key(path, params),
+            lambda: self._request(path, params),
+            share=lambda data: self._codec.loads(self._codec.encode(data)),
+        )
+
+    async def _request(self, path: str, params: dict[str, Any]) -> Any:
+        """Send a GET request with prepared query parameters to the DataScribe API.
+
+        Transient failures (HTTP 429, 502, 503, 504 and connection errors) are retried as decided by the retry
+        policy, which receives the outcome of every attempt.
+
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            params (Dict[str, Any]): The prepared query parameters for the request.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            HTTPError: If the request fails with a status code indicating an error.
+        """
+        url = f"{self._base}{path}"
+        connect, read = self._timeouts.get(path, DEFAULT_TIMEOUT)
+        timeout = httpx.Timeout(self._timeout, connect=min(connect, self._timeout), read=min(read, self._timeout))
+        policy = self._retry_policy
+        policy.begin()
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            try:
+                resp = await self._client.get(url, params=params, timeout=timeout)
+            except httpx.TransportError as e:
+                delay = policy.next_delay(url, attempt, delay, error=e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            if resp.status_code not in policy.statuses:
+                policy.report(url, attempt, "response", resp.status_code)
+                break
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            delay = policy.next_delay(url, attempt, delay, status=resp.status_code, retry_after=retry_after)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        if resp.is_error:
+            raise http_error(resp.status_code, resp.json(), f"{resp.status_code} {resp.reason_phrase} for url: {resp.url}")
+        return self._codec.loads(resp.content)
+
+    async def search(self, endpoint: str, deadline: float | None = None, as_: str | None = None, **kwargs: Any) -> Any:
+        """Search for data tables or metadata in the DataScribe API.
+
+        Args:
+            endpoint (str): The endpoint to search, e.g., "get_data_tables", "get_data_table", etc.
+            deadline (float | None): The maximum number of seconds the call may take, including retries.
+            as_ (str | None): Return the rows of a row endpoint as "records" (plain dicts), a "compact" CompactRows table, a "pandas" DataFrame, a "typed" pandas DataFrame whose dtypes follow the column types of the table, an "arrow" Table or a "polars" DataFrame, built column by column without a model per row. Defaults to None (models).
+            **kwargs: Additional parameters to pass to the API. For endpoints supporting filtering, pass 'filters' as a dict, Filter, or list of Filters.
+
+        Example:
+                    async with AsyncDataScribeClient() as client:
+                        rows = await client.get_data_table_rows(tableName="users", columns=["id", "name"], deadline=30)
+
+        Returns:
+            Any: A list of data models corresponding to the search results.
+
+        Raises:
+            ValueError: If required parameters are missing, or `as_` is unsupported or given for an endpoint that does not return rows.
+            TimeoutError: If the deadline expires before the call completes.
+        """
+        path, model, required_params = ROUTES[endpoint]
+        missing = [p for p in required_params if p not in kwargs]
+        if missing:
+            raise ValueError(f"Missing required parameters for '{endpoint}': {', '.join(missing)}")
+        if as_ is not None:
+            check_format(as_)
+            if model is not DataTableRows:
+                raise ValueError(f"'{endpoint}' does not return table rows, so `as_` is not supported.")
+        async with asyncio.timeout(deadline):
+            dtypes = await self.table_dtypes(kwargs["tableName"]) if as_ == "typed" else None
+            resp = await self._get(path, {**kwargs})
+        if as_ is not None:
+            return build_frame(response_data(resp), as_, dtypes)
+        return build_model(model, resp, self._lazy_validation)
+
+    async def table_dtypes(self, tableName: str, refresh: bool = False) -> dict[str, str]:
+        """Return the pandas dtypes of the columns of a data table, as used by `as_="typed"`.
+
+        Args:
+            tableName (str): The name of the data table.
+            refresh (bool): Fetch the columns again instead of using the dtypes kept on the client. Defaults to False.
+
+        Returns:
+            dict[str, str]: The dtype of each column whose type has one, keyed by column name.
+        """
+        dtypes = None if refresh else self._table_dtypes.get(tableName)
+        if dtypes is None:
+            dtypes = schema_dtypes(await self.get_data_table_columns(tableName=tableName))
+            self._table_dtypes[tableName] = dtypes
+        return dtypes
+
+    async def close(self) -> None:
+        """Close the connection pool used by the AsyncDataScribeClient."""
+        await self._client.aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        """Dynamic attribute access for searching data tables or metadata.
+
+        This method allows access to search coroutines based on the endpoint names defined in ROUTES.
+
+        Args:
+            name (str): The name of the endpoint to search, e.g., "data-table", "data-tables", etc.
+
+        Returns:
+            Callable: A function returning a coroutine that performs the search for the specified endpoint.
+        """
+        if name in ROUTES:
+            return lambda **kwargs: self.search(name, **kwargs)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __dir__(self) -> list[str]:
+        """List all available attributes and methods of the AsyncDataScribeClient, including the API endpoints.
+
+        Returns:
+            list[str]: A list of attribute names, including API endpoints defined in ROUTES.
+        """
+        return list(ROUTES.keys()) + super().__dir__()
@@ -0,0 +1,90 @@
+from typing import Any
+
+from datascribe_api.codec import JSONCodec
+from datascribe_api.filter import Filter
+from datascribe_api.models import (
+    DataTableColumns,
+    DataTableMetadata,
+    DataTableRows,
+    DataTableRowsCount,
+    DataTables,
+    MaterialByIdResults,
+    MaterialSearchResults,
+)
+from datascribe_api.retry import RetryPolicy
+
+class AsyncDataScribeClient:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base: str = "https://datascribe.cloud/",
+        max_connections: int = 100,
+        timeout: float = 600,
+        codec: JSONCodec | str | None = None,
+        coalesce: bool = True,
+        timeouts: dict[str, float | tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        lazy_validation: bool = False,
+    ) -> None:
+        self._base = None
+        self._client = None
+        self._api_key = None
+        self._codec = None
+        self._flight = None
+        self._timeout = None
+        self._timeouts = None
+        self._retry_policy = None
+        self._lazy_validation = None
+        self._table_dtypes = None
+        ...
+    async def __aenter__(self) -> AsyncDataScribeClient: ...
+    async def __aexit__(self, *args: Any) -> None: ...
+    async def close(self) -> None: ...
+    async def table_dtypes(self, tableName: str, refresh: bool = False) -> dict[str, str]: ...
+    async def _get(self, path: str, params: dict[str, Any]): ...
+    async def _request(self, path: str, params: dict[str, Any]): ...
+    async def search(self, endpoint: str, deadline: float | None = None, as_: str | None = None, **kwargs: Any) -> Any: ...
+    async def get_data_tables(self, deadline: float | None = None) -> DataTables: ...
+    async def get_data_table(
+        self,
+        tableName: str,
+        startingRow: int = 0,
+        numRows: int = 100,
+        deadline: float | None = None,
+        as_: str | None = None,
+    ) -> DataTableRows | Any: ...
+    async def get_data_tables_for_user(self, deadline: float | None = None) -> DataTables: ...
+    async def get_data_table_rows(
+        self,
+        tableName: str,
+        columns: list[str],
+        startingRow: int = 0,
+        numRows: int = 100,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        deadline: float | None = None,
+        as_: str | None = None,
+    ) -> DataTableRows | Any: ...
+    async def get_data_table_columns(self, tableName: str, deadline: float | None = None) -> DataTableColumns: ...
+    async def get_data_table_metadata(self, tableName: str, deadline: float | None = None) -> DataTableMetadata: ...
+    async def get_data_table_rows_count(
+        self,
+        tableName: str,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        deadline: float | None = None,
+    ) -> DataTableRowsCount: ...
+    async def get_material_by_id(
+        self, ids: str, providers: list[str] | str, deadline: float | None = None
+    ) -> MaterialByIdResults: ...
+    async def search_materials(
+        self,
+        formula: str | None = None,
+        elements: list[str] | str | None = None,
+        exclude_elements: list[str] | str | None = None,
+        spacegroup: str | None = None,
+        props: list[str] | str | None = None,
+        temperature: float | str | None = None,
+        providers: list[str] | str | None = None,
+        page: int = 1,
+        size: int = 50,
+        deadline: float | None = None,
+    ) -> MaterialSearchResults: ...
@@ -0,0 +1,179 @@
+"""Adaptive page sizes for the DataScribe API.
+
+This module provides a page-size tuner for paginated scans. It measures the latency and response size of
+every page and moves the page size toward a target response time, growing it while throughput improves and
+halving it after a timeout or server error. Pagination helpers accept `"auto"` in place of a fixed page size
+to use one.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Timeout
+from requests.exceptions import RetryError
+
+from datascribe_api.utils import measure_responses
+
+AUTO = "auto"
+
+T = TypeVar("T")
+
+
+class PageSizeTuner:
+    """Adapts the page size of a paginated scan to the latency and size of its responses.
+
+    After each page, the number of rows that would be answered within `target_latency` is estimated from the
+    observed throughput, and capped so a response stays under `max_bytes`. A page slower than the target
+    shrinks the size to that estimate. A faster page grows it by `growth`, up to the estimate, as long as
+    throughput keeps improving, and otherwise keeps it. A timeout or server error halves it. The tuner is
+    thread-safe and can be shared by the scans of one table.
+
+    Attributes:
+        min_size (int): The smallest page size.
+        max_size (int): The largest page size.
+        target_latency (float): The response time in seconds the page size is tuned toward.
+        max_bytes (int): The largest response size in bytes the page size is tuned toward.
+        growth (float): The factor the page size grows by after a fast page.
+    """
+
+    def __init__(
+        self,
+        initial: int = 100,
+        min_size: int = 10,
+        max_size: int = 10_000,
+        target_latency: float = 2.0,
+        max_bytes: int = 16 * 1024**2,
+        growth: float = 2.0,
+    ) -> None:
+        """Initialize the tuner.
+
+        Args:
+            initial (int): The page size of the first page. Defaults to 100.
+            min_size (int): The smallest page size. Defaults to 10.
+            max_size (int): The largest page size. Defaults to 10000.
+            target_latency (float): The response time in seconds the page size is tuned toward. Defaults to 2.
+            max_bytes (int): The largest response size in bytes the page size is tuned toward. Defaults to 16 MiB.
+            growth (float): The factor the page size grows by after a fast page. Defaults to 2.
+
+        Raises:
+            ValueError: If the sizes are not positive and ordered, or `growth` is not greater than 1.
+        """
+        if not 0 < min_size <= initial <= max_size:
+            raise ValueError("Page sizes must satisfy 0 < min_size <= initial <= max_size.")
+        if growth <= 1:
+            raise ValueError("growth must be greater than 1.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.growth = growth
+        self._size = initial
+        self._best = 0.0
+        self._stats = {"pages": 0, "failures": 0, "rows": 0, "bytes": 0, "seconds": 0.0}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The page size to request next."""
+        return self._size
+
+    def _clamp(self, size: float) -> int:
+        """Return a page size within the bounds of the tuner."""
+        return max(self.min_size, min(self.max_size, int(size)))
+
+    def observe(self, rows: int, seconds: float, nbytes: int = 0) -> None:
+        """Record a page and adjust the page size.
+
+        Args:
+            rows (int): The number of rows in the page.
+            seconds (float): The time in seconds the page took.
+            nbytes (int): The size in bytes of the response, or 0 if unknown. Defaults to 0.
+        """
+        with self._lock:
+            self._stats["pages"] += 1
+            self._stats["rows"] += rows
+            self._stats["bytes"] += nbytes
+            self._stats["seconds"] += seconds
+            if rows == 0 or seconds <= 0:
+                return
+            throughput = rows / seconds
+            target = throughput * self.target_latency
+            if nbytes:
+                target = min(target, rows * self.max_bytes / nbytes)
+            if seconds > self.target_latency or self._size > target:
+                self._size = self._clamp(target)
+            elif throughput > self._best:
+                self._size = self._clamp(min(self._size * self.growth, target))
+            # Let the best throughput fade, so the size can grow again once conditions improve.
+            self._best = max(throughput, self._best * 0.9)
+
+    def failure(self) -> None:
+        """Record a page that failed with a timeout or server error and halve the page size."""
+        with self._lock:
+            self._stats["failures"] += 1
+            self._size = self._clamp(self._size / 2)
+
+    def call(self, fetch: Callable[[], T], count: Callable[[T], int] = len) -> T:
+        """Fetch a page, recording its latency and response size, or its failure.
+
+        Pages answered without a request, e.g. from the client's cache, are not recorded.
+
+        Args:
+            fetch (Callable[[], T]): The function fetching the page.
+            count (Callable[[T], int]): The function counting the rows of the page. Defaults to `len`.
+
+        Returns:
+            T: The page.
+        """
+        started = time.monotonic()
+        try:
+            with measure_responses() as counts:
+                page = fetch()
+        except Exception as e:
+            if is_overload(e):
+                self.failure()
+            raise
+        if counts["responses"]:
+            self.observe(count(page), time.monotonic() - started, counts["bytes"])
+        return page
+
+    def stats(self) -> dict[str, Any]:
+        """Return the pages observed, failures, rows, bytes and seconds, and the current page size."""
+        with self._lock:
+            return {**self._stats, "size": self._size}
+
+
+def resolve_tuner(size: int | str | PageSizeTuner, name: str = "page_size") -> PageSizeTuner | None:
+    """Return the tuner of a page size option.
+
+    Args:
+        size (int | str | PageSizeTuner): A fixed page size, "auto", or a tuner.
+        name (str): The name of the option, used in error messages. Defaults to "page_size".
+
+    Returns:
+        PageSizeTuner | None: A new tuner for "auto", the tuner itself, or None for a fixed page size.
+
+    Raises:
+        ValueError: If `size` is a string other than "auto" or an integer that is not positive.
+    """
+    if isinstance(size, PageSizeTuner):
+        return size
+    if size == AUTO:
+        return PageSizeTuner()
+    if isinstance(size, str) or size <= 0:
+        raise ValueError(f"{name} must be a positive integer or '{AUTO}'.")
+    return None
+
+
+def is_overload(error: BaseException) -> bool:
+    """Return whether a failed page suggests the server is overloaded by its size.
+
+    Timeouts, dropped connections, exhausted retries and 5xx responses count, while other client errors do not.
+    """
+    if isinstance(error, (Timeout, RequestsConnectionError, RetryError)):
+        return True
+    response = getattr(error, "response", None)
+    return isinstance(error, HTTPError) and response is not None and response.status_code >= 500  # noqa: PLR2004
@@ -0,0 +1,684 @@
+"""Response caching for the DataScribe API.
+
+This module provides caches for decoded API responses. Entries are keyed on the endpoint path and its
+canonicalized query parameters and expire after a per-endpoint TTL. The ResponseCache keeps entries in process
+memory, the DiskCache keeps them in a SQLite database that can be shared by several processes, and the
+TieredCache stacks caches so that, for example, a memory tier is backed by a disk tier.
+
+Responses scoped to a table (rows, columns, row counts and metadata) can additionally be stamped with the
+table's `last_updated` version. A single `get_data_tables_for_user` call checks the versions of every table of
+the user at once. Entries of the tables it lists no longer expire and are replaced only when the table's version
+moves forward, while entries of other tables, whose versions are not refreshed, still expire after their TTL.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from datascribe_api.codec import JSONCodec, get_codec
+from datascribe_api.routes import ROUTES
+
+CATALOG_PATHS = frozenset({ROUTES["get_data_tables"][0], ROUTES["get_data_tables_for_user"][0]})
+METADATA_PATH = ROUTES["get_data_table_metadata"][0]
+
+REVALIDATION_PATH = ROUTES["get_data_tables_for_user"][0]
+
+
+def canonical_key(path: str, params: dict[str, Any]) -> str:
+    """Build the cache key of a request from its path and prepared query parameters.
+
+    Parameters are sorted by name, parameters set to None are dropped, and serialized filters are
+    re-encoded with sorted keys, so equivalent calls map to the same key regardless of argument order.
+
+    Args:
+        path (str): The API endpoint path.
+        params (dict[str, Any]): The query parameters, as returned by `prepare_params`.
+
+    Returns:
+        str: The cache key.
+    """
+    items = []
+    for name in sorted(params):
+        value = params[name]
+        if value is None:
+            continue
+        if name == "filters" and isinstance(value, str):
+            value = json.dumps(json.loads(value), sort_keys=True, separators=(",", ":"))
+        items.append((name, value))
+    return f"{path}?{urlencode(items, doseq=True)}"
+
+
+class BaseCache(ABC):
+    """Common behavior of the response caches.
+
+    Subclasses implement the storage: `get`, `get_stale`, `set`, `clear` and `__len__`. Each `get` returns a copy
+    of the stored response, so callers can modify it without changing the cache entry.
+
+    Attributes:
+        ttl (float | None): The default time to live of an entry in seconds. None means entries never expire.
+        ttls (dict[str, float | None]): TTL overrides per endpoint name. A TTL of 0 disables caching for that endpoint.
+        offline (bool): Whether expired entries are served when the API cannot be reached.
+        revalidate_after (float | None): The number of seconds after which the known table versions are refreshed. None means they are only refreshed by an explicit `revalidate_tables()` call.
+        versions (dict[str, str]): The `last_updated` version of each table seen in catalog or metadata responses.
+        revalidated (frozenset[str]): The tables listed by the last `get_data_tables_for_user` response, whose
+            versions are refreshed by revalidation.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups not answered from the cache.
+        evictions (int): The number of entries evicted to respect the size limit.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = 300,
+        ttls: dict[str, float | None] | None = None,
+        offline: bool = False,
+        revalidate_after: float | None = 300,
+    ) -> None:
+        """Initialize the TTL settings and counters of the cache.
+
+        Args:
+            ttl (float | None): The default time to live of an entry in seconds. Defaults to 300.
+            ttls (dict[str, float | None] | None): TTL overrides keyed by endpoint name, e.g. "get_data_table_columns".
+            offline (bool): Serve expired entries when the API cannot be reached. Defaults to False.
+            revalidate_after (float | None): The number of seconds after which the known table versions are refreshed. Defaults to 300.
+
+        Raises:
+            ValueError: If `ttls` names an unknown endpoint.
+        """
+        unknown = [name for name in ttls or {} if name not in ROUTES]
+        if unknown:
+            raise ValueError(f"Unknown endpoints in ttls: {', '.join(unknown)}")
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.offline = offline
+        self.revalidate_after = revalidate_after
+        self.versions: dict[str, str] = {}
+        self.revalidated: frozenset[str] = frozenset()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._path_ttls = {ROUTES[name][0]: value for name, value in self.ttls.items()}
+        self._versions_checked: float | None = None
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float | None:
+        """Return the time to live of entries for an endpoint path.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Returns:
+            float | None: The TTL in seconds, or None if entries never expire.
+        """
+        return self._path_ttls.get(path, self.ttl)
+
+    def version_of(self, params: dict[str, Any]) -> str | None:
+        """Return the known version of the table a request is scoped to.
+
+        Args:
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            str | None: The table's `last_updated` version, or None if the request is not table-scoped or the version is unknown.
+        """
+        table_name = params.get("tableName")
+        return self.versions.get(table_name) if table_name else None
+
+    def key(self, path: str, params: dict[str, Any]) -> str:
+        """Build the cache key of a request, stamped with its table's version when known.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            str: The cache key.
+        """
+        key = canonical_key(path, params)
+        version = self.version_of(params)
+        return f"{key}#{version}" if version else key
+
+    def expiry_ttl(self, path: str, params: dict[str, Any]) -> float | None:
+        """Return the time to live of a new entry.
+
+        Version-stamped entries of tables whose versions are refreshed by revalidation do not expire. Other entries,
+        including those of tables whose version is only known from their metadata, keep the TTL of their endpoint.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            float | None: The TTL in seconds, or None if the entry never expires.
+        """
+        ttl = self.ttl_for(path)
+        if params.get("tableName") in self.revalidated and self.version_of(params) and (ttl is None or ttl > 0):
+            return None
+        return ttl
+
+    def record_versions(self, versions: dict[str, str], complete: bool = False) -> list[str]:
+        """Record the `last_updated` versions of tables.
+
+        Args:
+            versions (dict[str, str]): The versions keyed by table name.
+            complete (bool): Whether the versions come from a `get_data_tables_for_user` response, which lists the
+                tables refreshed by revalidation and resets the revalidation timer.
+
+        Returns:
+            list[str]: The names of the tables whose version changed.
+        """
+        with self._lock:
+            changed = [name for name, version in versions.items() if self.versions.get(name) not in (None, version)]
+            self.versions.update(versions)
+            if complete:
+                self.revalidated = frozenset(versions)
+                self._versions_checked = time.monotonic()
+        return changed
+
+    def observe_versions(self, path: str, resp: Any) -> list[str]:
+        """Record the table versions carried by a catalog or metadata response.
+
+        Args:
+            path (str): The API endpoint path.
+            resp (Any): The decoded response.
+
+        Returns:
+            list[str]: The names of the tables whose version changed.
+        """
+        data = resp.get("data", resp) if isinstance(resp, dict) else resp
+        if path in CATALOG_PATHS and isinstance(data, list):
+            tables = {t["table_name"]: t["last_updated"] for t in data if "table_name" in t and "last_updated" in t}
+            return self.record_versions(tables, complete=path == REVALIDATION_PATH)
+        if path == METADATA_PATH and isinstance(data, dict) and "table_name" in data and "last_updated" in data:
+            return self.record_versions({data["table_name"]: data["last_updated"]})
+        return []
+
+    def claim_revalidation(self) -> bool:
+        """Check whether the table versions are due for a refresh, claiming the refresh if they are.
+
+        Only one caller is told to refresh per `revalidate_after` interval.
+
+        Returns:
+            bool: True if the caller should refresh the versions with a catalog request.
+        """
+        if self.revalidate_after is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if not self.versions or (self._versions_checked is not None and now - self._versions_checked < self.revalidate_after):
+                return False
+            self._versions_checked = now
+            return True
+
+    @abstractmethod
+    def get(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: A copy of the cached response, or None if the request is not cached or its entry expired.
+        """
+
+    @abstractmethod
+    def get_stale(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request, ignoring its expiry.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: A copy of the cached response, or None if the request is not cached.
+        """
+
+    @abstractmethod
+    def set(self, path: str, params: dict[str, Any], value: Any) -> None:
+        """Store the response of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+            value (Any): The decoded response.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry from the cache. The counters are kept."""
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters.
+
+        Returns:
+            dict[str, int]: The number of hits, misses, evictions and current entries.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+
+
+class ResponseCache(BaseCache):
+    """An in-process, thread-safe TTL/LRU cache for decoded API responses.
+
+    Entries are stored as encoded JSON and decoded on every lookup, so each caller receives its own copy.
+
+    Example usage:
+        cache = ResponseCache(maxsize=512, ttl=600, ttls={"get_data_table_rows": 60, "search_materials": 0})
+        client = DataScribeClient(cache=cache)
+        client.get_data_table_columns(tableName="users")
+        cache.stats()
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept in the cache.
+        codec (JSONCodec): The JSON codec used to serialize entries.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = 300,
+        ttls: dict[str, float | None] | None = None,
+        offline: bool = False,
+        revalidate_after: float | None = 300,
+        codec: JSONCodec | str | None = None,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in the cache. Defaults to 1024.
+            ttl (float | None): The default time to live of an entry in seconds. Defaults to 300.
+            ttls (dict[str, float | None] | None): TTL overrides keyed by endpoint name, e.g. "get_data_table_columns".
+            offline (bool): Serve expired entries when the API cannot be reached. Defaults to False.
+            revalidate_after (float | None): The number of seconds after which the known table versions are refreshed. Defaults to 300.
+            codec (JSONCodec | str | None): The JSON codec used to serialize entries. Defaults to the fastest installed backend.
+
+        Raises:
+            ValueError: If `maxsize` is not positive or `ttls` names an unknown endpoint.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        super().__init__(ttl, ttls, offline, revalidate_after)
+        self.maxsize = maxsize
+        self.codec = get_codec(codec)
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def get(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: A copy of the cached response, or None if the request is not cached or its entry expired.
+        """
+        key = self.key(path, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self.codec.loads(entry[1])
+            if entry is not None and not self.offline:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def get_stale(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request, ignoring its expiry.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: A copy of the cached response, or None if the request is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(self.key(path, params))
+        return None if entry is None else self.codec.loads(entry[1])
+
+    def set(self, path: str, params: dict[str, Any], value: Any) -> None:
+        """Store the response of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+            value (Any): The decoded response.
+        """
+        ttl = self.expiry_ttl(path, params)
+        if ttl is not None and ttl <= 0:
+            return
+        key = self.key(path, params)
+        expires = None if ttl is None else time.monotonic() + ttl
+        blob = self.codec.encode(value)
+        with self._lock:
+            self._entries[key] = (expires, blob)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry from the cache. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(BaseCache):
+    """A persistent cache for decoded API responses, stored in a SQLite database.
+
+    Entries are compressed with zlib. SQLite's file locking makes the cache safe to share between threads and
+    processes, so worker processes and CLI invocations pointed at the same directory reuse each other's
+    responses. Once the compressed entries exceed `max_bytes`, expired entries and then the least recently
+    used ones are evicted.
+
+    Example usage:
+        cache = DiskCache("~/.cache/datascribe_api", max_bytes=2 * 1024**3, ttl=86400, offline=True)
+        client = DataScribeClient(cache=cache)
+
+    Attributes:
+        path (Path): The path of the SQLite database.
+        max_bytes (int): The maximum total size of the compressed entries.
+        codec (JSONCodec): The JSON codec used to serialize entries.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        max_bytes: int = 1024**3,
+        ttl: float | None = 86400,
+        ttls: dict[str, float | None] | None = None,
+        offline: bool = True,
+        revalidate_after: float | None = 300,
+        codec: JSONCodec | str | None = None,
+    ) -> None:
+        """Initialize the disk cache, creating its database if needed.
+
+        Args:
+            directory (str | PathLike | None): The directory of the cache. Defaults to the `DATASCRIBE_CACHE_DIR` environment variable, or `~/.cache/datascribe_api`.
+            max_bytes (int): The maximum total size of the compressed entries. Defaults to 1 GiB.
+            ttl (float | None): The default time to live of an entry in seconds. Defaults to one day.
+            ttls (dict[str, float | None] | None): TTL overrides keyed by endpoint name, e.g. "get_data_table_columns".
+            offline (bool): Serve expired entries when the API cannot be reached. Defaults to True.
+            revalidate_after (float | None): The number of seconds after which the known table versions are refreshed. Defaults to 300.
+            codec (JSONCodec | str | None): The JSON codec used to serialize entries. Defaults to the fastest installed backend.
+
+        Raises:
+            ValueError: If `max_bytes` is not positive or `ttls` names an unknown endpoint.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        super().__init__(ttl, ttls, offline, revalidate_after)
+        directory = directory or os.getenv("DATASCRIBE_CACHE_DIR") or Path.home() / ".cache" / "datascribe_api"
+        directory = Path(directory).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / "responses.sqlite3"
+        self.max_bytes = max_bytes
+        self.codec = get_codec(codec)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, expires REAL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _lookup(self, path: str, params: dict[str, Any], stale: bool) -> Any:
+        """Read an entry, refreshing its access time.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+            stale (bool): Whether expired entries are returned.
+
+        Returns:
+            Any: The cached response, or None if it is missing or expired.
+        """
+        key = self.key(path, params)
+        conn = self._connect()
+        row = conn.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or (not stale and row[1] is not None and row[1] <= now):
+            return None
+        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return self.codec.loads(zlib.decompress(row[0]))
+
+    def get(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: The cached response, or None if the request is not cached or its entry expired.
+        """
+        value = self._lookup(path, params, stale=False)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def get_stale(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request, ignoring its expiry.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: The cached response, or None if the request is not cached.
+        """
+        return self._lookup(path, params, stale=True)
+
+    def set(self, path: str, params: dict[str, Any], value: Any) -> None:
+        """Store the response of a request, evicting entries if the cache grows beyond `max_bytes`.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+            value (Any): The decoded response.
+        """
+        ttl = self.expiry_ttl(path, params)
+        if ttl is not None and ttl <= 0:
+            return
+        blob = zlib.compress(self.codec.encode(value))
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                (self.key(path, params), blob, len(blob), expires, now),
+            )
+            evicted = self._evict(conn, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.evictions += evicted
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Delete expired and then least recently used entries until the cache fits in `max_bytes`.
+
+        Args:
+            conn (sqlite3.Connection): The connection holding the write transaction.
+            now (float): The current time.
+
+        Returns:
+            int: The number of evicted entries.
+        """
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY (expires IS NOT NULL AND expires <= ?) DESC, accessed ASC", (now,)
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return len(victims)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache. The counters are kept."""
+        self._connect().execute("DELETE FROM entries")
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters.
+
+        Returns:
+            dict[str, int]: The number of hits, misses, evictions, current entries and stored bytes.
+        """
+        count, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": count, "bytes": size}
+
+    def close(self) -> None:
+        """Close the database connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class TieredCache(BaseCache):
+    """A stack of caches consulted in order, e.g. a fast memory tier backed by a shared disk tier.
+
+    A hit in a lower tier is copied into the tiers above it, and new responses are stored in every tier.
+
+    Example usage:
+        cache = TieredCache(ResponseCache(maxsize=256), DiskCache())
+        client = DataScribeClient(cache=cache)
+
+    Attributes:
+        tiers (tuple[BaseCache, ...]): The caches, fastest first.
+    """
+
+    def __init__(self, *tiers: BaseCache) -> None:
+        """Initialize the tiered cache.
+
+        Args:
+            *tiers (BaseCache): The caches, fastest first.
+
+        Raises:
+            ValueError: If no tier is given.
+        """
+        if not tiers:
+            raise ValueError("TieredCache requires at least one tier.")
+        super().__init__(
+            offline=any(tier.offline for tier in tiers),
+            revalidate_after=min((t.revalidate_after for t in tiers if t.revalidate_after is not None), default=None),
+        )
+        self.tiers = tiers
+
+    def record_versions(self, versions: dict[str, str], complete: bool = False) -> list[str]:
+        """Record the `last_updated` versions of tables in every tier.
+
+        Args:
+            versions (dict[str, str]): The versions keyed by table name.
+            complete (bool): Whether the versions come from a `get_data_tables_for_user` response, which lists the
+                tables refreshed by revalidation and resets the revalidation timer.
+
+        Returns:
+            list[str]: The names of the tables whose version changed.
+        """
+        for tier in self.tiers:
+            tier.record_versions(versions, complete)
+        return super().record_versions(versions, complete)
+
+    def __len__(self) -> int:
+        """Return the number of entries in the largest tier."""
+        return max(len(tier) for tier in self.tiers)
+
+    def get(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request, tier by tier.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: The cached response, or None if no tier holds a fresh entry.
+        """
+        for index, tier in enumerate(self.tiers):
+            value = tier.get(path, params)
+            if value is not None:
+                for upper in self.tiers[:index]:
+                    upper.set(path, params, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_stale(self, path: str, params: dict[str, Any]) -> Any:
+        """Look up the cached response of a request in any tier, ignoring its expiry.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+
+        Returns:
+            Any: The cached response, or None if no tier holds it.
+        """
+        for tier in self.tiers:
+            value = tier.get_stale(path, params)
+            if value is not None:
+                return value
+        return None
+
+    def set(self, path: str, params: dict[str, Any], value: Any) -> None:
+        """Store the response of a request in every tier.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict[str, Any]): The prepared query parameters.
+            value (Any): The decoded response.
+        """
+        for tier in self.tiers:
+            tier.set(path, params, value)
+
+    def clear(self) -> None:
+        """Remove every entry from every tier. The counters are kept."""
+        for tier in self.tiers:
+            tier.clear()
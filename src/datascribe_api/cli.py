@@ -290,5 +290,41 @@ def search_materials(
         handle_error(e)
 
 
+@app.command("export-table")
+def export_table(
+    table_name: Annotated[str, typer.Option("--table-name", "-t", help="Name of the data table.", show_envvar=False)],
+    output: Annotated[str, typer.Option("--output", "-o", help="Directory to write the export to.", show_envvar=False)],
+    api_key: Annotated[str, typer.Option(envvar="DATASCRIBE_API_TOKEN", help="Your DataScribe API key.")],
+    columns: Annotated[
+        str, typer.Option("--columns", "-c", help="Comma-separated list of columns. Defaults to all.", show_envvar=False)
+    ] = "",
+    filter_: Annotated[list[str], typer.Option("--filter", help="Filter expression. Can be used multiple times.")] = [],
+    format_: Annotated[str, typer.Option("--format", "-f", help="Format of the part files: jsonl or csv.")] = "jsonl",
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Number of concurrent requests.")] = 4,
+    page_size: Annotated[int, typer.Option("--page-size", help="Number of rows per page.")] = 1000,
+    json: Annotated[bool | None, typer.Option("--json", help="Output in JSON format.")] = None,
+) -> None:
+    """Export a data table to a directory of part files. Rerunning an interrupted export resumes it."""
+    try:
+        with DataScribeClient(api_key=api_key) as client:
+            cols = columns.split(",") if columns else None
+            filters = [parse_filter_string(f) for f in filter_] if filter_ else None
+            manifest = client.export_table(
+                tableName=table_name,
+                path=output,
+                columns=cols,
+                filters=filters,
+                format=format_,
+                workers=workers,
+                page_size=page_size,
+            )
+            if json:
+                typer.echo(client.codec.dumps(manifest))
+            else:
+                pretty_print(f"Exported {manifest['rows']} rows of {table_name} to {len(manifest['parts'])} files in {output}")
+    except Exception as e:
+        handle_error(e)
+
+
 if __name__ == "__main__":
     app(prog_name="datascribe-cli", invoke_without_command=True)
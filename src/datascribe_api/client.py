@@ -3,15 +3,55 @@
 This module provides a client for interacting with the DataScribe API, allowing users to search for data tables and their metadata.
 """
 
-import json
+import contextlib
+import contextvars
 import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from typing import Any
 
-from requests import HTTPError
+import pandas as pd
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, RequestException, Response, Timeout
 
+from datascribe_api import export, materials, pagination, spill
+from datascribe_api.autotune import PageSizeTuner
+from datascribe_api.cache import BaseCache, ResponseCache, canonical_key
+from datascribe_api.codec import JSONCodec, get_codec
+from datascribe_api.columnar import build_frame, check_format, concat_frames, schema_dtypes
 from datascribe_api.filter import Filter
-from datascribe_api.routes import ROUTES
-from datascribe_api.utils import retry_session
+from datascribe_api.materials import MAX_IDS_LENGTH
+from datascribe_api.models import DataTableRow, DataTableRows, MaterialByIdResults, MaterialSearchResults, MaterialSummary
+from datascribe_api.ratelimit import THROTTLE_STATUSES, RateLimiter, parse_retry_after
+from datascribe_api.resilience import CircuitBreaker, HedgePolicy
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.routes import DEFAULT_TIMEOUT, ROUTES
+from datascribe_api.singleflight import SingleFlight
+from datascribe_api.streaming import STREAM_CHUNK_SIZE, iter_json_array
+from datascribe_api.utils import (
+    POOL_MAXSIZE,
+    DeadlineExceeded,
+    build_model,
+    deadline_scope,
+    http_error,
+    is_deadline_expiry,
+    pool_stats,
+    prepare_params,
+    record_response,
+    remaining_time,
+    request_timeout,
+    resolve_timeouts,
+    response_data,
+    retry_session,
+)
+
+
+def _close_response(future: Future) -> None:
+    """Close the response of a request whose result was not used."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 
 class DataScribeClient:
@@ -21,25 +61,87 @@ class DataScribeClient:
         api_key (str): The API key for authentication.
         base (str): The base URL for the DataScribe API.
         session (Session): The session used for making HTTP requests with retry logic.
+        cache (BaseCache | None): The cache of decoded responses, if caching is enabled.
+        codec (JSONCodec): The JSON codec used to encode filters and decode responses.
+        rate_limiter (RateLimiter | None): The rate limiter pacing requests, if rate limiting is enabled.
+        hedge (HedgePolicy | None): The policy deciding when to send duplicate requests, if hedging is enabled.
+        circuit_breaker (CircuitBreaker | None): The per-endpoint circuit breaker, if one is set.
+        retry_policy (RetryPolicy): The policy deciding when to retry failed requests.
+        lazy_validation (bool): Whether the items of list models are validated only when they are accessed.
     """
 
-    def __init__(self, api_key: str | None = None, base: str = "https://datascribe.cloud/") -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base: str = "https://datascribe.cloud/",
+        cache: BaseCache | bool | None = None,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        keepalive: bool = True,
+        codec: JSONCodec | str | None = None,
+        coalesce: bool = True,
+        rate_limiter: RateLimiter | bool | None = None,
+        hedge: HedgePolicy | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        timeouts: dict[str, float | tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        lazy_validation: bool = False,
+    ) -> None:
         """Initialize the DataScribe API client.
 
         Args:
             api_key (str | None): The API key for authentication. If not provided, it will be read from the environment variable `DATASCRIBE_API_TOKEN`.
             base (str): The base URL for the DataScribe API. Defaults to "https://datascribe.cloud/".
+            cache (BaseCache | bool | None): A cache for decoded responses, e.g. a ResponseCache, DiskCache or TieredCache. Pass True to use a ResponseCache with default settings. Defaults to None (no caching).
+            pool_maxsize (int): The maximum number of connections kept open to the API. Set it to at least the number of threads sharing the client. Defaults to 32.
+            pool_block (bool): Wait for a free connection instead of opening a surplus one when the pool is exhausted. Defaults to False.
+            keepalive (bool): Enable TCP keep-alive probes on pooled connections. Defaults to True.
+            codec (JSONCodec | str | None): The JSON codec, or the name of its backend ("orjson", "msgspec" or "json"), used to encode filters and decode responses. Defaults to the `DATASCRIBE_JSON_CODEC` environment variable or the fastest installed backend.
+            coalesce (bool): Share one request between threads that make the same call at the same time. Defaults to True.
+            rate_limiter (RateLimiter | bool | None): A rate limiter that paces requests and adapts their concurrency to 429 and 503 responses. It can be shared between clients. Pass True to use a RateLimiter with default settings. Defaults to None (no rate limiting).
+            hedge (HedgePolicy | bool | None): A policy that sends a duplicate of a request once it is slower than a percentile of its endpoint's recent latencies, using whichever response arrives first. Pass True to use a HedgePolicy with default settings. Defaults to None (no hedging).
+            circuit_breaker (CircuitBreaker | bool | None): A circuit breaker that makes calls to an endpoint fail fast with CircuitOpenError after repeated server errors or timeouts. Pass True to use a CircuitBreaker with default settings. Defaults to None.
+            timeouts (dict[str, float | tuple[float, float]] | None): Connect and read timeouts in seconds keyed by endpoint name, e.g. `{"get_data_table_metadata": (5, 20)}`. A single number sets the read timeout. Endpoints not listed use their defaults from `routes.TIMEOUTS`.
+            retry_policy (RetryPolicy | None): The policy deciding how often and how long to wait before retrying failed requests, with an optional retry budget and a hook receiving every attempt. It can be shared between clients. Defaults to a RetryPolicy with default settings.
+            lazy_validation (bool): Build the rows, tables and materials of list responses without validating them, and validate each one into its model the first time it is accessed. Items that are only counted or skipped are never validated. Defaults to False.
 
         Raises:
-            ValueError: If the API key is not provided and not found in the environment variables.
+            ValueError: If the API key is not provided and not found in the environment variables, or `timeouts` names an unknown endpoint.
         """
+        self._timeouts = resolve_timeouts(timeouts)
         self._api_key = api_key or os.getenv("DATASCRIBE_API_TOKEN")
         if not self._api_key:
             raise ValueError(
                 "A DataScribe API key is required. Check https://datascribe.cloud/profile to generate an API key.",
             )
         self._base = base.rstrip("/")
-        self._session = retry_session()
+        self._codec = get_codec(codec)
+        self._cache = ResponseCache(codec=self._codec) if cache is True else None if cache is False else cache
+        self._flight = SingleFlight() if coalesce else None
+        self._rate_limiter = RateLimiter() if rate_limiter is True else None if rate_limiter is False else rate_limiter
+        self._hedge = HedgePolicy() if hedge is True else None if hedge is False else hedge
+        self._circuit_breaker = (
+            CircuitBreaker() if circuit_breaker is True else None if circuit_breaker is False else circuit_breaker
+        )
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=pool_maxsize, thread_name_prefix="datascribe-hedge")
+            if self._hedge is not None
+            else None
+        )
+        # With a rate limiter, throttling responses are retried by the client so the limiter sees them.
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._lazy_validation = lazy_validation
+        self._table_dtypes: dict[str, dict[str, str]] = {}
+        retry_statuses = tuple(
+            status for status in self._retry_policy.statuses if self._rate_limiter is None or status not in THROTTLE_STATUSES
+        )
+        self._session = retry_session(
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive=keepalive,
+            retry_statuses=retry_statuses,
+            retry_policy=self._retry_policy,
+        )
         self._session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -47,6 +149,41 @@ class DataScribeClient:
             },
         )
 
+    @property
+    def cache(self) -> BaseCache | None:
+        """The cache of decoded responses, or None if caching is disabled."""
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The rate limiter pacing requests, or None if rate limiting is disabled."""
+        return self._rate_limiter
+
+    @property
+    def hedge(self) -> HedgePolicy | None:
+        """The policy deciding when to send duplicate requests, or None if hedging is disabled."""
+        return self._hedge
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """The per-endpoint circuit breaker, or None if none is set."""
+        return self._circuit_breaker
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The policy deciding when to retry failed requests."""
+        return self._retry_policy
+
+    @property
+    def lazy_validation(self) -> bool:
+        """Whether the items of list models are validated only when they are accessed."""
+        return self._lazy_validation
+
+    @property
+    def codec(self) -> JSONCodec:
+        """The JSON codec used to encode filters and decode responses."""
+        return self._codec
+
     def __enter__(self) -> "DataScribeClient":
         """Context manager entry method for the DataScribeClient."""
         return self
@@ -58,6 +195,12 @@ class DataScribeClient:
     def _get(self, path: str, params: dict[str, Any]) -> Any:
         """Make a GET request to the DataScribe API.
 
+        Responses are served from and stored in the client's cache when caching is enabled. Before a
+        table-scoped response is looked up, the cached table versions are refreshed if they are due.
+        Concurrent identical requests share a single HTTP request when coalescing is enabled. If the shared request
+        fails because the deadline of the caller that made it passed, the other callers make it again within their
+        own deadlines instead of failing with it.
+
         Args:
             path (str): The API endpoint path to which the request is made.
             params (Dict[str, Any]): The query parameters for the request.
@@ -68,38 +211,274 @@ class DataScribeClient:
         Raises:
             HTTPError: If the request fails with a status code indicating an error.
         """
-        url = f"{self._base}{path}"
+        params = prepare_params(params, self._codec)
+        cache = self._cache
+
+        if cache is not None:
+            if "tableName" in params and cache.claim_revalidation():
+                with contextlib.suppress(RequestException):
+                    self.revalidate_tables()
+            if (cached := cache.get(path, params)) is not None:
+                return cached
+
+        def fetch() -> Any:
+            data = self._request(path, params)
+            if cache is not None and data.get("success") is not False:
+                self._observe_versions(path, data)
+                cache.set(path, params, data)
+            return data
+
+        if self._flight is None:
+            return fetch()
+        try:
+            return self._flight.do(
+                canonical_key(path, params),
+                fetch,
+                timeout=remaining_time(),
+                share=self._copy_response,
+                retry_on=(DeadlineExceeded,),
+            )
+        except TimeoutError as e:
+            raise DeadlineExceeded("Deadline exceeded while waiting for an identical request to the DataScribe API.") from e
 
-        if (filters := params.get("filters")) is not None:
-            try:
-                serialized = Filter.serialize(filters)
-            except Exception as e:
-                raise TypeError(f"Invalid filters: {e}") from e
-            params["filters"] = json.dumps(serialized)
+    def _copy_response(self, data: Any) -> Any:
+        """Return a copy of a decoded response, so callers sharing a request cannot modify each other's results."""
+        return self._codec.loads(self._codec.encode(data))
 
-        if ids := params.pop("ids", None):
-            params["ids"] = ",".join(ids) if isinstance(ids, list) else ids
+    def _request(self, path: str, params: dict[str, Any]) -> Any:
+        """Send a GET request with prepared query parameters to the DataScribe API.
 
-        if providers := params.get("providers"):
-            params["providers"] = ",".join(providers) if isinstance(providers, list) else providers
+        If the API cannot be reached, or the circuit of the endpoint is open, and the cache is in offline mode, an
+        expired cached response is returned instead. Server errors and transport failures are reported to the
+        circuit breaker, if one is set.
 
-        if elements := params.get("elements"):
-            params["elements"] = ",".join(elements) if isinstance(elements, list) else elements
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            params (Dict[str, Any]): The prepared query parameters for the request.
+
+        Returns:
+            dict: The JSON response from the API.
 
+        Raises:
+            HTTPError: If the request fails with a status code indicating an error.
+        """
+        url = f"{self._base}{path}"
+        timeout = self._timeouts.get(path, DEFAULT_TIMEOUT)
         try:
-            resp = self._session.get(url=url, params=params, timeout=600)
+            resp = self._breaker_send(path, partial(self._hedged_send, path, url, params, timeout))
             resp.raise_for_status()
         except HTTPError as e:
-            error_json = e.response.json()
-            message = error_json.get("message") or error_json.get("data") or str(e)
-            raise HTTPError(f"HTTP Error {e.response.status_code} - {message}") from e
-        return resp.json()
+            raise http_error(e.response.status_code, e.response.json(), str(e)) from e
+        except (RequestsConnectionError, Timeout):
+            if self._cache is not None and self._cache.offline and (stale := self._cache.get_stale(path, params)) is not None:
+                return stale
+            raise
+        record_response(len(resp.content))
+        return self._codec.loads(resp.content)
+
+    def _breaker_send(self, path: str, send: Callable[[], Response]) -> Response:
+        """Send a request through the circuit breaker of its endpoint, if one is set.
+
+        Only transport failures and server errors, including server errors that exhausted the retries of the session,
+        count as failures of the endpoint. A request that runs out of the
+        caller's deadline, or fails for any other reason, leaves the circuit unchanged, so callers with short
+        deadlines cannot open it for everyone.
+
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            send (Callable[[], Response]): The function sending the request.
+
+        Returns:
+            Response: The response.
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint is open.
+        """
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return send()
+        breaker.check(path)
+        try:
+            resp = send()
+        except RequestException as e:
+            if is_deadline_expiry(e):
+                breaker.release(path)
+            else:
+                breaker.record(path, success=False)
+            raise
+        except BaseException:
+            breaker.release(path)
+            raise
+        breaker.record(path, success=resp.status_code < 500)
+        return resp
+
+    def _hedged_send(self, path: str, url: str, params: dict[str, Any], timeout: tuple[float, float]) -> Response:
+        """Send a GET request, sending a duplicate if the hedging policy finds it slow.
+
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            url (str): The URL of the request.
+            params (Dict[str, Any]): The prepared query parameters for the request.
+            timeout (tuple[float, float]): The connect and read timeouts of the endpoint.
+
+        Returns:
+            Response: The first successful response, or the last failure if both requests fail.
+        """
+        policy = self._hedge
+        if policy is None:
+            return self._send(url, params, timeout)
+
+        def attempt() -> Response:
+            start = time.monotonic()
+            resp = self._send(url, params, timeout)
+            policy.observe(path, time.monotonic() - start)
+            return resp
+
+        delay = policy.delay(path)
+        if delay is None:
+            return attempt()
+        # Requests run on the executor's threads, so they run in a copy of the caller's context to keep its deadline.
+        primary = self._hedge_executor.submit(contextvars.copy_context().run, attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        hedge = self._hedge_executor.submit(contextvars.copy_context().run, attempt)
+        policy.record_hedge()
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Both requests may complete together, so a success is looked for among all of them before a failure.
+            future = next((future for future in done if future.exception() is None), None)
+            if future is None:
+                if pending:
+                    continue
+                future = next(iter(done))
+            for other in {primary, hedge} - {future}:
+                other.add_done_callback(_close_response)
+            if future is hedge and future.exception() is None:
+                policy.record_win()
+            return future.result()
+
+    def _send(self, url: str, params: dict[str, Any], timeout: tuple[float, float], stream: bool = False) -> Response:
+        """Send a GET request, pacing it with the rate limiter if one is set.
+
+        With a rate limiter, responses with status 429 or 503 are reported to it and, if the retry policy retries
+        their status, retried once it admits the request again. These retries are made, counted against the retry
+        budget and reported like every other retry of the policy. The timeouts of every attempt are capped at the time left before the deadline, and waiting for the rate limiter, including a `Retry-After` pause, never outlasts it.
+
+        Args:
+            url (str): The URL of the request.
+            params (Dict[str, Any]): The prepared query parameters for the request.
+            timeout (tuple[float, float]): The connect and read timeouts of the endpoint.
+            stream (bool): Return once the headers of the response arrive, leaving its body to be read. The rate
+                limiter counts the request as finished at that point. Defaults to False.
+
+        Returns:
+            Response: The final response.
 
-    def search(self, endpoint: str, **kwargs: Any) -> Any:
+        Raises:
+            DeadlineExceeded: If the deadline passes before a response is received, or before the rate limiter admits
+                the request.
+        """
+        limiter = self._rate_limiter
+        if limiter is None:
+            return self._session_get(url, params, timeout, stream)
+        policy = self._retry_policy
+        attempt = 0
+        while True:
+            ticket = limiter.acquire(remaining_time())
+            attempt += 1
+            try:
+                resp = self._session_get(url, params, timeout, stream)
+            except BaseException:
+                limiter.release(ticket)
+                raise
+            if resp.status_code not in THROTTLE_STATUSES:
+                limiter.success(ticket)
+                return resp
+            pause = limiter.throttle(ticket, parse_retry_after(resp.headers.get("Retry-After")))
+            if resp.status_code not in policy.statuses:
+                return resp
+            if attempt > policy.total:
+                policy.report(url, attempt, "exhausted", resp.status_code)
+                return resp
+            if not policy.allow_retry():
+                policy.report(url, attempt, "budget", resp.status_code)
+                return resp
+            policy.report(url, attempt, "retry", resp.status_code, delay=pause)
+            resp.close()
+
+    def _session_get(self, url: str, params: dict[str, Any], timeout: tuple[float, float], stream: bool = False) -> Response:
+        """Send a single GET request through the retrying session, with its timeouts capped at the deadline."""
+        try:
+            return self._session.get(url=url, params=params, timeout=request_timeout(timeout), stream=stream)
+        except RequestsConnectionError as e:
+            # The retry backoff runs inside urllib3, so requests wraps a DeadlineExceeded raised there.
+            if e.args and isinstance(e.args[0], DeadlineExceeded):
+                raise e.args[0] from None
+            raise
+
+    def _stream(self, path: str, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Make a GET request to the DataScribe API and decode the `data` array of the response as it arrives.
+
+        Streamed responses bypass the cache and are not hedged, but the request goes through the circuit breaker and
+        the rate limiter, with the timeouts of the endpoint, like any other.
+
+        Args:
+            path (str): The API endpoint path to which the request is made.
+            params (Dict[str, Any]): The query parameters for the request.
+
+        Yields:
+            dict: The elements of the response's `data` array.
+
+        Raises:
+            HTTPError: If the request fails with a status code indicating an error.
+            ValueError: If the API reports that the request failed.
+        """
+        url = f"{self._base}{path}"
+        params = prepare_params(params, self._codec)
+        timeout = self._timeouts.get(path, DEFAULT_TIMEOUT)
+        resp = self._breaker_send(path, partial(self._send, url, params, timeout, stream=True))
+        try:
+            try:
+                resp.raise_for_status()
+            except HTTPError as e:
+                raise http_error(e.response.status_code, e.response.json(), str(e)) from e
+            fields: dict[str, Any] = {}
+            yield from iter_json_array(resp.iter_content(chunk_size=STREAM_CHUNK_SIZE), "data", fields)
+            if fields.get("success") is False:
+                raise ValueError(f"API request failed: {fields.get('message', 'Unknown error')}")
+        finally:
+            resp.close()
+
+    def revalidate_tables(self) -> list[str]:
+        """Refresh the table versions used by the cache with a single `get_data_tables_for_user` request.
+
+        Cached rows, columns, row counts and metadata of a table are stamped with its `last_updated` version and
+        stay valid until that version changes. This is done automatically every `revalidate_after` seconds.
+
+        Returns:
+            list[str]: The names of the tables whose version changed. Their cached responses are no longer served.
+        """
+        if self._cache is None:
+            return []
+        path = ROUTES["get_data_tables_for_user"][0]
+        return self._observe_versions(path, self._request(path, {}))
+
+    def _observe_versions(self, path: str, resp: Any) -> list[str]:
+        """Record the table versions carried by a response in the cache, forgetting the dtypes of changed tables."""
+        changed = self._cache.observe_versions(path, resp)
+        for table_name in changed:
+            self._table_dtypes.pop(table_name, None)
+        return changed
+
+    def search(self, endpoint: str, deadline: float | None = None, as_: str | None = None, **kwargs: Any) -> Any:
         """Search for data tables or metadata in the DataScribe API.
 
         Args:
             endpoint (str): The endpoint to search, e.g., "get_data_tables", "get_data_table", etc.
+            deadline (float | None): The maximum number of seconds the call may take, including retries and backoff.
+            as_ (str | None): Return the rows of a row endpoint as "records" (plain dicts), a "compact" CompactRows table, a "pandas" DataFrame, a "typed" pandas DataFrame whose dtypes follow the column types of the table, an "arrow" Table or a "polars" DataFrame, built column by column without a model per row. Defaults to None (models).
             **kwargs: Additional parameters to pass to the API. For endpoints supporting filtering, pass 'filters' as a dict, Filter, or list of Filters.
 
         Example:
@@ -112,21 +491,385 @@ class DataScribeClient:
             Any: A list of data models corresponding to the search results.
 
         Raises:
-            ValueError: If required parameters are missing.
+            ValueError: If required parameters are missing, or `as_` is unsupported or given for an endpoint that does not return rows.
+            DeadlineExceeded: If the call does not complete within `deadline`.
         """
         path, model, required_params = ROUTES[endpoint]
         missing = [p for p in required_params if p not in kwargs]
         if missing:
             raise ValueError(f"Missing required parameters for '{endpoint}': {', '.join(missing)}")
-        resp = self._get(path, {**kwargs})
-        if resp.get("success") is False:
-            raise ValueError(f"API request failed: {resp.get('message', 'Unknown error')}")
-        resp = resp.get("data", resp)
-        docs = model(resp) if isinstance(resp, list) else model(**resp)
-        return docs
+        if as_ is not None:
+            check_format(as_)
+            if model is not DataTableRows:
+                raise ValueError(f"'{endpoint}' does not return table rows, so `as_` is not supported.")
+        with deadline_scope(deadline):
+            dtypes = self.table_dtypes(kwargs["tableName"]) if as_ == "typed" else None
+            resp = self._get(path, {**kwargs})
+        if as_ is not None:
+            return build_frame(response_data(resp), as_, dtypes)
+        return build_model(model, resp, self._lazy_validation)
+
+    def iter_table_rows(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        page_size: int | str | PageSizeTuner = 100,
+        prefetch: int = 2,
+        pages: bool = False,
+        startingRow: int = 0,
+    ) -> Iterator[Any]:
+        """Iterate over the rows of a data table, fetching the following pages in the background.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" to adapt it to the response times of the API. Defaults to 100.
+            prefetch (int): The number of pages fetched ahead of the one being consumed. Defaults to 2.
+            pages (bool): Yield whole `DataTableRows` pages instead of individual rows. Defaults to False.
+            startingRow (int): The index of the first row to retrieve. Defaults to 0.
+
+        Example:
+                    for row in client.iter_table_rows(tableName="users", columns=["id", "name"], page_size=500):
+                        print(row.name)
+
+        Returns:
+            Iterator[Any]: A generator yielding `DataTableRow` objects, or `DataTableRows` pages if `pages` is True.
+        """
+        return pagination.iter_table_rows(self, tableName, columns, filters, page_size, prefetch, pages, startingRow)
+
+    def iter_keyset(
+        self,
+        tableName: str,
+        columns: list[str],
+        key: str,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        page_size: int | str | PageSizeTuner = 1000,
+        after: Any = None,
+        pages: bool = False,
+        as_: str | None = None,
+    ) -> Iterator[Any]:
+        """Iterate over the rows of a data table by seeking past the last key seen, so deep pages cost as much as the first.
+
+        Each page is requested with `Filter(key) > last_key` added to `filters`, instead of an ever larger `startingRow`. `key` must be unique and must be the order the table returns its rows in, such as an indexed id.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str]): The columns to retrieve, including `key`.
+            key (str): The column the rows are ordered by.
+            filters (dict | Filter | list[Filter] | None): The filters to apply in addition to the key filter.
+            page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" to adapt it to the response times of the API. Defaults to 1000.
+            after (Any): Only retrieve the rows whose key is greater than this value, e.g. to resume a scan. Defaults to None (from the first row).
+            pages (bool): Yield whole pages instead of individual rows. Defaults to False.
+            as_ (str | None): The format of the pages, as accepted by `search`. Requires `pages`. Defaults to None (models).
+
+        Example:
+                    for row in client.iter_keyset(tableName="events", columns=["id", "kind"], key="id", page_size=5000):
+                        print(row.kind)
+
+        Returns:
+            Iterator[Any]: A generator yielding `DataTableRow` objects, or pages if `pages` is True.
+
+        Raises:
+            ValueError: If `columns` does not include `key`, or the rows are not returned in ascending order of `key`.
+        """
+        return pagination.iter_keyset(self, tableName, columns, key, filters, page_size, after, pages, as_)
+
+    def iter_dataframes(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        chunk_rows: int = 100_000,
+        page_size: int | str | PageSizeTuner = 1000,
+        prefetch: int = 2,
+        typed: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over a data table as pandas DataFrames of about `chunk_rows` rows, holding one chunk in memory at a time.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            chunk_rows (int): The minimum number of rows per DataFrame, rounded up to whole pages. Defaults to 100000.
+            page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" to adapt it to the response times of the API. Defaults to 1000.
+            prefetch (int): The number of pages fetched ahead of the one being consumed. Defaults to 2.
+            typed (bool): Build the DataFrames with the dtypes of the table's columns, as with `as_="typed"`. Defaults to False.
+
+        Example:
+                    for df in client.iter_dataframes(tableName="users", columns=["id", "age"], chunk_rows=50_000):
+                        total += df["age"].sum()
+
+        Returns:
+            Iterator[pd.DataFrame]: A generator yielding the chunks of the table in row order.
+        """
+        return pagination.iter_dataframes(self, tableName, columns, filters, chunk_rows, page_size, prefetch, typed)
+
+    def to_dataframe(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        max_memory: int | None = None,
+        chunk_rows: int = 100_000,
+        page_size: int | str | PageSizeTuner = 1000,
+        typed: bool = False,
+        spill_dir: str | os.PathLike | None = None,
+        spill_format: str = "parquet",
+    ) -> pd.DataFrame | spill.ChunkedFrame:
+        """Download a data table as a pandas DataFrame, optionally spilling it to disk beyond a memory limit.
+
+        The table is read with `iter_dataframes`. Without `max_memory` the chunks are concatenated into one DataFrame. With `max_memory`, chunks are kept in memory until their total size would exceed it, and the remaining chunks are written to Parquet or Feather files. A ChunkedFrame is returned in that case, which iterates over the chunks, reading the spilled ones back one at a time.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            max_memory (int | None): The maximum number of bytes of DataFrame chunks kept in memory. Defaults to None (no limit).
+            chunk_rows (int): The minimum number of rows per chunk, rounded up to whole pages. Defaults to 100000.
+            page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" to adapt it to the response times of the API. Defaults to 1000.
+            typed (bool): Build the DataFrames with the dtypes of the table's columns, as with `as_="typed"`. Defaults to False.
+            spill_dir (str | os.PathLike | None): The directory spilled chunks are written to. Defaults to None (a temporary directory deleted when the ChunkedFrame is closed).
+            spill_format (str): The format of the spilled chunks, "parquet" or "feather". Requires pyarrow. Defaults to "parquet".
+
+        Example:
+                    with client.to_dataframe(tableName="events", max_memory=2 * 1024**3) as frame:
+                        for df in frame:
+                            process(df)
+
+        Returns:
+            pd.DataFrame | ChunkedFrame: The whole table, or its chunks if `max_memory` is given.
+
+        Raises:
+            ValueError: If `max_memory` is negative or `spill_format` is unsupported.
+            ImportError: If chunks have to be spilled and pyarrow is not installed.
+        """
+        chunks = pagination.iter_dataframes(self, tableName, columns, filters, chunk_rows, page_size, typed=typed)
+        if max_memory is not None:
+            return spill.collect_chunks(chunks, max_memory, spill_dir, spill_format)
+        frames = list(chunks)
+        return concat_frames(frames) if frames else pd.DataFrame(columns=columns)
+
+    def fetch_table(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        workers: int = 4,
+        page_size: int = 1000,
+        dataframe: bool = False,
+        as_: str | None = None,
+        shard_on: str | None = None,
+        shards: int | None = None,
+        key: str | None = None,
+    ) -> DataTableRows | pd.DataFrame | Any:
+        """Download a whole data table by fetching row-range shards concurrently.
+
+        With `shard_on`, the table is split by the values of a numeric or timestamp column instead of by row offset. Its range is estimated from the first and last rows and split into `shards` sub-ranges, each scanned with `Filter(shard_on) >= start` and `Filter(shard_on) < end`, so no shard skips over the rows of the others. The rows are then returned in ascending order of the shards, followed by the rows where the column is NULL. Within a shard, pages are read by row offset, unless `key` names a unique column the table returns its rows in order of, in which case each shard is read by seeking past the last key like `iter_keyset`.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            workers (int): The maximum number of concurrent requests. Defaults to 4.
+            page_size (int): The number of rows requested per shard. Defaults to 1000.
+            dataframe (bool): Return a pandas DataFrame instead of `DataTableRows`. Defaults to False.
+            as_ (str | None): Return the rows as "records", a "compact" CompactRows table, a "pandas" DataFrame, a "typed" pandas DataFrame, an "arrow" Table or a "polars" DataFrame, built without a model per row. Defaults to None.
+            shard_on (str | None): A numeric or timestamp column to split the table on by value. Requires columns. Defaults to None (row-range shards).
+            shards (int | None): The number of value sub-ranges with `shard_on`. Defaults to `workers`.
+            key (str | None): A unique column, included in `columns`, that the table returns its rows in order of, used to page within each value shard by seeking. Requires `shard_on`. Defaults to None (row offsets).
+
+        Example:
+                    df = client.fetch_table(tableName="users", columns=["id", "name"], workers=8, dataframe=True)
+                    table = client.fetch_table(tableName="users", columns=["id", "name"], workers=8, as_="arrow")
+                    events = client.fetch_table(tableName="events", columns=["id", "at"], shard_on="at", shards=16, workers=8, key="id")
+
+        Returns:
+            DataTableRows | pd.DataFrame | Any: All rows of the table in order.
+        """
+        return pagination.fetch_table(
+            self, tableName, columns, filters, workers, page_size, dataframe, as_, shard_on, shards, key
+        )
+
+    def table_dtypes(self, tableName: str, refresh: bool = False) -> dict[str, str]:
+        """Return the pandas dtypes of the columns of a data table, as used by `as_="typed"`.
+
+        The columns are fetched with `get_data_table_columns` once per table and the dtypes are kept on the client,
+        until the cache sees the version of the table change.
+
+        Args:
+            tableName (str): The name of the data table.
+            refresh (bool): Fetch the columns again, e.g. after the table was altered. Defaults to False.
+
+        Returns:
+            dict[str, str]: The dtype of each column whose type has one, keyed by column name.
+        """
+        dtypes = None if refresh else self._table_dtypes.get(tableName)
+        if dtypes is None:
+            dtypes = schema_dtypes(self.get_data_table_columns(tableName=tableName))
+            self._table_dtypes[tableName] = dtypes
+        return dtypes
+
+    def export_table(
+        self,
+        tableName: str,
+        path: str | os.PathLike,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        format: str = "jsonl",  # noqa: A002 - mirrors the `format` option of the CLI
+        workers: int = 4,
+        page_size: int = 1000,
+    ) -> dict[str, Any]:
+        """Download a data table into a directory of part files, resuming an interrupted export of the same table.
+
+        Each page is written to its own part file as soon as it arrives, and the row ranges already written are recorded in a `progress.jsonl` journal that is folded into `manifest.json` when the export ends. Running the same export again only fetches the missing pages.
+
+        Args:
+            tableName (str): The name of the data table.
+            path (str | os.PathLike): The directory the part files and the manifest are written to.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            format (str): The format of the part files, "jsonl" or "csv". Defaults to "jsonl".
+            workers (int): The maximum number of concurrent requests. Defaults to 4.
+            page_size (int): The number of rows requested per page of a new export. Defaults to 1000.
+
+        Example:
+                    manifest = client.export_table(tableName="users", path="exports/users", columns=["id", "name"], format="csv")
+
+        Returns:
+            dict[str, Any]: The manifest of the completed export, including the `rows` written and the `parts` in row order.
+        """
+        return export.export_table(self, tableName, path, columns, filters, format, workers, page_size)
+
+    def fetch_materials(
+        self,
+        ids: list[str] | str,
+        providers: list[str] | str | None = None,
+        workers: int = 4,
+        max_ids_length: int = MAX_IDS_LENGTH,
+    ) -> MaterialByIdResults:
+        """Look up many material ids with concurrent requests that each fit in a URL.
+
+        Args:
+            ids (list[str] | str): The material ids, as a list or a comma-separated string.
+            providers (list[str] | str | None): The providers to query, or None for the API's default.
+            workers (int): The maximum number of concurrent requests. Defaults to 4.
+            max_ids_length (int): The maximum length of the encoded `ids` parameter of a request. Defaults to 2000.
+
+        Example:
+                    results = client.fetch_materials(ids=material_ids, providers=["MP", "AFLOW"], workers=8)
+
+        Returns:
+            MaterialByIdResults: The results for all ids, without duplicates. Ids already resolved through the client's cache are not requested again.
+        """
+        return materials.fetch_materials(self, ids, providers, workers, max_ids_length)
+
+    def iter_search_materials(
+        self, page: int = 1, size: int | str | PageSizeTuner = 50, workers: int = 4, **kwargs: Any
+    ) -> Iterator[MaterialSummary]:
+        """Iterate over every result of a material search, fetching the pages concurrently.
+
+        The `total` of the first page determines the remaining pages, of which up to `workers` are fetched at a time.
+
+        Args:
+            page (int): The first page to fetch. Defaults to 1.
+            size (int | str | PageSizeTuner): The number of results per page, or "auto" to adapt it to the response times of the API. Defaults to 50.
+            workers (int): The maximum number of concurrent requests. Defaults to 4.
+            **kwargs: The search parameters of `search_materials`, e.g. `formula`, `elements` or `providers`.
+
+        Example:
+                    for summary in client.iter_search_materials(elements=["Si", "O"], providers="MP", size=200, workers=8):
+                        print(summary.formula)
+
+        Returns:
+            Iterator[MaterialSummary]: A generator yielding the results in page order.
+        """
+        return materials.iter_search_materials(self, kwargs, page, size, workers)
+
+    def search_materials_all(
+        self, page: int = 1, size: int | str | PageSizeTuner = 50, workers: int = 4, **kwargs: Any
+    ) -> MaterialSearchResults:
+        """Collect every result of a material search, fetching the pages concurrently.
+
+        Args:
+            page (int): The first page to fetch. Defaults to 1.
+            size (int | str | PageSizeTuner): The number of results per page, or "auto" to adapt it to the response times of the API. Defaults to 50.
+            workers (int): The maximum number of concurrent requests. Defaults to 4.
+            **kwargs: The search parameters of `search_materials`, e.g. `formula`, `elements` or `providers`.
+
+        Returns:
+            MaterialSearchResults: The results of all pages, with the `total` reported by the API.
+        """
+        return materials.search_materials_all(self, kwargs, page, size, workers)
+
+    def stream_table_rows(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        startingRow: int = 0,
+        numRows: int = 100,
+        raw: bool = False,
+    ) -> Iterator[Any]:
+        """Stream the rows of one page of a data table, decoding them as the response arrives.
+
+        Only one row is decoded at a time, so peak memory stays close to the size of the rows kept by the
+        caller, which allows much larger `numRows` than `get_data_table_rows`.
+
+        Args:
+            tableName (str): The name of the data table.
+            columns (list[str] | None): The columns to retrieve, or None for all columns.
+            filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+            startingRow (int): The index of the first row to retrieve. Defaults to 0.
+            numRows (int): The number of rows to retrieve. Defaults to 100.
+            raw (bool): Yield plain dicts instead of `DataTableRow` objects. Defaults to False.
+
+        Example:
+                    from datascribe_api.streaming import records_to_dataframe
+
+                    df = records_to_dataframe(client.stream_table_rows(tableName="users", columns=["id"], numRows=10**6, raw=True))
+
+        Returns:
+            Iterator[Any]: A generator yielding `DataTableRow` objects, or dicts if `raw` is True.
+
+        Raises:
+            ValueError: If filters are given without columns.
+        """
+        if columns is None:
+            if filters is not None:
+                raise ValueError("Filtering rows requires the columns to be specified.")
+            path = ROUTES["get_data_table"][0]
+            params = {"tableName": tableName, "startingRow": startingRow, "numRows": numRows}
+        else:
+            path = ROUTES["get_data_table_rows"][0]
+            params = {
+                "tableName": tableName,
+                "columns": columns,
+                "startingRow": startingRow,
+                "numRows": numRows,
+                "filters": filters,
+            }
+        records = self._stream(path, params)
+        return records if raw else (DataTableRow(**record) for record in records)
+
+    def pool_stats(self) -> list[dict[str, Any]]:
+        """Report the utilization of the client's connection pools.
+
+        Example:
+                    client.fetch_table(tableName="users", workers=8)
+                    client.pool_stats()  # [{"host": "https://datascribe.cloud:443", "maxsize": 32, "in_use": 0, "idle": 8, ...}]
+
+        Returns:
+            list[dict[str, Any]]: One entry per host pool with its `host`, `maxsize`, the number of connections
+            `in_use` and `idle`, and the total `connections` opened and `requests` sent through it.
+        """
+        return pool_stats(self._session)
 
     def close(self) -> None:
         """Close the session used by the DataScribeClient."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         self._session.close()
 
     def __getattr__(self, name: str) -> Any:
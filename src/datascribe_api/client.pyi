@@ -1,5 +1,13 @@
+import os
+from collections.abc import Callable, Iterator
 from typing import Any
 
+import pandas as pd
+from requests import Response
+
+from datascribe_api.autotune import PageSizeTuner
+from datascribe_api.cache import BaseCache
+from datascribe_api.codec import JSONCodec
 from datascribe_api.filter import Filter
 from datascribe_api.models import (
     DataTableColumns,
@@ -9,22 +17,194 @@ from datascribe_api.models import (
     DataTables,
     MaterialByIdResults,
     MaterialSearchResults,
+    MaterialSummary,
 )
+from datascribe_api.ratelimit import RateLimiter
+from datascribe_api.resilience import CircuitBreaker, HedgePolicy
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.spill import ChunkedFrame
 
 class DataScribeClient:
-    def __init__(self, api_key: str | None = None, base: str = "https://datascribe.cloud/") -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base: str = "https://datascribe.cloud/",
+        cache: BaseCache | bool | None = None,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        keepalive: bool = True,
+        codec: JSONCodec | str | None = None,
+        coalesce: bool = True,
+        rate_limiter: RateLimiter | bool | None = None,
+        hedge: HedgePolicy | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        timeouts: dict[str, float | tuple[float, float]] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        lazy_validation: bool = False,
+    ) -> None:
         self._base = None
         self._session = None
         self._api_key = None
+        self._cache = None
+        self._codec = None
+        self._flight = None
+        self._rate_limiter = None
+        self._hedge = None
+        self._circuit_breaker = None
+        self._hedge_executor = None
+        self._timeouts = None
+        self._retry_policy = None
+        self._lazy_validation = None
+        self._table_dtypes = None
         ...
+    @property
+    def cache(self) -> BaseCache | None: ...
+    @property
+    def codec(self) -> JSONCodec: ...
+    @property
+    def rate_limiter(self) -> RateLimiter | None: ...
+    @property
+    def hedge(self) -> HedgePolicy | None: ...
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None: ...
+    @property
+    def retry_policy(self) -> RetryPolicy: ...
+    @property
+    def lazy_validation(self) -> bool: ...
     def __enter__(self) -> DataScribeClient: ...
     def __exit__(self, *args: Any) -> None: ...
     def close(self) -> None: ...
+    def pool_stats(self) -> list[dict[str, Any]]: ...
+    def table_dtypes(self, tableName: str, refresh: bool = False) -> dict[str, str]: ...
+    def fetch_materials(
+        self,
+        ids: list[str] | str,
+        providers: list[str] | str | None = None,
+        workers: int = 4,
+        max_ids_length: int = 2000,
+    ) -> MaterialByIdResults: ...
+    def iter_search_materials(
+        self,
+        formula: str | None = None,
+        elements: list[str] | str | None = None,
+        exclude_elements: list[str] | str | None = None,
+        spacegroup: str | None = None,
+        props: list[str] | str | None = None,
+        temperature: float | str | None = None,
+        providers: list[str] | str | None = None,
+        page: int = 1,
+        size: int | str | PageSizeTuner = 50,
+        workers: int = 4,
+    ) -> Iterator[MaterialSummary]: ...
+    def search_materials_all(
+        self,
+        formula: str | None = None,
+        elements: list[str] | str | None = None,
+        exclude_elements: list[str] | str | None = None,
+        spacegroup: str | None = None,
+        props: list[str] | str | None = None,
+        temperature: float | str | None = None,
+        providers: list[str] | str | None = None,
+        page: int = 1,
+        size: int | str | PageSizeTuner = 50,
+        workers: int = 4,
+    ) -> MaterialSearchResults: ...
+    def stream_table_rows(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        startingRow: int = 0,
+        numRows: int = 100,
+        raw: bool = False,
+    ) -> Iterator[Any]: ...
     def _get(self, path: str, params: dict[str, Any]): ...
-    def search(self, endpoint: str, **kwargs: Any) -> Any: ...
-    def get_data_tables(self) -> DataTables: ...
-    def get_data_table(self, tableName: str, startingRow: int = 0, numRows: int = 100) -> DataTableRows: ...
-    def get_data_tables_for_user(self) -> DataTables: ...
+    def _copy_response(self, data: Any) -> Any: ...
+    def _request(self, path: str, params: dict[str, Any]): ...
+    def _breaker_send(self, path: str, send: Callable[[], Response]) -> Response: ...
+    def _hedged_send(self, path: str, url: str, params: dict[str, Any], timeout: tuple[float, float]) -> Response: ...
+    def _send(self, url: str, params: dict[str, Any], timeout: tuple[float, float], stream: bool = False) -> Response: ...
+    def _session_get(self, url: str, params: dict[str, Any], timeout: tuple[float, float], stream: bool = False) -> Response: ...
+    def _stream(self, path: str, params: dict[str, Any]) -> Iterator[dict[str, Any]]: ...
+    def revalidate_tables(self) -> list[str]: ...
+    def _observe_versions(self, path: str, resp: Any) -> list[str]: ...
+    def search(self, endpoint: str, deadline: float | None = None, as_: str | None = None, **kwargs: Any) -> Any: ...
+    def iter_table_rows(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        page_size: int | str | PageSizeTuner = 100,
+        prefetch: int = 2,
+        pages: bool = False,
+        startingRow: int = 0,
+    ) -> Iterator[Any]: ...
+    def iter_keyset(
+        self,
+        tableName: str,
+        columns: list[str],
+        key: str,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        page_size: int | str | PageSizeTuner = 1000,
+        after: Any = None,
+        pages: bool = False,
+        as_: str | None = None,
+    ) -> Iterator[Any]: ...
+    def iter_dataframes(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        chunk_rows: int = 100_000,
+        page_size: int | str | PageSizeTuner = 1000,
+        prefetch: int = 2,
+        typed: bool = False,
+    ) -> Iterator[pd.DataFrame]: ...
+    def to_dataframe(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        max_memory: int | None = None,
+        chunk_rows: int = 100_000,
+        page_size: int | str | PageSizeTuner = 1000,
+        typed: bool = False,
+        spill_dir: str | os.PathLike | None = None,
+        spill_format: str = "parquet",
+    ) -> pd.DataFrame | ChunkedFrame: ...
+    def fetch_table(
+        self,
+        tableName: str,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        workers: int = 4,
+        page_size: int = 1000,
+        dataframe: bool = False,
+        as_: str | None = None,
+        shard_on: str | None = None,
+        shards: int | None = None,
+        key: str | None = None,
+    ) -> DataTableRows | pd.DataFrame | Any: ...
+    def export_table(
+        self,
+        tableName: str,
+        path: str | os.PathLike,
+        columns: list[str] | None = None,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        format: str = "jsonl",  # noqa: A002
+        workers: int = 4,
+        page_size: int = 1000,
+    ) -> dict[str, Any]: ...
+    def get_data_tables(self, deadline: float | None = None) -> DataTables: ...
+    def get_data_table(
+        self,
+        tableName: str,
+        startingRow: int = 0,
+        numRows: int = 100,
+        deadline: float | None = None,
+        as_: str | None = None,
+    ) -> DataTableRows | Any: ...
+    def get_data_tables_for_user(self, deadline: float | None = None) -> DataTables: ...
     def get_data_table_rows(
         self,
         tableName: str,
@@ -32,13 +212,18 @@ class DataScribeClient:
         startingRow: int = 0,
         numRows: int = 100,
         filters: dict[str, Any] | Filter | list[Filter] | None = None,
-    ) -> DataTableRows: ...
-    def get_data_table_columns(self, tableName: str) -> DataTableColumns: ...
-    def get_data_table_metadata(self, tableName: str) -> DataTableMetadata: ...
+        deadline: float | None = None,
+        as_: str | None = None,
+    ) -> DataTableRows | Any: ...
+    def get_data_table_columns(self, tableName: str, deadline: float | None = None) -> DataTableColumns: ...
+    def get_data_table_metadata(self, tableName: str, deadline: float | None = None) -> DataTableMetadata: ...
     def get_data_table_rows_count(
-        self, tableName: str, filters: dict[str, Any] | Filter | list[Filter] | None = None
+        self,
+        tableName: str,
+        filters: dict[str, Any] | Filter | list[Filter] | None = None,
+        deadline: float | None = None,
     ) -> DataTableRowsCount: ...
-    def get_material_by_id(self, ids: str, providers: list[str] | str) -> MaterialByIdResults: ...
+    def get_material_by_id(self, ids: str, providers: list[str] | str, deadline: float | None = None) -> MaterialByIdResults: ...
     def search_materials(
         self,
         formula: str | None = None,
@@ -50,4 +235,5 @@ class DataScribeClient:
         providers: list[str] | str | None = None,
         page: int = 1,
         size: int = 50,
+        deadline: float | None = None,
     ) -> MaterialSearchResults: ...
@@ -0,0 +1,145 @@
+"""JSON codecs for the DataScribe API.
+
+This module provides the JSON encoders and decoders used for query filters, API responses and cached entries.
+A faster backend (orjson or msgspec) is used when one is installed, falling back to the standard library.
+"""
+
+import json
+import os
+from typing import Any
+
+CODEC_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """A JSON codec backed by the standard library.
+
+    Attributes:
+        name (str): The name of the backend.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Encode an object as a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return self.dumps(obj).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+class OrjsonCodec(JSONCodec):
+    """A JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson  # noqa: PLC0415 - optional dependency
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> str:
+        """Encode an object as a compact JSON string."""
+        return self._orjson.dumps(obj).decode()
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """A JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If msgspec is not installed.
+        """
+        import msgspec  # noqa: PLC0415 - optional dependency
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> str:
+        """Encode an object as a compact JSON string."""
+        return self._encoder.encode(obj).decode()
+
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return self._decoder.decode(data)
+
+
+CODECS: dict[str, type[JSONCodec]] = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": JSONCodec}
+
+
+def available_codecs() -> list[str]:
+    """Return the names of the codecs whose backend is installed, fastest first."""
+    names = []
+    for name in CODEC_PREFERENCE:
+        try:
+            CODECS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(codec: JSONCodec | str | None = None) -> JSONCodec:
+    """Resolve a JSON codec.
+
+    Args:
+        codec (JSONCodec | str | None): A codec, the name of a backend ("orjson", "msgspec" or "json"), or None to
+            use the `DATASCRIBE_JSON_CODEC` environment variable or else the fastest installed backend.
+
+    Returns:
+        JSONCodec: The codec.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = codec or os.getenv("DATASCRIBE_JSON_CODEC")
+    if not name:
+        return DEFAULT_CODEC
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of {', '.join(CODECS)}.")
+    return CODECS[name]()
+
+
+def _fastest_codec() -> JSONCodec:
+    """Instantiate the fastest installed codec."""
+    for name in CODEC_PREFERENCE:
+        try:
+            return CODECS[name]()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+DEFAULT_CODEC = _fastest_codec()
@@ -0,0 +1,406 @@
+"""Columnar results for the DataScribe API.
+
+This module builds tables straight from the decoded rows of an API response, column by column, without
+creating a pydantic model per row. It backs the `as_` option of the row endpoints, which returns the rows as
+plain records, a compact in-memory table, a pandas DataFrame, a pyarrow Table or a polars DataFrame. Typed
+DataFrames take the dtype of each column from the column types of the table.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from datascribe_api.models import DataTableColumn, DataTableColumns
+
+FRAME_FORMATS = ("records", "compact", "pandas", "typed", "arrow", "polars")
+
+INT64_MIN = -(2**63)
+
+INT64_MAX = 2**63 - 1
+
+# Text columns of typed DataFrames are categorical when at most this share of their values is distinct.
+CATEGORY_MAX_RATIO = 0.5
+
+INTEGER_DTYPES = {"smallint": "int16", "integer": "int32", "bigint": "int64"}
+
+FLOAT_DTYPES = {"real": "float32", "double precision": "float64"}
+
+TEXT_TYPES = ("text", "character varying", "character", "varchar", "char", "citext")
+
+
+def check_format(as_: str) -> None:
+    """Check that a result format is supported.
+
+    Args:
+        as_ (str): The result format.
+
+    Raises:
+        ValueError: If the format is not one of "records", "compact", "pandas", "typed", "arrow" or "polars".
+    """
+    if as_ not in FRAME_FORMATS:
+        raise ValueError(f"Unsupported result format: {as_}. Use one of: {', '.join(FRAME_FORMATS)}")
+
+
+def records_to_columns(records: Iterable[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Transpose records into columns as they arrive.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The records, e.g. the decoded rows of a response.
+
+    Returns:
+        dict[str, list[Any]]: The values of each column, in order of first appearance, with None where a record
+        lacks the column.
+    """
+    columns: dict[str, list[Any]] = {}
+    for count, record in enumerate(records, start=1):
+        for name, value in record.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * (count - 1)
+            column.append(value)
+        for column in columns.values():
+            if len(column) < count:
+                column.append(None)
+    return columns
+
+
+def pack_column(values: list[Any]) -> Sequence[Any]:
+    """Store the values of a column compactly.
+
+    Args:
+        values (list[Any]): The values of the column.
+
+    Returns:
+        Sequence[Any]: An `array` of 64-bit integers or floats if every value is an int within the int64 range
+        or every value is a float, and the list itself otherwise.
+    """
+    if values and all(type(value) is int for value in values):
+        if min(values) >= INT64_MIN and max(values) <= INT64_MAX:
+            return array("q", values)
+    elif values and all(type(value) is float for value in values):
+        return array("d", values)
+    return values
+
+
+class RowView:
+    """A read-only view of one row of a CompactRows table.
+
+    Values are read as attributes, like the extras of a `DataTableRow`, or by column name.
+    """
+
+    __slots__ = ("_position", "_rows")
+
+    def __init__(self, rows: CompactRows, position: int) -> None:
+        """Initialize the view.
+
+        Args:
+            rows (CompactRows): The table holding the row.
+            position (int): The position of the row in the table.
+        """
+        self._rows = rows
+        self._position = position
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the value of a column of the row."""
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"Row has no column {name!r}") from None
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the value of a column of the row."""
+        return self._rows.column(name)[self._position]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the values of the row with another row view or a dict."""
+        if isinstance(other, RowView):
+            other = other.model_dump()
+        return self.model_dump() == other if isinstance(other, dict) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return the representation of the row."""
+        values = ", ".join(f"{name}={value!r}" for name, value in self.model_dump().items())
+        return f"RowView({values})"
+
+    def keys(self) -> list[str]:
+        """Return the column names of the row."""
+        return self._rows.columns
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the row as a dict, like `DataTableRow.model_dump`."""
+        position = self._position
+        return {name: column[position] for name, column in self._rows.column_items()}
+
+
+class CompactRows:
+    """The rows of a data table stored as one array per column, with views of single rows built on demand.
+
+    It holds no object per row, so a large result set takes a fraction of the memory of `DataTableRows`, whose
+    interface it shares: `len`, iteration and indexing yield RowView objects, and `to_list` and `to_dataframe`
+    convert the whole table. Integer and float columns are stored in typed arrays. A row lacking a column
+    reads None for it.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: dict[str, Sequence[Any]]) -> None:
+        """Initialize the table.
+
+        Args:
+            columns (dict[str, Sequence[Any]]): The values of each column, all of the same length.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+        self._columns = {
+            name: values if isinstance(values, array) else pack_column(list(values)) for name, values in columns.items()
+        }
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> CompactRows:
+        """Build a table from records.
+
+        Args:
+            records (Iterable[dict[str, Any]]): The records, e.g. the decoded rows of a response.
+
+        Returns:
+            CompactRows: The table.
+        """
+        return cls({name: pack_column(values) for name, values in records_to_columns(records).items()})
+
+    @property
+    def columns(self) -> list[str]:
+        """The column names, in order."""
+        return list(self._columns)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Return the values of a column.
+
+        Raises:
+            KeyError: If the table has no such column.
+        """
+        return self._columns[name]
+
+    def column_items(self) -> Iterator[tuple[str, Sequence[Any]]]:
+        """Iterate over the column names and their values."""
+        return iter(self._columns.items())
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __iter__(self) -> Iterator[RowView]:
+        """Iterate over views of the rows."""
+        return (RowView(self, position) for position in range(self._length))
+
+    def __getitem__(self, item: int | slice) -> RowView | CompactRows:
+        """Return a view of the row at an index, or a table of the rows of a slice."""
+        if isinstance(item, slice):
+            return CompactRows({name: values[item] for name, values in self._columns.items()})
+        position = range(self._length)[item]
+        return RowView(self, position)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return rows as a pandas DataFrame."""
+        return pd.DataFrame(dict(self._columns), index=range(self._length))
+
+    def to_list(self) -> list[Any]:
+        """Return rows as a list of dicts."""
+        names = list(self._columns)
+        return [dict(zip(names, values, strict=True)) for values in zip(*self._columns.values(), strict=True)]
+
+
+def column_dtype(column: DataTableColumn) -> str | None:
+    """Map the type of a table column to a compact pandas dtype.
+
+    Integers take the narrowest dtype of their declared width, and a nullable extension dtype when the column is
+    nullable. Exact numerics without a scale are mapped to integers, and other numerics to float32 up to 6 digits
+    of precision and to float64 beyond. Booleans are nullable, timestamps and dates are parsed, and text columns
+    are marked "category", which is only applied to columns with few distinct values.
+
+    Args:
+        column (DataTableColumn): The column, as returned by `get_data_table_columns`.
+
+    Returns:
+        str | None: The name of the dtype, or None to leave the dtype to pandas.
+    """
+    data_type = column.data_type.lower()
+    precision = column.numeric_precision
+    if data_type in ("numeric", "decimal"):
+        if precision is None:
+            return "float64"
+        if column.numeric_scale:
+            return "float32" if precision <= 6 else "float64"  # noqa: PLR2004 - digits exact in a float32
+        data_type = "smallint" if precision <= 4 else "integer" if precision <= 9 else "bigint"  # noqa: PLR2004
+        if precision > 18:  # noqa: PLR2004 - digits exact in an int64
+            return None
+    if data_type in INTEGER_DTYPES:
+        dtype = INTEGER_DTYPES[data_type]
+        return dtype.capitalize() if column.is_nullable.upper() != "NO" else dtype
+    if data_type in FLOAT_DTYPES:
+        return FLOAT_DTYPES[data_type]
+    if data_type == "boolean":
+        return "boolean"
+    if data_type == "date" or data_type.startswith("timestamp"):
+        return "datetime64[us, UTC]" if "with time zone" in data_type else "datetime64[us]"
+    if data_type in TEXT_TYPES:
+        return "category"
+    return None
+
+
+def schema_dtypes(columns: DataTableColumns) -> dict[str, str]:
+    """Map the columns of a table to compact pandas dtypes.
+
+    Args:
+        columns (DataTableColumns): The columns of the table.
+
+    Returns:
+        dict[str, str]: The dtype of each column whose type has one, keyed by column name.
+    """
+    dtypes = {column.column_name: column_dtype(column) for column in columns.columns}
+    return {name: dtype for name, dtype in dtypes.items() if dtype is not None}
+
+
+def typed_column(values: list[Any], dtype: str | None) -> Any:
+    """Build the values of a column with a dtype from `column_dtype`.
+
+    Args:
+        values (list[Any]): The values of the column.
+        dtype (str | None): The dtype of the column.
+
+    Returns:
+        Any: An array of the dtype, or the values themselves if the dtype is None, the column is "category" with
+        too many distinct values, or the values do not fit the dtype.
+    """
+    if dtype is None:
+        return values
+    try:
+        if dtype == "category":
+            if len(set(values)) > CATEGORY_MAX_RATIO * len(values):
+                return values
+            return pd.Categorical(values)
+        if dtype.startswith("datetime64"):
+            return pd.to_datetime(values, utc=dtype.endswith("UTC]"))
+        return pd.array(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return values
+
+
+def records_to_typed_dataframe(records: Iterable[dict[str, Any]], dtypes: dict[str, str]) -> pd.DataFrame:
+    """Build a pandas DataFrame from records, building each column with its dtype.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The records.
+        dtypes (dict[str, str]): The dtype of each column, e.g. from `schema_dtypes`. Other columns are left to
+            pandas.
+
+    Returns:
+        pd.DataFrame: The records as a DataFrame.
+    """
+    columns = records_to_columns(records)
+    return pd.DataFrame({name: typed_column(values, dtypes.get(name)) for name, values in columns.items()})
+
+
+def concat_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the DataFrame chunks of a table, keeping its categorical columns categorical.
+
+    Each chunk of a typed table decides on its own whether a text column is categorical, and with which
+    categories, while `pd.concat` only keeps a column categorical if its categories are the same in every chunk.
+    The columns that are categorical in any chunk are therefore decided again over the whole table, with the
+    union of their categories.
+
+    Args:
+        frames (Sequence[pd.DataFrame]): The chunks, in row order.
+
+    Returns:
+        pd.DataFrame: The chunks as one DataFrame.
+    """
+    df = pd.concat(frames)
+    for name in df.columns:
+        column = df[name]
+        if isinstance(column.dtype, pd.CategoricalDtype) or not any(
+            isinstance(frame[name].dtype, pd.CategoricalDtype) for frame in frames if name in frame.columns
+        ):
+            continue
+        if column.nunique(dropna=False) <= CATEGORY_MAX_RATIO * len(column):
+            df[name] = column.astype("category")
+    return df
+
+
+def records_to_arrow(records: Iterable[dict[str, Any]]) -> Any:
+    """Build a pyarrow Table from records.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The records.
+
+    Returns:
+        pyarrow.Table: The records as a Table.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+    except ImportError as e:
+        raise ImportError("Arrow results require pyarrow. Install it with `pip install datascribe_api[arrow]`.") from e
+    return pa.Table.from_pydict(records_to_columns(records))
+
+
+def records_to_polars(records: Iterable[dict[str, Any]]) -> Any:
+    """Build a polars DataFrame from records.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The records.
+
+    Returns:
+        polars.DataFrame: The records as a DataFrame.
+
+    Raises:
+        ImportError: If polars is not installed.
+    """
+    try:
+        import polars as pl  # noqa: PLC0415 - optional dependency
+    except ImportError as e:
+        raise ImportError("Polars results require polars. Install it with `pip install datascribe_api[polars]`.") from e
+    return pl.DataFrame(records_to_columns(records))
+
+
+def build_frame(records: Iterable[dict[str, Any]], as_: str, dtypes: dict[str, str] | None = None) -> Any:
+    """Build the result of a row endpoint in the requested format.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The decoded rows.
+        as_ (str): "records", "compact", "pandas", "typed", "arrow" or "polars".
+        dtypes (dict[str, str] | None): The dtypes of the columns of a "typed" DataFrame. Defaults to None.
+
+    Returns:
+        Any: A list of dicts, a CompactRows table, a pandas DataFrame, a pyarrow Table or a polars DataFrame.
+
+    Raises:
+        ValueError: If the format is unsupported.
+        ImportError: If the library of the format is not installed.
+    """
+    check_format(as_)
+    if as_ == "records":
+        return list(records)
+    if as_ == "compact":
+        return CompactRows.from_records(records)
+    if as_ == "typed":
+        return records_to_typed_dataframe(records, dtypes or {})
+    if as_ == "arrow":
+        return records_to_arrow(records)
+    if as_ == "polars":
+        return records_to_polars(records)
+    return pd.DataFrame(records_to_columns(records))
@@ -0,0 +1,109 @@
+"""Lazily validated response models for the DataScribe API.
+
+This module builds the list models of the API, whose responses can hold thousands of rows, tables or materials,
+without validating their items up front. Each item is kept as decoded and only validated into its model the
+first time it is accessed, so data that is counted, sliced or thrown away is never validated.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any, get_args
+
+from datascribe_api.models import DataTableRows, DataTables, MaterialByIdResults, MaterialSearchResults
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pydantic import BaseModel
+
+LAZY_FIELDS = {
+    DataTableRows: "root",
+    DataTables: "root",
+    MaterialSearchResults: "results",
+    MaterialByIdResults: "results",
+}
+
+
+class LazyList(list):
+    """A list of models holding decoded items that are validated the first time they are accessed.
+
+    Indexing, slicing and iteration return validated models, which replace their decoded items so each item is
+    validated at most once. The length is available without validating anything.
+
+    Attributes:
+        model (type[BaseModel]): The model the items are validated into.
+    """
+
+    def __init__(self, model: type[BaseModel], items: Iterable[Any] = ()) -> None:
+        """Initialize the list.
+
+        Args:
+            model (type[BaseModel]): The model the items are validated into.
+            items (Iterable[Any]): The decoded items.
+        """
+        super().__init__(items)
+        self.model = model
+
+    def _validated(self, index: int) -> BaseModel:
+        """Return the item at `index`, validating and storing it if it has not been validated yet."""
+        item = super().__getitem__(index)
+        if not isinstance(item, self.model):
+            item = self.model.model_validate(item)
+            super().__setitem__(index, item)
+        return item
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the validated item at an index, or a list of the validated items of a slice."""
+        if isinstance(index, slice):
+            return [self._validated(i) for i in range(*index.indices(len(self)))]
+        return self._validated(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the validated items."""
+        for index in range(len(self)):
+            yield self._validated(index)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the validated items in reverse order."""
+        for index in reversed(range(len(self))):
+            yield self._validated(index)
+
+    def pending(self) -> int:
+        """Return the number of items that have not been validated yet."""
+        return sum(not isinstance(item, self.model) for item in super().__iter__())
+
+
+def build_lazy_model(model: type[BaseModel], data: Any) -> Any:
+    """Build a list model whose items are validated on first access.
+
+    The rest of the model, e.g. the `total` of a material search, is validated as usual.
+
+    Args:
+        model (type[BaseModel]): A model of LAZY_FIELDS.
+        data (Any): The response data, a list for root models and a dict otherwise.
+
+    Returns:
+        Any: The model instance, with a LazyList of the decoded items.
+    """
+    field = LAZY_FIELDS[model]
+    (item_model,) = get_args(model.model_fields[field].annotation)
+    if field == "root":
+        return model.model_construct(LazyList(item_model, data))
+    instance = model.model_validate({**data, field: []})
+    setattr(instance, field, LazyList(item_model, data.get(field, ())))
+    return instance
+
+
+def concat_items(lists: list[list[Any]]) -> list[Any]:
+    """Concatenate lists of models, keeping the items of lazily validated lists unvalidated.
+
+    Args:
+        lists (list[list[Any]]): The lists, e.g. the roots of fetched pages.
+
+    Returns:
+        list[Any]: A LazyList if the lists are lazily validated, and a plain list otherwise.
+    """
+    if lists and isinstance(lists[0], LazyList):
+        return LazyList(lists[0].model, chain.from_iterable(list.__iter__(items) for items in lists))
+    return [item for items in lists for item in items]
@@ -0,0 +1,362 @@
+"""Bulk helpers for the material endpoints of the DataScribe API.
+
+This module provides helpers that resolve large numbers of material ids on behalf of a DataScribeClient,
+splitting them into requests that fit in a URL, and that walk every page of a material search. The requests
+are fetched concurrently.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from datascribe_api.autotune import PageSizeTuner, is_overload, resolve_tuner
+from datascribe_api.models import MaterialByIdResults, MaterialSearchResults
+from datascribe_api.routes import ROUTES
+from datascribe_api.utils import build_model, prepare_params, response_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from datascribe_api.client import DataScribeClient
+    from datascribe_api.models import MaterialSummary
+
+MAX_IDS_LENGTH = 2000
+
+MATERIALS_PATH = ROUTES["get_material_by_id"][0]
+
+
+def plan_id_chunks(ids: list[str], max_length: int = MAX_IDS_LENGTH) -> list[list[str]]:
+    """Split material ids into chunks whose URL-encoded, comma-joined `ids` parameter fits in `max_length` characters.
+
+    An id that is longer than `max_length` on its own is placed in a chunk by itself.
+
+    Args:
+        ids (list[str]): The material ids.
+        max_length (int): The maximum length of the encoded `ids` parameter of a chunk. Defaults to 2000.
+
+    Returns:
+        list[list[str]]: The chunks, preserving the order of the ids.
+
+    Raises:
+        ValueError: If `max_length` is not positive.
+    """
+    if max_length <= 0:
+        raise ValueError("max_length must be a positive integer.")
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    length = 0
+    for material_id in ids:
+        size = len(quote(material_id, safe=""))
+        separator = len("%2C") if chunk else 0
+        if chunk and length + separator + size > max_length:
+            chunks.append(chunk)
+            chunk, length, separator = [], 0, 0
+        chunk.append(material_id)
+        length += separator + size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _id_params(material_id: str, providers: list[str] | str | None, client: DataScribeClient) -> dict[str, Any]:
+    """Build the prepared query parameters of a lookup of a single material id."""
+    return prepare_params({"ids": material_id, "providers": providers}, client.codec)
+
+
+def fetch_materials(
+    client: DataScribeClient,
+    ids: list[str] | str,
+    providers: list[str] | str | None = None,
+    workers: int = 4,
+    max_ids_length: int = MAX_IDS_LENGTH,
+) -> MaterialByIdResults:
+    """Look up many material ids with concurrent requests that each fit in a URL.
+
+    Duplicate ids are requested once. When the client has a cache, the results are cached per id, so ids that
+    were already resolved, including ids with no results, are not requested again and single-id
+    `get_material_by_id` calls are answered from the cache. The requests go through the client like any other,
+    sharing identical in-flight requests and keeping the caller's deadline.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        ids (list[str] | str): The material ids, as a list or a comma-separated string.
+        providers (list[str] | str | None): The providers to query, or None for the API's default.
+        workers (int): The maximum number of concurrent requests. Defaults to 4.
+        max_ids_length (int): The maximum length of the encoded `ids` parameter of a request. Defaults to 2000.
+
+    Returns:
+        MaterialByIdResults: The results for all ids, without duplicates, in the order of the ids.
+
+    Raises:
+        ValueError: If `workers` is not positive or the API reports that a request failed.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    unique_ids = list(dict.fromkeys(material_id.strip() for material_id in ids if material_id.strip()))
+    cache = client.cache
+
+    found: dict[str, list[dict[str, Any]]] = {}
+    missing = []
+    for material_id in unique_ids:
+        cached = cache.get(MATERIALS_PATH, _id_params(material_id, providers, client)) if cache is not None else None
+        if cached is not None and cached.get("success") is not False:
+            found[material_id] = response_data(cached)["results"]
+        else:
+            missing.append(material_id)
+
+    chunks = plan_id_chunks(missing, max_ids_length)
+    unmatched: list[dict[str, Any]] = []
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datascribe-materials")
+    try:
+        # Requests run on the executor's threads, so they run in a copy of the caller's context to keep its deadline.
+        futures = [
+            executor.submit(contextvars.copy_context().run, client._get, MATERIALS_PATH, {"ids": chunk, "providers": providers})
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures, strict=True):
+            resp = future.result()
+            results = {material_id: [] for material_id in chunk}
+            extra = []
+            for result in response_data(resp)["results"]:
+                (results[result["id"]] if result.get("id") in results else extra).append(result)
+            found.update(results)
+            unmatched.extend(extra)
+            if cache is not None:
+                for material_id, matched in results.items():
+                    # Without a match, an id's results may be among the unmatched ones, so only cache it if there are none.
+                    if matched or not extra:
+                        data = {"success": True, "data": {"results": matched, "total": len(matched)}}
+                        cache.set(MATERIALS_PATH, _id_params(material_id, providers, client), data)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    merged = []
+    seen = set()
+    for result in [*(result for material_id in unique_ids for result in found[material_id]), *unmatched]:
+        identity = (result.get("provider"), result.get("id"))
+        if identity not in seen:
+            seen.add(identity)
+            merged.append(result)
+    return build_model(MaterialByIdResults, {"results": merged, "total": len(merged)}, client.lazy_validation)
+
+
+def size_unit(initial: int, min_size: int) -> int:
+    """Return the smallest page size of an auto-sized search, which every page size is a power-of-two multiple of.
+
+    Args:
+        initial (int): The page size of the first page.
+        min_size (int): The smallest page size of the tuner.
+
+    Returns:
+        int: `initial` halved as long as it stays an integer of at least `min_size`.
+    """
+    unit = initial
+    while unit % 2 == 0 and unit // 2 >= min_size:
+        unit //= 2
+    return unit
+
+
+def aligned_size(offset: int, size: int, unit: int = 1) -> int:
+    """Return the page size closest to `size` whose pages include one starting at `offset`.
+
+    The search endpoint is paged by page number, so a page of `n` results can only start at a multiple of `n`.
+    Page sizes are limited to `unit` times a power of two: a page can then always be split in halves down to
+    `unit`, and the size only grows once the offset is a multiple of the larger size, so it never degrades to an
+    arbitrary small divisor of the offset.
+
+    Args:
+        offset (int): The index of the first result of the page, a multiple of `unit`.
+        size (int): The page size wanted.
+        unit (int): The smallest page size. Defaults to 1.
+
+    Returns:
+        int: The largest `unit * 2**k` up to `size`, or `unit` itself, that divides `offset`.
+    """
+    aligned = unit
+    while aligned * 2 <= size and offset % (aligned * 2) == 0:
+        aligned *= 2
+    return aligned
+
+
+def iter_search_pages(
+    client: DataScribeClient,
+    query: dict[str, Any],
+    page: int = 1,
+    size: int | str | PageSizeTuner = 50,
+    workers: int = 4,
+) -> Iterator[MaterialSearchResults]:
+    """Iterate over the pages of a material search, fetching the following pages concurrently.
+
+    The first page is fetched on its own and its `total` determines the remaining pages, of which up to
+    `workers` are in flight at a time. Pages are yielded in order, and closing the generator early cancels the
+    pending requests.
+
+    With `size="auto"` or a PageSizeTuner, the pages are sized by the tuner instead, rounded down to a size
+    whose page numbering lines up with the results already read (see `aligned_size`), and `page` counts pages
+    of the tuner's initial size. Sizes are the initial size times a power of two, and never fall below the
+    tuner's minimum size. A page that fails with a timeout or server error is requested again as two halves,
+    until the smallest size is reached.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        query (dict[str, Any]): The search parameters, e.g. `{"elements": ["Si", "O"], "providers": "MP"}`.
+        page (int): The first page to fetch. Defaults to 1.
+        size (int | str | PageSizeTuner): The number of results per page, or "auto" or a PageSizeTuner to adapt
+            it to the response times. Defaults to 50.
+        workers (int): The maximum number of concurrent requests. Defaults to 4.
+
+    Yields:
+        MaterialSearchResults: The pages of the search.
+
+    Raises:
+        ValueError: If `page` or `workers` is not positive, or `size` is neither a positive integer nor "auto".
+    """
+    tuner = resolve_tuner(size, "size")
+    if page <= 0:
+        raise ValueError("page and size must be positive integers.")
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    if tuner is not None:
+        yield from _iter_tuned_search_pages(client, query, (page - 1) * tuner.size, tuner, workers)
+        return
+
+    first = client.search_materials(**query, page=page, size=size)
+    last_page = math.ceil(first.total / size) if len(first.results) == size else page
+    remaining = iter(range(page + 1, last_page + 1))
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datascribe-search")
+    pending: deque[Future] = deque()
+
+    def submit() -> None:
+        if (number := next(remaining, None)) is not None:
+            pending.append(executor.submit(client.search_materials, **query, page=number, size=size))
+
+    try:
+        for _ in range(workers):
+            submit()
+        yield first
+        while pending:
+            results = pending.popleft().result()
+            if not results.results:
+                return
+            submit()
+            yield results
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_tuned_search_pages(
+    client: DataScribeClient,
+    query: dict[str, Any],
+    offset: int,
+    tuner: PageSizeTuner,
+    workers: int,
+) -> Iterator[MaterialSearchResults]:
+    """Iterate over the pages of a material search from result `offset`, sized by `tuner`."""
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datascribe-search")
+    pending: deque[tuple[int, int, Future]] = deque()
+    next_offset = offset
+    total = None
+    unit = size_unit(tuner.size, tuner.min_size)
+
+    def fetch(start: int, size: int) -> MaterialSearchResults:
+        search = partial(client.search_materials, **query, page=start // size + 1, size=size)
+        return tuner.call(search, lambda results: len(results.results))
+
+    def submit() -> None:
+        nonlocal next_offset
+        size = aligned_size(next_offset, tuner.size, unit)
+        pending.append((next_offset, size, executor.submit(fetch, next_offset, size)))
+        next_offset += size
+
+    try:
+        submit()
+        while pending:
+            start, size, future = pending.popleft()
+            try:
+                results = future.result()
+            except Exception as e:
+                if size <= unit or not is_overload(e):
+                    raise
+                # Request the results of the failed page again, as smaller pages starting at the same offset.
+                step = aligned_size(size, min(tuner.size, size // 2), unit)
+                retries = [(row, executor.submit(fetch, row, step)) for row in range(start, start + size, step)]
+                pending.extendleft(reversed([(row, step, retry) for row, retry in retries]))
+                continue
+            first = total is None
+            if first:
+                total = results.total
+            if not results.results:
+                # The first page is yielded even when empty, so the caller still receives the total.
+                if first:
+                    yield results
+                return
+            last = len(results.results) < size
+            while not last and len(pending) < workers and next_offset < total:
+                submit()
+            yield results
+            if last:
+                return
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_search_materials(
+    client: DataScribeClient,
+    query: dict[str, Any],
+    page: int = 1,
+    size: int | str | PageSizeTuner = 50,
+    workers: int = 4,
+) -> Iterator[MaterialSummary]:
+    """Iterate over every result of a material search, in page order.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        query (dict[str, Any]): The search parameters, e.g. `{"elements": ["Si", "O"], "providers": "MP"}`.
+        page (int): The first page to fetch. Defaults to 1.
+        size (int | str | PageSizeTuner): The number of results per page, or "auto" or a PageSizeTuner to adapt
+            it to the response times. Defaults to 50.
+        workers (int): The maximum number of concurrent requests. Defaults to 4.
+
+    Yields:
+        MaterialSummary: The results of the search.
+    """
+    for results in iter_search_pages(client, query, page, size, workers):
+        yield from results.results
+
+
+def search_materials_all(
+    client: DataScribeClient,
+    query: dict[str, Any],
+    page: int = 1,
+    size: int | str | PageSizeTuner = 50,
+    workers: int = 4,
+) -> MaterialSearchResults:
+    """Collect every result of a material search.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        query (dict[str, Any]): The search parameters, e.g. `{"elements": ["Si", "O"], "providers": "MP"}`.
+        page (int): The first page to fetch. Defaults to 1.
+        size (int | str | PageSizeTuner): The number of results per page, or "auto" or a PageSizeTuner to adapt
+            it to the response times. Defaults to 50.
+        workers (int): The maximum number of concurrent requests. Defaults to 4.
+
+    Returns:
+        MaterialSearchResults: The results of all pages, with the `total` reported by the API.
+    """
+    pages = list(iter_search_pages(client, query, page, size, workers))
+    results = [summary for results in pages for summary in results.results]
+    return MaterialSearchResults.model_construct(results=results, total=pages[0].total)
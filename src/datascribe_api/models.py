@@ -9,7 +9,12 @@ from datetime import datetime
 from typing import Any
 
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, RootModel
+from pydantic import BaseModel, ConfigDict, RootModel, SerializerFunctionWrapHandler, field_serializer
+
+
+def _serialize_items(items: list[Any], handler: SerializerFunctionWrapHandler) -> Any:
+    """Serialize a list of models, validating the pending items of a lazily validated list first."""
+    return handler(items if type(items) is list else list(items))
 
 
 class DatabaseSchemaColumn(BaseModel):
@@ -125,6 +130,10 @@ class DataTableRows(RootModel):
 
     root: list[DataTableRow]
 
+    @field_serializer("root", mode="wrap")
+    def _serialize_root(self, items: list[Any], handler: SerializerFunctionWrapHandler) -> Any:
+        return _serialize_items(items, handler)
+
     def __iter__(self) -> Iterator[DataTableRow]:
         return iter(self.root)
 
@@ -205,6 +214,10 @@ class DataTables(RootModel):
 
     root: list[DataTable]
 
+    @field_serializer("root", mode="wrap")
+    def _serialize_root(self, items: list[Any], handler: SerializerFunctionWrapHandler) -> Any:
+        return _serialize_items(items, handler)
+
     def __iter__(self) -> Iterator[DataTable]:
         return iter(self.root)
 
@@ -267,6 +280,10 @@ class MaterialSearchResults(BaseModel):
     results: list[MaterialSummary]
     total: int
 
+    @field_serializer("results", mode="wrap")
+    def _serialize_results(self, items: list[Any], handler: SerializerFunctionWrapHandler) -> Any:
+        return _serialize_items(items, handler)
+
     def to_dataframe(self) -> pd.DataFrame:
         """Return search results as a pandas DataFrame."""
         return pd.DataFrame([summary.model_dump() for summary in self.results])
@@ -307,6 +324,10 @@ class MaterialByIdResults(BaseModel):
     results: list[MaterialByIdResult]
     total: int
 
+    @field_serializer("results", mode="wrap")
+    def _serialize_results(self, items: list[Any], handler: SerializerFunctionWrapHandler) -> Any:
+        return _serialize_items(items, handler)
+
     def to_dataframe(self) -> pd.DataFrame:
         """Return results as a pandas DataFrame."""
         return pd.DataFrame([result.model_dump() for result in self.results])
@@ -0,0 +1,543 @@
+"""Pagination helpers for the DataScribe API.
+
+This module provides helpers that walk paginated endpoints on behalf of a DataScribeClient, so callers do not
+have to write the `startingRow`/`numRows` offset loop by hand. Keyset iteration seeks past the last key seen
+instead, so deep pages cost as much as the first one.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import chain, pairwise
+from typing import TYPE_CHECKING, Any
+
+from datascribe_api.autotune import PageSizeTuner, is_overload, resolve_tuner
+from datascribe_api.columnar import build_frame, check_format
+from datascribe_api.filter import Filter
+from datascribe_api.lazy import build_lazy_model, concat_items
+from datascribe_api.models import DataTableRows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+
+    from datascribe_api.client import DataScribeClient
+
+
+def fetch_rows_page(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str] | None,
+    filters: dict[str, Any] | Filter | list[Filter] | None,
+    startingRow: int,
+    numRows: int,
+    as_: str | None = None,
+) -> Any:
+    """Fetch a single page of rows from a data table.
+
+    Uses `get_data_table_rows` when columns are given and `get_data_table` otherwise.
+
+    Args:
+        client (DataScribeClient): The client used to make the request.
+        tableName (str): The name of the data table.
+        columns (list[str] | None): The columns to retrieve, or None for all columns.
+        filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+        startingRow (int): The index of the first row of the page.
+        numRows (int): The number of rows in the page.
+        as_ (str | None): The format of the rows, as accepted by `DataScribeClient.search`. Defaults to None (models).
+
+    Returns:
+        Any: The rows of the page, as `DataTableRows` unless `as_` is given.
+
+    Raises:
+        ValueError: If filters are given without columns.
+    """
+    if columns is None:
+        if filters is not None:
+            raise ValueError("Filtering rows requires the columns to be specified.")
+        return client.get_data_table(tableName=tableName, startingRow=startingRow, numRows=numRows, as_=as_)
+    return client.get_data_table_rows(
+        tableName=tableName, columns=columns, startingRow=startingRow, numRows=numRows, filters=filters, as_=as_
+    )
+
+
+def iter_table_rows(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str] | None = None,
+    filters: dict[str, Any] | Filter | list[Filter] | None = None,
+    page_size: int | str | PageSizeTuner = 100,
+    prefetch: int = 2,
+    pages: bool = False,
+    startingRow: int = 0,
+    as_: str | None = None,
+) -> Iterator[Any]:
+    """Iterate over the rows of a data table, reading pages ahead in the background.
+
+    While the caller processes the current page, up to `prefetch` following pages are fetched on worker
+    threads. Closing the generator early cancels the pending prefetches; requests already on the wire are
+    left to finish in the background and their results are discarded.
+
+    With `page_size="auto"` or a PageSizeTuner, each page is requested with the size the tuner suggests when
+    it is submitted. A page that fails with a timeout or server error is requested again as smaller pages,
+    until the tuner reaches its minimum size.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        tableName (str): The name of the data table.
+        columns (list[str] | None): The columns to retrieve, or None for all columns.
+        filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+        page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" or a
+            PageSizeTuner to adapt it to the response times. Defaults to 100.
+        prefetch (int): The number of pages fetched ahead of the one being consumed. Defaults to 2.
+        pages (bool): Yield whole `DataTableRows` pages instead of individual rows. Defaults to False.
+        startingRow (int): The index of the first row to retrieve. Defaults to 0.
+        as_ (str | None): The format of the pages, as accepted by `DataScribeClient.search`. Defaults to None
+            (models).
+
+    Yields:
+        DataTableRow | DataTableRows | Any: The rows of the table, or its pages if `pages` is True.
+
+    Raises:
+        ValueError: If `page_size` is neither a positive integer nor "auto", or `prefetch` is negative.
+    """
+    tuner = resolve_tuner(page_size)
+    if prefetch < 0:
+        raise ValueError("prefetch must be a non-negative integer.")
+
+    executor = ThreadPoolExecutor(max_workers=prefetch + 1, thread_name_prefix="datascribe-prefetch")
+    pending: deque[tuple[int, int, Future]] = deque()
+    next_row = startingRow
+
+    def fetch(start: int, size: int) -> Any:
+        if tuner is None:
+            return fetch_rows_page(client, tableName, columns, filters, start, size, as_)
+        return tuner.call(partial(fetch_rows_page, client, tableName, columns, filters, start, size, as_))
+
+    def submit() -> None:
+        nonlocal next_row
+        size = page_size if tuner is None else tuner.size
+        pending.append((next_row, size, executor.submit(fetch, next_row, size)))
+        next_row += size
+
+    try:
+        for _ in range(prefetch + 1):
+            submit()
+        while pending:
+            start, size, future = pending.popleft()
+            try:
+                page = future.result()
+            except Exception as e:
+                if tuner is None or size <= tuner.min_size or not is_overload(e):
+                    raise
+                # Request the rows of the failed page again, as pages of the size the tuner shrank to.
+                step = min(tuner.size, size - 1)
+                retries = [(row, min(step, start + size - row)) for row in range(start, start + size, step)]
+                pending.extendleft(reversed([(row, n, executor.submit(fetch, row, n)) for row, n in retries]))
+                continue
+            last = len(page) < size
+            if not last and len(pending) <= prefetch:
+                submit()
+            if len(page):
+                if pages:
+                    yield page
+                else:
+                    yield from page
+            if last:
+                return
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def filter_list(filters: dict[str, Any] | Filter | list[Filter] | None) -> list[Any]:
+    """Return filters as a list of serialized filters, so more conditions can be appended to them."""
+    serialized = Filter.serialize(filters)
+    if serialized is None:
+        return []
+    return [serialized] if isinstance(serialized, dict) else serialized
+
+
+def iter_keyset(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str],
+    key: str,
+    filters: dict[str, Any] | Filter | list[Filter] | None = None,
+    page_size: int | str | PageSizeTuner = 1000,
+    after: Any = None,
+    pages: bool = False,
+    as_: str | None = None,
+) -> Iterator[Any]:
+    """Iterate over the rows of a data table by seeking past the last key seen, instead of by row offset.
+
+    Each page is requested from row 0 with the caller's filters and `Filter(key) > last_key`, where `last_key`
+    is the key of the last row of the previous page. The server does not skip over the rows already read, so
+    every page costs about the same however deep the scan goes. `key` must be unique and must be the order the
+    table returns its rows in, such as an indexed id. A page whose keys do not increase raises ValueError, since
+    rows would otherwise be skipped. With `page_size="auto"` or a PageSizeTuner, each page is requested with the
+    size the tuner suggests, and a page that fails with a timeout or server error is requested again with a
+    smaller size, until the tuner reaches its minimum size.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        tableName (str): The name of the data table.
+        columns (list[str]): The columns to retrieve, including `key`.
+        key (str): The column the rows are ordered by.
+        filters (dict | Filter | list[Filter] | None): The filters to apply in addition to the key filter.
+        page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" or a
+            PageSizeTuner to adapt it to the response times. Defaults to 1000.
+        after (Any): Only retrieve the rows whose key is greater than this value, e.g. to resume a scan. Defaults
+            to None (from the first row).
+        pages (bool): Yield whole pages instead of individual rows. Defaults to False.
+        as_ (str | None): The format of the pages, as accepted by `DataScribeClient.search`. Requires `pages`.
+            Defaults to None (models).
+
+    Yields:
+        DataTableRow | DataTableRows | Any: The rows of the table, or its pages if `pages` is True.
+
+    Raises:
+        ValueError: If `page_size` is neither a positive integer nor "auto", `columns` does not include `key`,
+            `as_` is given without `pages`, or the rows are not returned in ascending order of `key`.
+    """
+    tuner = resolve_tuner(page_size)
+    if key not in columns:
+        raise ValueError(f"columns must include the key column '{key}'.")
+    if as_ is not None:
+        check_format(as_)
+        if not pages:
+            raise ValueError("as_ requires pages=True.")
+    dtypes = client.table_dtypes(tableName) if as_ == "typed" else None
+    base = filter_list(filters)
+    last = after
+    while True:
+        page_filters = base if last is None else [*base, (Filter(key) > last).to_dict()]
+        size = page_size if tuner is None else tuner.size
+        fetch = partial(fetch_rows_page, client, tableName, columns, page_filters or None, 0, size, "records")
+        if tuner is None:
+            records = fetch()
+        else:
+            try:
+                records = tuner.call(fetch)
+            except Exception as e:
+                if size <= tuner.min_size or not is_overload(e):
+                    raise
+                continue
+        keys = [record[key] for record in records]
+        ordered = keys if last is None else [last, *keys]
+        if any(previous >= current for previous, current in pairwise(ordered)):
+            raise ValueError(f"Rows are not returned in ascending order of '{key}', which keyset pagination requires.")
+        if records:
+            last = keys[-1]
+            if as_ is not None:
+                page = build_frame(records, as_, dtypes)
+            else:
+                page = build_lazy_model(DataTableRows, records) if client.lazy_validation else DataTableRows(records)
+            if pages:
+                yield page
+            else:
+                yield from page
+        if len(records) < size:
+            return
+
+
+def iter_dataframes(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str] | None = None,
+    filters: dict[str, Any] | Filter | list[Filter] | None = None,
+    chunk_rows: int = 100_000,
+    page_size: int | str | PageSizeTuner = 1000,
+    prefetch: int = 2,
+    typed: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over a data table as pandas DataFrames of at most a few pages each.
+
+    Pages are read ahead like in `iter_table_rows`, but fetched as plain records and gathered until they hold
+    `chunk_rows` rows, which are then built into one DataFrame. Only the current chunk is held in memory. The
+    index of each chunk continues the row positions of the previous one.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        tableName (str): The name of the data table.
+        columns (list[str] | None): The columns to retrieve, or None for all columns.
+        filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+        chunk_rows (int): The minimum number of rows per DataFrame, rounded up to whole pages. Defaults to 100000.
+        page_size (int | str | PageSizeTuner): The number of rows requested per page, or "auto" or a
+            PageSizeTuner to adapt it to the response times. Defaults to 1000.
+        prefetch (int): The number of pages fetched ahead of the one being consumed. Defaults to 2.
+        typed (bool): Build the DataFrames with the dtypes of the table's columns, as with `as_="typed"`.
+            Defaults to False.
+
+    Yields:
+        pd.DataFrame: The chunks of the table, in row order.
+
+    Raises:
+        ValueError: If `chunk_rows` is not positive, `page_size` is neither a positive integer nor "auto", or
+            `prefetch` is negative.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be a positive integer.")
+    as_ = "typed" if typed else "pandas"
+    dtypes = client.table_dtypes(tableName) if typed else None
+    records: list[dict[str, Any]] = []
+    start = 0
+    for page in iter_table_rows(client, tableName, columns, filters, page_size, prefetch, pages=True, as_="records"):
+        records.extend(page)
+        if len(records) >= chunk_rows:
+            yield _chunk_frame(records, as_, dtypes, start)
+            start += len(records)
+            records = []
+    if records:
+        yield _chunk_frame(records, as_, dtypes, start)
+
+
+def _chunk_frame(records: list[dict[str, Any]], as_: str, dtypes: dict[str, str] | None, start: int) -> pd.DataFrame:
+    """Build the DataFrame of a chunk of records, indexed by row position from `start`."""
+    df = build_frame(records, as_, dtypes)
+    df.index = range(start, start + len(df))
+    return df
+
+
+def plan_shards(total_rows: int, shard_size: int, startingRow: int = 0) -> list[tuple[int, int]]:
+    """Split the row range `[startingRow, total_rows)` into `(startingRow, numRows)` shards.
+
+    Args:
+        total_rows (int): The number of rows in the table.
+        shard_size (int): The maximum number of rows in a shard.
+        startingRow (int): The index of the first row to cover. Defaults to 0.
+
+    Returns:
+        list[tuple[int, int]]: The shards in row order.
+
+    Raises:
+        ValueError: If `shard_size` is not positive.
+    """
+    if shard_size <= 0:
+        raise ValueError("shard_size must be a positive integer.")
+    return [(start, min(shard_size, total_rows - start)) for start in range(startingRow, total_rows, shard_size)]
+
+
+def split_range(lo: Any, hi: Any, shards: int) -> list[Any]:
+    """Return the points splitting the value range `[lo, hi]` into `shards` sub-ranges of equal width.
+
+    Args:
+        lo (Any): The lowest value, a number, a datetime or date, or an ISO 8601 timestamp string.
+        hi (Any): The highest value, of the same type as `lo`.
+        shards (int): The number of sub-ranges.
+
+    Returns:
+        list[Any]: The distinct split points strictly above `lo`, in ascending order, of the type of `lo`. Points
+            of timestamp strings are returned as ISO 8601 strings and points of dates as datetimes.
+
+    Raises:
+        TypeError: If the values are neither numbers nor timestamps.
+    """
+    if isinstance(lo, str):
+        try:
+            start, end = datetime.fromisoformat(lo), datetime.fromisoformat(hi)
+        except ValueError as e:
+            raise TypeError(f"Cannot split a range of strings that are not timestamps: {e}") from e
+        points = split_range(start, end, shards)
+        return [point.isoformat() for point in points]
+    if isinstance(lo, (datetime, date)):
+        start = lo if isinstance(lo, datetime) else datetime.combine(lo, datetime.min.time())
+        end = hi if isinstance(hi, datetime) else datetime.combine(hi, datetime.min.time())
+        points = [start + (end - start) * i / shards for i in range(1, shards)]
+    elif isinstance(lo, int) and isinstance(hi, int) and not isinstance(lo, bool):
+        points = [lo + (hi - lo) * i // shards for i in range(1, shards)]
+    elif isinstance(lo, (int, float)) and isinstance(hi, (int, float)) and not isinstance(lo, bool):
+        points = [lo + (hi - lo) * i / shards for i in range(1, shards)]
+    else:
+        raise TypeError(f"Cannot split a range of {type(lo).__name__} values.")
+    return sorted({point for point in points if point > lo})
+
+
+def plan_value_shards(column: str, lo: Any, hi: Any, shards: int) -> list[list[dict[str, Any]]]:
+    """Split the values of a column into shards expressed as range filters.
+
+    `[lo, hi]` is split into `shards` sub-ranges of equal width, each bounded by `Filter(column) >= start` and
+    `Filter(column) < end`. The first shard has no lower bound and the last one no upper bound, so values
+    outside `[lo, hi]` are still covered, and a last shard holds the rows where the column is NULL. The
+    shards do not depend on each other and can be fetched by separate processes or machines.
+
+    Args:
+        column (str): The column to shard on.
+        lo (Any): The lowest value of the column.
+        hi (Any): The highest value of the column.
+        shards (int): The number of value sub-ranges.
+
+    Returns:
+        list[list[dict[str, Any]]]: The serialized filters of each shard, in ascending order of values.
+
+    Raises:
+        ValueError: If `shards` is not positive.
+        TypeError: If the values are neither numbers nor timestamps.
+    """
+    if shards <= 0:
+        raise ValueError("shards must be a positive integer.")
+    # Filter values are encoded as JSON, so datetimes are sent as ISO 8601 strings.
+    points = [point.isoformat() if isinstance(point, date) else point for point in split_range(lo, hi, shards)]
+    if not points:
+        return [[Filter(column).is_not_null().to_dict()], [Filter(column).is_null().to_dict()]]
+    plan = [[(Filter(column) < points[0]).to_dict()]]
+    plan += [[(Filter(column) >= start).to_dict(), (Filter(column) < end).to_dict()] for start, end in pairwise(points)]
+    plan.append([(Filter(column) >= points[-1]).to_dict()])
+    plan.append([Filter(column).is_null().to_dict()])
+    return plan
+
+
+def value_bounds(
+    client: DataScribeClient,
+    tableName: str,
+    column: str,
+    filters: dict[str, Any] | Filter | list[Filter] | None = None,
+) -> tuple[Any, Any] | None:
+    """Estimate the range of the values of a column from the first and last rows of a table where it is set.
+
+    Only the row count and two single-row pages are requested. The estimate is exact when the table returns
+    its rows in the order of the column, and shards planned from it cover every row either way. The API has no
+    descending order to seek from, so the last row is read at its offset. The server skips over the rows before
+    it once per download, for a single row, rather than once per page.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        tableName (str): The name of the data table.
+        column (str): The column whose range is estimated.
+        filters (dict | Filter | list[Filter] | None): The filters to apply.
+
+    Returns:
+        tuple[Any, Any] | None: The lowest and highest values found, or None if the column is NULL in every row.
+    """
+    filters = [*filter_list(filters), Filter(column).is_not_null().to_dict()]
+    total_rows = client.get_data_table_rows_count(tableName=tableName, filters=filters).total_rows
+    if total_rows == 0:
+        return None
+    rows = [
+        *fetch_rows_page(client, tableName, [column], filters, 0, 1, "records"),
+        *fetch_rows_page(client, tableName, [column], filters, total_rows - 1, 1, "records"),
+    ]
+    values = [row[column] for row in rows]
+    return min(values), max(values)
+
+
+def _scan(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str],
+    filters: list[Any],
+    page_size: int,
+    as_: str | None,
+    key: str | None = None,
+) -> list[Any]:
+    """Fetch every page of the rows matching `filters`, returning the pages in order.
+
+    With `key`, the pages are fetched with `iter_keyset`, seeking past the last key instead of by row offset.
+    """
+    if key is not None:
+        return list(iter_keyset(client, tableName, columns, key, filters, page_size, pages=True, as_=as_))
+    pages = []
+    start = 0
+    while True:
+        page = fetch_rows_page(client, tableName, columns, filters, start, page_size, as_)
+        pages.append(page)
+        start += page_size
+        if len(page) < page_size:
+            return pages
+
+
+def fetch_table(
+    client: DataScribeClient,
+    tableName: str,
+    columns: list[str] | None = None,
+    filters: dict[str, Any] | Filter | list[Filter] | None = None,
+    workers: int = 4,
+    page_size: int = 1000,
+    dataframe: bool = False,
+    as_: str | None = None,
+    shard_on: str | None = None,
+    shards: int | None = None,
+    key: str | None = None,
+) -> DataTableRows | pd.DataFrame | Any:
+    """Download a whole data table by fetching row-range shards concurrently.
+
+    The row count is requested once and `[0, total_rows)` is split into shards of `page_size` rows, which are
+    fetched on a pool of `workers` threads and reassembled in row order. DataFrames and other columnar results
+    are built straight from the decoded rows, without a model per row.
+
+    With `shard_on`, the table is split by the values of a numeric or timestamp column instead. Its range is
+    estimated with `value_bounds` and split into `shards` sub-ranges by `plan_value_shards`, each scanned page by
+    page with range filters, so no shard has to skip over the rows of the others. Rows are then returned in
+    ascending order of the shards, with the rows where the column is NULL last. Within a shard, pages are read
+    by row offset, so the server still skips over the rows of the shard read before each page. With `key`, a
+    unique column the table returns its rows in order of (which may be `shard_on` itself if it is unique), each
+    shard is read with `iter_keyset` instead and no page skips over any rows. The API cannot order rows by
+    another column, so without such a key, seeking on `shard_on` could skip or repeat rows that share a value.
+
+    Args:
+        client (DataScribeClient): The client used to make the requests.
+        tableName (str): The name of the data table.
+        columns (list[str] | None): The columns to retrieve, or None for all columns.
+        filters (dict | Filter | list[Filter] | None): The filters to apply. Requires columns.
+        workers (int): The maximum number of concurrent requests. Defaults to 4.
+        page_size (int): The number of rows requested per shard. Defaults to 1000.
+        dataframe (bool): Return a pandas DataFrame instead of `DataTableRows`. Defaults to False.
+        as_ (str | None): Return the rows as "records", a "compact" CompactRows table, a "pandas" DataFrame, a "typed" pandas DataFrame, an "arrow" Table or a "polars" DataFrame. Defaults to None.
+        shard_on (str | None): A numeric or timestamp column to split the table on by value. Requires columns.
+            Defaults to None (row-range shards).
+        shards (int | None): The number of value sub-ranges with `shard_on`. Defaults to `workers`.
+        key (str | None): A unique column, included in `columns`, that the table returns its rows in order of,
+            used to page within each value shard by seeking. Requires `shard_on`. Defaults to None (row offsets).
+
+    Returns:
+        DataTableRows | pd.DataFrame | Any: All rows of the table in order.
+
+    Raises:
+        ValueError: If `workers`, `page_size` or `shards` is not positive, `as_` is unsupported, `shard_on` is
+            given without columns, `key` is given without `shard_on` or is missing from `columns`, or the rows
+            of a shard are not returned in ascending order of `key`.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer.")
+    if page_size <= 0:
+        raise ValueError("page_size must be a positive integer.")
+    if dataframe and as_ is None:
+        as_ = "pandas"
+    if as_ is not None:
+        check_format(as_)
+    if key is not None and shard_on is None:
+        raise ValueError("key requires shard_on.")
+    page_as = "records" if as_ else None
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datascribe-shard")
+    try:
+        if shard_on is None:
+            total_rows = client.get_data_table_rows_count(tableName=tableName, filters=filters).total_rows
+            futures = [
+                executor.submit(fetch_rows_page, client, tableName, columns, filters, *shard, page_as)
+                for shard in plan_shards(total_rows, page_size)
+            ]
+            pages = [future.result() for future in futures]
+        else:
+            if columns is None:
+                raise ValueError("Sharding on a column requires the columns to be specified.")
+            bounds = value_bounds(client, tableName, shard_on, filters)
+            base = filter_list(filters)
+            plan = [[]] if bounds is None else plan_value_shards(shard_on, *bounds, shards or workers)
+            futures = [
+                executor.submit(_scan, client, tableName, columns, [*base, *shard] or None, page_size, page_as, key)
+                for shard in plan
+            ]
+            pages = [page for future in futures for page in future.result()]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if as_ is not None:
+        dtypes = client.table_dtypes(tableName) if as_ == "typed" else None
+        return build_frame(chain.from_iterable(pages), as_, dtypes)
+    return DataTableRows.model_construct(root=concat_items([page.root for page in pages]))
@@ -0,0 +1,223 @@
+"""Client-side rate limiting for the DataScribe API.
+
+This module provides a rate limiter that can be shared by every thread, and every client, talking to the API.
+A token bucket caps the request rate, and an AIMD (additive increase, multiplicative decrease) limit caps the
+number of requests in flight: the limit grows by about one for every window of successful requests and is
+halved when the API answers with 429 or 503. While the API asks clients to back off, through `Retry-After` or
+repeated throttling, all requests are paused together instead of each thread backing off on its own.
+"""
+
+import math
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from datascribe_api.retry import RETRY_BACKOFF_MAX
+from datascribe_api.utils import POOL_MAXSIZE, DeadlineExceeded
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header.
+
+    Args:
+        value (str | None): The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        float | None: The number of seconds to wait, capped at 120, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), RETRY_BACKOFF_MAX)
+
+
+class RateLimiter:
+    """A thread-safe token bucket with an AIMD concurrency limit.
+
+    Example usage:
+        limiter = RateLimiter(rate=20, max_concurrency=16)
+        ticket = limiter.acquire()
+        resp = session.get(url)
+        if resp.status_code in THROTTLE_STATUSES:
+            limiter.throttle(ticket, parse_retry_after(resp.headers.get("Retry-After")))
+        else:
+            limiter.success(ticket)
+
+    Attributes:
+        rate (float | None): The maximum number of requests per second, or None for no rate cap.
+        burst (int): The number of requests that may be sent at once after an idle period.
+        min_concurrency (int): The lowest value the concurrency limit is decreased to.
+        max_concurrency (int): The highest value the concurrency limit is increased to.
+        decrease_factor (float): The factor applied to the concurrency limit when the API throttles requests.
+        cooldown (float): The pause in seconds after throttling without `Retry-After`, doubled while it persists.
+        limit (float): The current concurrency limit.
+        requests (int): The number of requests admitted.
+        throttled (int): The number of requests the API throttled.
+        throttled_seconds (float): The total time requests waited to be admitted.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_concurrency: int = POOL_MAXSIZE,
+        min_concurrency: int = 1,
+        decrease_factor: float = 0.5,
+        cooldown: float = 0.5,
+    ) -> None:
+        """Initialize the rate limiter with a full bucket and the concurrency limit at its maximum.
+
+        Args:
+            rate (float | None): The maximum number of requests per second. Defaults to None (no rate cap).
+            burst (int | None): The capacity of the token bucket. Defaults to one second's worth of requests.
+            max_concurrency (int): The highest concurrency limit, and its initial value. Defaults to 32.
+            min_concurrency (int): The lowest concurrency limit. Defaults to 1.
+            decrease_factor (float): The factor applied to the concurrency limit on throttling. Defaults to 0.5.
+            cooldown (float): The initial pause in seconds after throttling without `Retry-After`. Defaults to 0.5.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive.")
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("min_concurrency and max_concurrency must satisfy 1 <= min_concurrency <= max_concurrency.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+        self.rate = rate
+        self.burst = burst or (max(1, math.ceil(rate)) if rate is not None else 1)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.limit = float(max_concurrency)
+        self.requests = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._epoch = 0
+        self._strikes = 0
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def acquire(self, timeout: float | None = None) -> int:
+        """Wait until a request may be sent.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait, e.g. the time left before a deadline.
+                Defaults to None (wait as long as needed).
+
+        Returns:
+            int: A ticket to pass to `success`, `throttle` or `release` once the response arrives.
+
+        Raises:
+            DeadlineExceeded: If the request cannot be admitted within `timeout`. A pause or a token that is known
+                to end after the timeout raises at once instead of waiting for it.
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._in_flight >= int(self.limit):
+                        wait = None
+                    elif self.rate is None or self._tokens >= 1:
+                        break
+                    else:
+                        wait = (1 - self._tokens) / self.rate
+                if deadline is not None:
+                    if now >= deadline or (wait is not None and now + wait > deadline):
+                        raise DeadlineExceeded("Deadline exceeded while waiting for the rate limiter to admit the request.")
+                    if wait is None:
+                        wait = deadline - now
+                self._cond.wait(wait)
+            if self.rate is not None:
+                self._tokens -= 1
+            self._in_flight += 1
+            self.requests += 1
+            self.throttled_seconds += time.monotonic() - start
+            return self._epoch
+
+    def success(self, ticket: int) -> None:
+        """Report that a request succeeded, raising the concurrency limit.
+
+        Args:
+            ticket (int): The ticket returned by `acquire`.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            self._strikes = 0
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def throttle(self, ticket: int, retry_after: float | None = None) -> float:
+        """Report that the API throttled a request, lowering the concurrency limit and pausing requests.
+
+        The limit is decreased at most once for the requests that were in flight together, so a burst of 429s
+        in response to one window of requests does not collapse the limit.
+
+        Args:
+            ticket (int): The ticket returned by `acquire`.
+            retry_after (float | None): The number of seconds the API asked to wait, if any.
+
+        Returns:
+            float: The number of seconds until requests are admitted again.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            self.throttled += 1
+            if ticket == self._epoch:
+                self._epoch += 1
+                self._strikes += 1
+                self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+            if retry_after is None:
+                retry_after = min(RETRY_BACKOFF_MAX, self.cooldown * 2 ** (self._strikes - 1)) if self._strikes else 0.0
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + retry_after)
+            self._cond.notify_all()
+            return self._paused_until - now
+
+    def release(self, ticket: int) -> None:
+        """Report that a request ended without a response, leaving the concurrency limit unchanged.
+
+        Args:
+            ticket (int): The ticket returned by `acquire`.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, float]:
+        """Report the state of the rate limiter.
+
+        Returns:
+            dict[str, float]: The current concurrency `limit`, the requests `in_flight`, the number of `requests`
+            admitted and `throttled`, and the total `throttled_seconds` requests waited to be admitted.
+        """
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "throttled_seconds": self.throttled_seconds,
+            }
@@ -0,0 +1,185 @@
+"""Tail-latency and failure controls for the DataScribe API.
+
+This module provides a hedging policy, which sends a duplicate of a slow request once it has taken longer than
+a percentile of the recent latencies of its endpoint and uses whichever response arrives first, and a circuit
+breaker, which makes calls to an endpoint fail fast after repeated server errors or timeouts instead of waiting
+for each request to time out.
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+
+from requests import ConnectionError as RequestsConnectionError
+
+
+class CircuitOpenError(RequestsConnectionError):
+    """Raised when a request is rejected because the circuit of its endpoint is open."""
+
+
+class HedgePolicy:
+    """Decides when to send a duplicate of a slow request, based on the recent latencies of its endpoint.
+
+    All GET endpoints of the API are idempotent, so a duplicate request is harmless; the slower response is
+    discarded.
+
+    Attributes:
+        percentile (float): The latency percentile after which a duplicate request is sent.
+        min_delay (float): The shortest delay in seconds before a duplicate request is sent.
+        min_samples (int): The number of latencies recorded for an endpoint before its requests are hedged.
+        hedged (int): The number of duplicate requests sent.
+        won (int): The number of duplicate requests that answered first.
+    """
+
+    def __init__(self, percentile: float = 95, min_delay: float = 0.05, min_samples: int = 20, window: int = 200) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile (float): The latency percentile after which a duplicate request is sent. Defaults to 95.
+            min_delay (float): The shortest delay in seconds before a duplicate request is sent. Defaults to 0.05.
+            min_samples (int): The number of latencies recorded for an endpoint before its requests are hedged. Defaults to 20.
+            window (int): The number of recent latencies kept per endpoint. Defaults to 200.
+
+        Raises:
+            ValueError: If `percentile` is not between 0 and 100 or `window` is smaller than `min_samples`.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100.")
+        if window < min_samples:
+            raise ValueError("window must be at least min_samples.")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.hedged = 0
+        self.won = 0
+        self._latencies: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def observe(self, path: str, latency: float) -> None:
+        """Record the latency of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            latency (float): The time in seconds the request took.
+        """
+        with self._lock:
+            self._latencies[path].append(latency)
+
+    def record_hedge(self) -> None:
+        """Record that a duplicate request was sent."""
+        with self._lock:
+            self.hedged += 1
+
+    def record_win(self) -> None:
+        """Record that a duplicate request answered first."""
+        with self._lock:
+            self.won += 1
+
+    def delay(self, path: str) -> float | None:
+        """Return how long to wait for a response before sending a duplicate request.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Returns:
+            float | None: The delay in seconds, or None if too few latencies of the endpoint are known to hedge.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies[path])
+        if len(latencies) < self.min_samples:
+            return None
+        index = min(len(latencies) - 1, math.ceil(self.percentile / 100 * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+
+
+class CircuitBreaker:
+    """A per-endpoint circuit breaker.
+
+    After `failure_threshold` consecutive failures of an endpoint, its circuit opens and calls fail immediately
+    with CircuitOpenError. Once `reset_timeout` seconds have passed, a single trial request is let through: its
+    success closes the circuit, and its failure opens it again.
+
+    Attributes:
+        failure_threshold (int): The number of consecutive failures that open the circuit.
+        reset_timeout (float): The number of seconds the circuit stays open before a trial request.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30) -> None:
+        """Initialize the circuit breaker with every circuit closed.
+
+        Args:
+            failure_threshold (int): The number of consecutive failures that open the circuit. Defaults to 5.
+            reset_timeout (float): The number of seconds the circuit stays open before a trial request. Defaults to 30.
+
+        Raises:
+            ValueError: If `failure_threshold` is not positive.
+        """
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be a positive integer.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+        self._trials: set[str] = set()
+        self._lock = threading.Lock()
+
+    def state(self, path: str) -> str:
+        """Return the state of the circuit of an endpoint: "closed", "open" or "half-open".
+
+        Args:
+            path (str): The API endpoint path.
+        """
+        with self._lock:
+            if path not in self._opened:
+                return "closed"
+            return "open" if time.monotonic() - self._opened[path] < self.reset_timeout else "half-open"
+
+    def check(self, path: str) -> None:
+        """Let a request to an endpoint through, or reject it if the endpoint's circuit is open.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial request already in flight.
+        """
+        with self._lock:
+            opened = self._opened.get(path)
+            if opened is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - opened)
+            if remaining <= 0 and path not in self._trials:
+                self._trials.add(path)
+                return
+        raise CircuitOpenError(
+            f"Circuit open for {path} after {self.failure_threshold} consecutive failures, retry in {max(remaining, 0):.0f}s"
+        )
+
+    def record(self, path: str, success: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            path (str): The API endpoint path.
+            success (bool): Whether the request succeeded. Server errors and timeouts count as failures.
+        """
+        with self._lock:
+            self._trials.discard(path)
+            if success:
+                self._failures.pop(path, None)
+                self._opened.pop(path, None)
+                return
+            failures = self._failures[path] = self._failures.get(path, 0) + 1
+            if failures >= self.failure_threshold or path in self._opened:
+                self._opened[path] = time.monotonic()
+
+    def release(self, path: str) -> None:
+        """Record a request whose outcome says nothing about the endpoint, leaving its circuit unchanged.
+
+        This is the case when the caller's deadline passed. A trial request ending this way lets another one through.
+
+        Args:
+            path (str): The API endpoint path.
+        """
+        with self._lock:
+            self._trials.discard(path)
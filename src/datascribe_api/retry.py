@@ -0,0 +1,260 @@
+"""Retry policies for the DataScribe API.
+
+This module provides the retry policy shared by the clients. It decides how often and how long to wait before
+retrying a failed request, spreading retries out with jitter so that many clients recovering from the same
+incident do not retry in lockstep. An optional retry budget caps retries at a fraction of the requests sent,
+and a hook receives the outcome of every attempt.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 4
+RETRY_BACKOFF_MAX = 120
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class RetryBudget:
+    """A thread-safe cap on retries as a fraction of the requests sent in a sliding window.
+
+    Retries are allowed while their number in the last `window` seconds stays below `ratio` times the number of
+    requests in that window, plus a reserve of `min_retries` so that sparse traffic can still retry. During an
+    outage, this keeps retries from multiplying the load on the API.
+
+    Attributes:
+        ratio (float): The fraction of requests that may be retried.
+        min_retries (int): The number of retries allowed per window regardless of traffic.
+        window (float): The length of the sliding window in seconds.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10) -> None:
+        """Initialize the budget with no recorded requests.
+
+        Args:
+            ratio (float): The fraction of requests that may be retried. Defaults to 0.2.
+            min_retries (int): The number of retries allowed per window regardless of traffic. Defaults to 10.
+            window (float): The length of the sliding window in seconds. Defaults to 10.
+
+        Raises:
+            ValueError: If a parameter is negative or `window` is not positive.
+        """
+        if ratio < 0 or min_retries < 0:
+            raise ValueError("ratio and min_retries must not be negative.")
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Forget the requests and retries that left the window."""
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def deposit(self) -> None:
+        """Record a request, earning `ratio` retries."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Spend a retry if the budget allows it.
+
+        Returns:
+            bool: Whether the retry may be made.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request, and reports every attempt.
+
+    The first retry is immediate. Later delays grow exponentially from `backoff_factor` up to `backoff_max`
+    and are spread with jitter, decorrelated by default: each delay is drawn between `backoff_factor` and three
+    times the previous delay. Jitter functions of the `backoff` package, such as `backoff.full_jitter`, can be
+    used instead, or None to use the exact exponential schedule of urllib3.
+
+    Every attempt is reported to `on_attempt` as a dict with the request `url`, the `attempt` number starting at
+    1, its `outcome`, the response `status` or the `error`, and the `delay` in seconds before the next attempt.
+    The outcome is one of:
+
+    - "response": a response was received and is returned.
+    - "retry": the attempt failed and is retried after `delay`.
+    - "exhausted": the attempt failed and no retries are left.
+    - "budget": the attempt failed and the retry budget is spent.
+    - "error": the attempt failed with an error that is not retried.
+
+    Example usage:
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.1), on_attempt=print)
+        client = DataScribeClient(retry_policy=policy)
+
+    Attributes:
+        total (int): The maximum number of retries of a request.
+        backoff_factor (float): The base delay in seconds of the exponential backoff.
+        backoff_max (float): The longest delay in seconds between two attempts.
+        jitter (str | Callable[[float], float] | None): "decorrelated", a function jittering an exponential
+            delay, or None.
+        statuses (tuple[int, ...]): The HTTP status codes that are retried.
+        budget (RetryBudget | None): The budget capping retries, or None for no cap.
+        on_attempt (Callable[[dict[str, Any]], None] | None): The hook called with the outcome of every attempt.
+    """
+
+    def __init__(
+        self,
+        total: int = RETRY_TOTAL,
+        backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+        jitter: str | Callable[[float], float] | None = "decorrelated",
+        statuses: tuple[int, ...] = RETRY_STATUSES,
+        budget: RetryBudget | None = None,
+        on_attempt: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            total (int): The maximum number of retries of a request. Defaults to 5.
+            backoff_factor (float): The base delay in seconds of the exponential backoff. Defaults to 4.
+            backoff_max (float): The longest delay in seconds between two attempts. Defaults to 120.
+            jitter (str | Callable[[float], float] | None): "decorrelated", a function jittering an exponential delay such as `backoff.full_jitter`, or None for no jitter. Defaults to "decorrelated".
+            statuses (tuple[int, ...]): The HTTP status codes that are retried. Defaults to 429, 502, 503 and 504.
+            budget (RetryBudget | None): The budget capping retries. Defaults to None (no cap).
+            on_attempt (Callable[[dict[str, Any]], None] | None): The hook called with the outcome of every attempt. Defaults to None.
+
+        Raises:
+            ValueError: If `total` is negative or `jitter` is an unknown string.
+        """
+        if total < 0:
+            raise ValueError("total must not be negative.")
+        if isinstance(jitter, str) and jitter != "decorrelated":
+            raise ValueError(f"Unknown jitter: {jitter}")
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.statuses = tuple(statuses)
+        self.budget = budget
+        self.on_attempt = on_attempt
+        self._stats = {"requests": 0, "attempts": 0, "retries": 0, "exhausted": 0, "budget": 0, "backoff_seconds": 0.0}
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int, previous: float = 0.0) -> float:
+        """Compute the delay before retrying a failed attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+            previous (float): The delay before the failed attempt, used by decorrelated jitter. Defaults to 0.
+
+        Returns:
+            float: The number of seconds to wait before the next attempt.
+        """
+        if attempt <= 1:
+            return 0.0
+        if self.jitter == "decorrelated":
+            return min(self.backoff_max, random.uniform(self.backoff_factor, max(self.backoff_factor, previous) * 3))
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        return float(delay if self.jitter is None else self.jitter(delay))
+
+    def begin(self) -> None:
+        """Record that a request is about to be sent, earning retry budget."""
+        with self._lock:
+            self._stats["requests"] += 1
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def allow_retry(self) -> bool:
+        """Spend a retry from the budget, if any.
+
+        Returns:
+            bool: Whether the retry may be made.
+        """
+        return self.budget is None or self.budget.withdraw()
+
+    def report(
+        self,
+        url: str,
+        attempt: int,
+        outcome: str,
+        status: int | None = None,
+        error: BaseException | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        """Record the outcome of an attempt and pass it to the `on_attempt` hook.
+
+        Args:
+            url (str): The URL of the request.
+            attempt (int): The number of the attempt, starting at 1.
+            outcome (str): "response", "retry", "exhausted", "budget" or "error".
+            status (int | None): The HTTP status of the response, if any. Defaults to None.
+            error (BaseException | None): The error of the attempt, if any. Defaults to None.
+            delay (float): The number of seconds before the next attempt. Defaults to 0.
+        """
+        with self._lock:
+            self._stats["attempts"] += 1
+            if outcome == "retry":
+                self._stats["retries"] += 1
+                self._stats["backoff_seconds"] += delay
+            elif outcome in ("exhausted", "budget"):
+                self._stats[outcome] += 1
+        if self.on_attempt is not None:
+            self.on_attempt(
+                {"url": url, "attempt": attempt, "outcome": outcome, "status": status, "error": error, "delay": delay}
+            )
+
+    def next_delay(
+        self,
+        url: str,
+        attempt: int,
+        previous: float = 0.0,
+        status: int | None = None,
+        error: BaseException | None = None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Decide whether to retry a failed attempt, and report the decision.
+
+        Args:
+            url (str): The URL of the request.
+            attempt (int): The number of the failed attempt, starting at 1.
+            previous (float): The delay before the failed attempt. Defaults to 0.
+            status (int | None): The HTTP status of the response, if any. Defaults to None.
+            error (BaseException | None): The error of the attempt, if any. Defaults to None.
+            retry_after (float | None): The number of seconds the API asked to wait, if any. Defaults to None.
+
+        Returns:
+            float | None: The number of seconds to wait before the next attempt, or None if it is not retried.
+        """
+        if attempt > self.total:
+            self.report(url, attempt, "exhausted", status, error)
+            return None
+        if not self.allow_retry():
+            self.report(url, attempt, "budget", status, error)
+            return None
+        delay = self.backoff(attempt, previous) if retry_after is None else retry_after
+        self.report(url, attempt, "retry", status, error, delay)
+        return delay
+
+    def stats(self) -> dict[str, float]:
+        """Report the retry activity so far.
+
+        Returns:
+            dict[str, float]: The number of `requests` and `attempts` made, the number of `retries`, of requests
+            that gave up because retries were `exhausted` or the `budget` was spent, and the total
+            `backoff_seconds` spent waiting between attempts.
+        """
+        with self._lock:
+            return dict(self._stats)
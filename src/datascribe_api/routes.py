@@ -1,6 +1,7 @@
 """Routes for the DataScribe API.
 
-This module defines the API endpoints and their corresponding models for the DataScribe API.
+This module defines the API endpoints and their corresponding models for the DataScribe API, as well as the
+default connect and read timeouts of each endpoint.
 """
 
 from datascribe_api.models import (
@@ -24,3 +25,19 @@ ROUTES = {
     "get_material_by_id": ("/materials", MaterialByIdResults, ["ids"]),
     "search_materials": ("/materials/search", MaterialSearchResults, []),
 }
+
+DEFAULT_TIMEOUT = (10.0, 600.0)
+
+# (connect, read) timeouts in seconds. Catalog and metadata lookups are quick, while row and material queries
+# may scan large tables.
+TIMEOUTS = {
+    "get_data_tables": (10.0, 60.0),
+    "get_data_table": (10.0, 600.0),
+    "get_data_tables_for_user": (10.0, 60.0),
+    "get_data_table_rows": (10.0, 600.0),
+    "get_data_table_columns": (10.0, 30.0),
+    "get_data_table_metadata": (10.0, 30.0),
+    "get_data_table_rows_count": (10.0, 120.0),
+    "get_material_by_id": (10.0, 300.0),
+    "search_materials": (10.0, 300.0),
+}
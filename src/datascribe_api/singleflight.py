@@ -0,0 +1,140 @@
+"""Request coalescing for the DataScribe API.
+
+This module lets concurrent callers that issue the same request share one in-flight call: the first caller
+makes the request and every caller that arrives before it completes receives its result or its exception.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls made from several threads.
+
+    Attributes:
+        calls (int): The number of calls that were made.
+        shared (int): The number of callers that received the result of another caller's call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        timeout: float | None = None,
+        share: Callable[[Any], Any] | None = None,
+        retry_on: tuple[type[BaseException], ...] = (),
+    ) -> Any:
+        """Call `func`, or wait for the in-flight call with the same key and share its outcome.
+
+        An exception of the other caller's call that is specific to that caller, such as its deadline passing, is
+        listed in `retry_on`. Instead of sharing it, the waiting caller then makes the call again, or joins a new
+        one, within what is left of its own `timeout`.
+
+        Args:
+            key (str): The identity of the call, e.g. the canonical key of a request.
+            func (Callable[[], Any]): The call to make if none with the same key is in flight.
+            timeout (float | None): The maximum number of seconds to wait for another caller's call. Defaults to None.
+            share (Callable[[Any], Any] | None): Applied to the result before it is handed to another caller, e.g. to
+                give each caller its own copy. Defaults to None (every caller receives the same object).
+            retry_on (tuple[type[BaseException], ...]): The exceptions of another caller's call that are not shared.
+                Defaults to () (every exception is shared).
+
+        Returns:
+            Any: The result of the call.
+
+        Raises:
+            TimeoutError: If another caller's call did not complete within `timeout`.
+            Exception: Whatever the call raised.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                    self.calls += 1
+                else:
+                    self.shared += 1
+            if leader:
+                break
+            try:
+                result = future.result(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except retry_on:
+                continue
+            return result if share is None else share(result)
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: str) -> None:
+        """Stop sharing the call with the given key with new callers."""
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Coalesces identical concurrent calls made from several tasks of one event loop.
+
+    The call runs in its own task, so cancelling one caller, e.g. when its deadline passes, does not cancel the
+    call for the others.
+
+    Attributes:
+        calls (int): The number of calls that were made.
+        shared (int): The number of callers that received the result of another caller's call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer with no calls in flight."""
+        self._calls: dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]], share: Callable[[Any], Any] | None = None) -> Any:
+        """Await `func()`, or the in-flight call with the same key, and return its outcome.
+
+        Args:
+            key (str): The identity of the call, e.g. the canonical key of a request.
+            func (Callable[[], Awaitable[Any]]): The coroutine function to call if none with the same key is in flight.
+            share (Callable[[Any], Any] | None): Applied to the result before it is handed to a caller that joined
+                the call, e.g. to give each caller its own copy. Defaults to None (every caller receives the same object).
+
+        Returns:
+            Any: The result of the call.
+
+        Raises:
+            Exception: Whatever the call raised.
+        """
+        task = self._calls.get(key)
+        joined = task is not None
+        if joined:
+            self.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._finish(key, task))
+            self.calls += 1
+        result = await asyncio.shield(task)
+        return share(result) if joined and share is not None else result
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Stop sharing a completed call, retrieving its exception in case every caller was cancelled."""
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()
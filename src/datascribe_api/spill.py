@@ -0,0 +1,184 @@
+"""Memory-bounded DataFrames for the DataScribe API.
+
+This module collects the DataFrame chunks of a table download while keeping them within a memory limit. Chunks
+are kept in memory until the limit is reached, and every later chunk is written to a Parquet or Feather file
+instead. The result is a ChunkedFrame, which reads the spilled chunks back one at a time.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from datascribe_api.columnar import concat_frames
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+SPILL_FORMATS = ("parquet", "feather")
+
+
+def write_chunk(df: pd.DataFrame, path: Path, extension: str) -> None:
+    """Write a DataFrame chunk to a Parquet or Feather file.
+
+    Args:
+        df (pd.DataFrame): The chunk.
+        path (Path): The file to write.
+        extension (str): "parquet" or "feather".
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("Spilling DataFrames to disk requires pyarrow. Install it with `pip install datascribe_api[arrow]`.")
+    if extension == "parquet":
+        df.to_parquet(path)
+    else:
+        df.reset_index(drop=True).to_feather(path)
+
+
+def read_chunk(path: Path, start: int) -> pd.DataFrame:
+    """Read a DataFrame chunk written by `write_chunk`, indexed by row position from `start`."""
+    df = pd.read_parquet(path) if path.suffix == ".parquet" else pd.read_feather(path)
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+class ChunkedFrame:
+    """A DataFrame held as a sequence of chunks, some in memory and some spilled to files.
+
+    Iterating yields the chunks as DataFrames in row order, reading spilled chunks back one at a time, so the
+    whole table never has to fit in memory. Use `to_pandas` to concatenate it once it does. The spilled files
+    are deleted by `close`, or on leaving a `with` block.
+
+    Attributes:
+        directory (Path | None): The directory holding the spilled chunks, or None if nothing was spilled.
+    """
+
+    def __init__(self, spill_dir: str | os.PathLike | None = None) -> None:
+        """Initialize an empty frame.
+
+        Args:
+            spill_dir (str | os.PathLike | None): The directory spilled chunks are written to. Defaults to None (a
+                temporary directory, deleted on close).
+        """
+        self.directory: Path | None = None
+        self._spill_dir = spill_dir
+        self._owned = False
+        self._chunks: list[pd.DataFrame | Path] = []
+        self._lengths: list[int] = []
+
+    def append(self, chunk: pd.DataFrame) -> None:
+        """Append a chunk held in memory."""
+        self._chunks.append(chunk)
+        self._lengths.append(len(chunk))
+
+    def spill(self, chunk: pd.DataFrame, name: str, extension: str) -> None:
+        """Append a chunk by writing it to `<name>.<extension>` in the spill directory.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if self.directory is None:
+            if self._spill_dir is None:
+                self.directory = Path(tempfile.mkdtemp(prefix="datascribe-spill-"))
+                self._owned = True
+            else:
+                self.directory = Path(self._spill_dir)
+                self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{name}.{extension}"
+        write_chunk(chunk, path, extension)
+        self._chunks.append(path)
+        self._lengths.append(len(chunk))
+
+    @property
+    def spilled(self) -> list[Path]:
+        """The files holding the spilled chunks, in row order."""
+        return [chunk for chunk in self._chunks if isinstance(chunk, Path)]
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return sum(self._lengths)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        """Iterate over the chunks in row order."""
+        start = 0
+        for chunk, length in zip(self._chunks, self._lengths, strict=True):
+            yield read_chunk(chunk, start) if isinstance(chunk, Path) else chunk
+            start += length
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Concatenate the chunks into one DataFrame."""
+        chunks = list(self)
+        return concat_frames(chunks) if chunks else pd.DataFrame()
+
+    def close(self) -> None:
+        """Delete the spilled chunks."""
+        for path in self.spilled:
+            path.unlink(missing_ok=True)
+        if self._owned and self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self._chunks = [chunk for chunk in self._chunks if not isinstance(chunk, Path)]
+        self._lengths = [len(chunk) for chunk in self._chunks]
+
+    def __enter__(self) -> ChunkedFrame:
+        """Context manager entry method for the ChunkedFrame."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit method for the ChunkedFrame. Deletes the spilled chunks."""
+        self.close()
+
+
+def collect_chunks(
+    chunks: Iterable[pd.DataFrame],
+    max_memory: int,
+    spill_dir: str | os.PathLike | None = None,
+    spill_format: str = "parquet",
+) -> ChunkedFrame:
+    """Collect DataFrame chunks, spilling them to files once they exceed a memory limit.
+
+    Chunks are kept in memory while their total deep memory usage stays within `max_memory` bytes. The first
+    chunk that would exceed it, and every chunk after it, is written to `chunk-<n>.<spill_format>` in
+    `spill_dir` instead.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The chunks, in row order.
+        max_memory (int): The maximum number of bytes of chunks kept in memory.
+        spill_dir (str | os.PathLike | None): The directory spilled chunks are written to. Defaults to None (a
+            temporary directory deleted when the frame is closed).
+        spill_format (str): "parquet" or "feather". Defaults to "parquet".
+
+    Returns:
+        ChunkedFrame: The collected chunks.
+
+    Raises:
+        ValueError: If `max_memory` is negative or `spill_format` is unsupported.
+        ImportError: If a chunk has to be spilled and pyarrow is not installed.
+    """
+    if max_memory < 0:
+        raise ValueError("max_memory must be a non-negative integer.")
+    if spill_format not in SPILL_FORMATS:
+        raise ValueError(f"Unsupported spill format: {spill_format}. Use one of: {', '.join(SPILL_FORMATS)}")
+    frame = ChunkedFrame(spill_dir)
+    in_memory = 0
+    spilling = False
+    try:
+        for number, chunk in enumerate(chunks):
+            if not spilling:
+                in_memory += int(chunk.memory_usage(deep=True).sum())
+                spilling = in_memory > max_memory
+            if spilling:
+                frame.spill(chunk, f"chunk-{number:06d}", spill_format)
+            else:
+                frame.append(chunk)
+    except BaseException:
+        frame.close()
+        raise
+    return frame
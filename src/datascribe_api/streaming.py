@@ -0,0 +1,135 @@
+"""Streaming JSON decoding for the DataScribe API.
+
+This module decodes the `data` array of large API responses incrementally, so rows can be handed to a model or
+DataFrame builder while the body is still arriving, without first holding the whole body and every decoded row
+in memory.
+"""
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+
+from datascribe_api.columnar import records_to_columns
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """A text buffer fed from an iterator of byte or text chunks."""
+
+    def __init__(self, chunks: Iterable[bytes | str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, returning False once the input is exhausted."""
+        if self.exhausted:
+            return False
+        if self.pos > STREAM_CHUNK_SIZE:
+            self.text = self.text[self.pos :]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.text += text
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end of the input."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.text, self.pos)
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk.
+            if isinstance(value, int | float) and end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes | str], key: str = "data", fields: dict[str, Any] | None = None) -> Iterator[Any]:
+    """Decode the elements of an array stored under `key` in a JSON object, one at a time.
+
+    Args:
+        chunks (Iterable[bytes | str]): The body of the JSON document, in chunks of any size.
+        key (str): The top-level key holding the array. Defaults to "data".
+        fields (dict[str, Any] | None): A dict that receives the other top-level fields of the object, as well
+            as `key` itself if its value is not an array.
+
+    Yields:
+        Any: The decoded elements of the array.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON or is not an object.
+    """
+    fields = {} if fields is None else fields
+    buffer = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        name = buffer.value(decoder)
+        buffer.expect(":")
+        if name == key and buffer.peek() == "[":
+            buffer.pos += 1
+            if buffer.peek() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    yield buffer.value(decoder)
+                    if buffer.peek() == "]":
+                        buffer.pos += 1
+                        break
+                    buffer.expect(",")
+        else:
+            fields[name] = buffer.value(decoder)
+        if buffer.peek() == "}":
+            return
+        buffer.expect(",")
+
+
+def records_to_dataframe(records: Iterable[dict[str, Any]]) -> pd.DataFrame:
+    """Build a DataFrame from records as they arrive, storing them column by column.
+
+    Unlike `pd.DataFrame(list_of_dicts)`, the records are never held as a list of dicts.
+
+    Args:
+        records (Iterable[dict[str, Any]]): The records, e.g. from `DataScribeClient.stream_table_rows(..., raw=True)`.
+
+    Returns:
+        pd.DataFrame: The records as a DataFrame, with columns in order of first appearance.
+    """
+    return pd.DataFrame(records_to_columns(records))
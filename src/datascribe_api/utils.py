@@ -3,36 +3,491 @@
 This module provides utility functions for DataScribe API interactions.
 """
 
+import contextlib
+import socket
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any
+
 import requests
-from requests import Session
+from requests import HTTPError, Response, Session, Timeout
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import MaxRetryError, ResponseError
 from urllib3.util import Retry
 
+from datascribe_api.codec import DEFAULT_CODEC, JSONCodec
+from datascribe_api.filter import Filter
+from datascribe_api.lazy import LAZY_FIELDS, build_lazy_model
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.routes import DEFAULT_TIMEOUT, ROUTES, TIMEOUTS
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+KEEPALIVE_IDLE = 60
+
+_deadline: ContextVar[float | None] = ContextVar("datascribe_deadline", default=None)
+_measurement: ContextVar[dict[str, int] | None] = ContextVar("datascribe_measurement", default=None)
+
+
+class DeadlineExceeded(Timeout):
+    """Raised when a call to the DataScribe API does not complete within its deadline."""
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Bound the total time of the requests made within the block, including retries and backoff.
+
+    Nested scopes can only shorten the deadline of the enclosing one.
+
+    Args:
+        seconds (float | None): The maximum number of seconds, or None to keep the enclosing deadline.
+
+    Yields:
+        None
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    if (current := _deadline.get()) is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Return the number of seconds left before the current deadline.
+
+    Returns:
+        float | None: The remaining time, or None if no deadline is set.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Deadline exceeded before the request to the DataScribe API completed.")
+    return remaining
+
+
+@contextlib.contextmanager
+def measure_responses() -> Iterator[dict[str, int]]:
+    """Count the responses received from the DataScribe API within the block, and their size in bytes.
+
+    Only responses actually received are counted, so cached responses and requests answered by an identical
+    request of another thread are not.
+
+    Yields:
+        dict[str, int]: The number of `responses` and their total `bytes`, updated as responses arrive.
+    """
+    counts = {"responses": 0, "bytes": 0}
+    token = _measurement.set(counts)
+    try:
+        yield counts
+    finally:
+        _measurement.reset(token)
+
+
+def record_response(nbytes: int) -> None:
+    """Add a received response of `nbytes` bytes to the current `measure_responses` block, if any."""
+    if (counts := _measurement.get()) is not None:
+        counts["responses"] += 1
+        counts["bytes"] += nbytes
+
+
+def resolve_timeouts(timeouts: dict[str, float | tuple[float, float]] | None = None) -> dict[str, tuple[float, float]]:
+    """Build the (connect, read) timeouts of every endpoint path.
+
+    Args:
+        timeouts (dict[str, float | tuple[float, float]] | None): Overrides keyed by endpoint name, e.g.
+            "get_data_table_metadata". A single number sets the read timeout and keeps the default connect timeout.
+
+    Returns:
+        dict[str, tuple[float, float]]: The timeouts keyed by endpoint path.
+
+    Raises:
+        ValueError: If `timeouts` names an unknown endpoint.
+    """
+    unknown = [name for name in timeouts or {} if name not in ROUTES]
+    if unknown:
+        raise ValueError(f"Unknown endpoints in timeouts: {', '.join(unknown)}")
+    resolved = {}
+    for name, (path, _, _) in ROUTES.items():
+        connect, read = TIMEOUTS.get(name, DEFAULT_TIMEOUT)
+        override = (timeouts or {}).get(name)
+        if isinstance(override, int | float):
+            read = float(override)
+        elif override is not None:
+            connect, read = override
+        resolved[path] = (connect, read)
+    return resolved
+
+
+def is_deadline_expiry(error: BaseException) -> bool:
+    """Return whether a failed request ran out of the caller's time rather than failing on its own.
+
+    This is a DeadlineExceeded, or a timeout raised once the deadline, which caps the timeouts of every request, has
+    passed.
+
+    Args:
+        error (BaseException): The exception raised by the request.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return True
+    if not isinstance(error, Timeout):
+        return False
+    try:
+        remaining_time()
+    except DeadlineExceeded:
+        return True
+    return False
+
+
+def request_timeout(timeout: tuple[float, float]) -> tuple[float, float]:
+    """Cap a (connect, read) timeout at the time left before the current deadline.
+
+    Args:
+        timeout (tuple[float, float]): The timeout of the endpoint.
+
+    Returns:
+        tuple[float, float]: The timeout to use for the next request.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return min(timeout[0], remaining), min(timeout[1], remaining)
+
+
+class DeadlineRetry(Retry):
+    """A urllib3 Retry that follows a RetryPolicy and gives up instead of backing off past the current deadline.
+
+    Attributes:
+        policy (RetryPolicy | None): The policy computing the delays, spending the retry budget and reporting
+            attempts, or None to use urllib3's own backoff.
+        delay (float): The delay in seconds before the next attempt, computed when the attempt failed.
+    """
+
+    def __init__(self, *args: Any, policy: RetryPolicy | None = None, delay: float = 0.0, **kwargs: Any) -> None:
+        """Initialize the retry state.
+
+        Args:
+            *args: Arguments passed to Retry, e.g. `total`.
+            policy (RetryPolicy | None): The retry policy. Defaults to None.
+            delay (float): The delay in seconds before the next attempt. Defaults to 0.
+            **kwargs: Keyword arguments passed to Retry, e.g. `status_forcelist`.
+        """
+        super().__init__(*args, **kwargs)
+        self.policy = policy
+        self.delay = delay
+
+    def new(self, **kw: Any) -> "DeadlineRetry":
+        """Copy the retry state with updated counters, keeping the policy and the delay."""
+        kw.setdefault("policy", self.policy)
+        kw.setdefault("delay", self.delay)
+        return super().new(**kw)
+
+    def get_backoff_time(self) -> float:
+        """Return the delay before the next attempt, as computed by the policy."""
+        if self.policy is None:
+            return super().get_backoff_time()
+        return self.delay
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> "DeadlineRetry":
+        """Record a failed attempt, computing the delay before the next one and reporting it to the policy.
+
+        Raises:
+            MaxRetryError: If no retries are left or the retry budget is spent.
+        """
+        policy = self.policy
+        if policy is None or (response is not None and response.get_redirect_location()):
+            return super().increment(method, url, response, error, _pool, _stacktrace)
+        attempt = len(self.history) + 1
+        status = response.status if response is not None else None
+        if _pool is not None:
+            url = f"{_pool.scheme}://{_pool.host}:{_pool.port}{url}"
+        try:
+            new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        except MaxRetryError:
+            policy.report(url, attempt, "exhausted", status, error)
+            raise
+        except Exception:
+            policy.report(url, attempt, "error", status, error)
+            raise
+        if not policy.allow_retry():
+            policy.report(url, attempt, "budget", status, error)
+            reason = error or ResponseError(ResponseError.SPECIFIC_ERROR.format(status_code=status))
+            raise MaxRetryError(_pool, url, reason) from reason
+        new_retry.delay = policy.backoff(attempt, self.delay)
+        retry_after = self.get_retry_after(response) if response is not None and self.respect_retry_after_header else None
+        policy.report(url, attempt, "retry", status, error, new_retry.delay if retry_after is None else retry_after)
+        return new_retry
+
+    def sleep(self, response: Any = None) -> None:
+        """Sleep before the next attempt, unless the deadline would pass first.
+
+        Raises:
+            DeadlineExceeded: If the backoff would end after the deadline.
+        """
+        remaining = remaining_time()
+        if remaining is not None:
+            backoff = self.get_backoff_time()
+            if response is not None and self.respect_retry_after_header:
+                backoff = max(backoff, self.get_retry_after(response) or 0)
+            if backoff >= remaining:
+                raise DeadlineExceeded("Deadline exceeded while waiting to retry the request to the DataScribe API.")
+        super().sleep(response)
+
 
-def retry_session() -> Session:
+def keepalive_socket_options(idle: int = KEEPALIVE_IDLE) -> list[tuple[int, int, int]]:
+    """Return socket options enabling TCP keep-alive probes on idle connections.
+
+    Probes keep pooled connections from being silently dropped by load balancers and NAT gateways, so they
+    can be reused instead of paying for a new TLS handshake. Options unsupported by the platform are skipped.
+
+    Args:
+        idle (int): The number of idle seconds before the first probe is sent. Defaults to 60.
+
+    Returns:
+        list[tuple[int, int, int]]: The socket options, including urllib3's defaults.
+    """
+    options = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPALIVE", idle), ("TCP_KEEPINTVL", idle // 4 or 1), ("TCP_KEEPCNT", 4)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PoolAdapter(HTTPAdapter):
+    """An HTTPAdapter whose connection pools can enable TCP keep-alive on their sockets."""
+
+    def __init__(self, keepalive: bool = True, **kwargs: Any) -> None:
+        """Initialize the adapter.
+
+        Args:
+            keepalive (bool): Enable TCP keep-alive probes on pooled connections. Defaults to True.
+            **kwargs: Arguments passed to HTTPAdapter, e.g. `pool_maxsize` or `max_retries`.
+        """
+        self.keepalive = keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager, adding the keep-alive socket options when enabled."""
+        if self.keepalive:
+            kwargs.setdefault("socket_options", keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        """Send a request, reporting it and its final attempt to the retry policy, if any.
+
+        A response whose status the policy retries is only returned when urllib3 leaves that status to the caller,
+        e.g. to the rate limiter of DataScribeClient, so its outcome is reported by the caller instead.
+        """
+        policy = getattr(self.max_retries, "policy", None)
+        if policy is None:
+            return super().send(request, *args, **kwargs)
+        policy.begin()
+        resp = super().send(request, *args, **kwargs)
+        retries = getattr(resp.raw, "retries", None)
+        attempt = len(retries.history) + 1 if retries is not None else 1
+        if resp.status_code not in policy.statuses:
+            policy.report(request.url, attempt, "response", resp.status_code)
+        return resp
+
+
+def retry_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    pool_block: bool = False,
+    keepalive: bool = True,
+    retry_statuses: tuple[int, ...] | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> Session:
     """Create a requests session with automatic retry logic for transient errors.
 
-    The session will retry failed requests up to 5 times with exponential backoff (factor=4)
-    for the following HTTP status codes: 429, 502, 503, 504, and for connection errors.
-    Retries are handled using urllib3's Retry and requests' HTTPAdapter.
+    The session retries connection errors and the HTTP status codes of the retry policy, by default up to 5
+    times with jittered exponential backoff for 429, 502, 503 and 504. Retries are handled using urllib3's
+    Retry and requests' HTTPAdapter, and every attempt is reported to the policy.
+
+    Each host gets a pool of up to `pool_maxsize` connections that are kept alive between requests. Size it to
+    at least the number of threads sharing the session, otherwise surplus connections are discarded after use.
+
+    Args:
+        pool_connections (int): The number of per-host connection pools to keep. Defaults to 4.
+        pool_maxsize (int): The maximum number of connections kept per host. Defaults to 32.
+        pool_block (bool): Wait for a free connection instead of opening a surplus one when a pool is exhausted. Defaults to False.
+        keepalive (bool): Enable TCP keep-alive probes on pooled connections. Defaults to True.
+        retry_statuses (tuple[int, ...] | None): The HTTP status codes that are retried. Defaults to the statuses of the retry policy.
+        retry_policy (RetryPolicy | None): The retry policy. Defaults to a RetryPolicy with default settings.
 
     Returns:
         Session: A requests session with retry logic enabled.
     """
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=4,
-        status_forcelist=[
-            429,
-            502,
-            503,
-            504,
-        ],
+    policy = retry_policy or RetryPolicy()
+    if retry_statuses is None:
+        retry_statuses = policy.statuses
+    retry_strategy = DeadlineRetry(
+        total=policy.total,
+        backoff_factor=policy.backoff_factor,
+        backoff_max=policy.backoff_max,
+        status_forcelist=list(retry_statuses),
+        policy=policy,
+        # Otherwise urllib3 also retries 429 and 503 responses carrying a Retry-After header.
+        respect_retry_after_header=429 in retry_statuses,
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = PoolAdapter(
+        keepalive=keepalive,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry_strategy,
+    )
 
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
+
+
+def pool_stats(session: Session) -> list[dict[str, Any]]:
+    """Report the utilization of the connection pools of a session.
+
+    Args:
+        session (Session): The session to inspect.
+
+    Returns:
+        list[dict[str, Any]]: One entry per host pool with its `host`, `maxsize`, the number of connections
+        `in_use` and `idle`, and the total `connections` opened and `requests` sent through it.
+    """
+    stats = []
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in pools.keys():  # noqa: SIM118 - RecentlyUsedContainer is not iterable
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            stats.append(
+                {
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                    "in_use": (pool.pool.maxsize - len(queued)) if pool.pool is not None else 0,
+                    "idle": sum(conn is not None for conn in queued),
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+    return stats
+
+
+def prepare_params(params: dict[str, Any], codec: JSONCodec = DEFAULT_CODEC) -> dict[str, Any]:
+    """Convert the keyword arguments of an endpoint call into query parameters.
+
+    Filters are serialized to JSON and list-valued `ids`, `providers` and `elements` are joined with commas.
+
+    Args:
+        params (dict[str, Any]): The keyword arguments passed to the endpoint. The dict is updated in place.
+        codec (JSONCodec): The codec used to encode the filters. Defaults to the fastest installed codec.
+
+    Returns:
+        dict[str, Any]: The query parameters for the request.
+
+    Raises:
+        TypeError: If the filters cannot be serialized.
+    """
+    if (filters := params.get("filters")) is not None:
+        try:
+            serialized = Filter.serialize(filters)
+        except Exception as e:
+            raise TypeError(f"Invalid filters: {e}") from e
+        params["filters"] = codec.dumps(serialized)
+
+    if ids := params.pop("ids", None):
+        params["ids"] = ",".join(ids) if isinstance(ids, list) else ids
+
+    if providers := params.get("providers"):
+        params["providers"] = ",".join(providers) if isinstance(providers, list) else providers
+
+    if elements := params.get("elements"):
+        params["elements"] = ",".join(elements) if isinstance(elements, list) else elements
+
+    return params
+
+
+def http_error(status_code: int, body: Any, default: str) -> HTTPError:
+    """Build the HTTPError raised for a failed API response.
+
+    Args:
+        status_code (int): The HTTP status code of the response.
+        body (Any): The decoded JSON body of the response.
+        default (str): The message to use when the body does not carry one.
+
+    Returns:
+        HTTPError: The error describing the failed request, whose `response` carries the status code.
+    """
+    message = None
+    if isinstance(body, dict):
+        message = body.get("message") or body.get("data")
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(f"HTTP Error {status_code} - {message or default}", response=response)
+
+
+def build_model(model: Any, resp: Any, lazy: bool = False) -> Any:
+    """Map a decoded API response onto its model.
+
+    Args:
+        model (Any): The model class registered for the endpoint in ROUTES.
+        resp (Any): The decoded JSON response.
+        lazy (bool): Validate the items of list models (rows, tables and materials) only when they are accessed.
+            Defaults to False.
+
+    Returns:
+        Any: The model instance built from the response data.
+
+    Raises:
+        ValueError: If the API reports that the request failed.
+    """
+    resp = response_data(resp)
+    if lazy and model in LAZY_FIELDS:
+        return build_lazy_model(model, resp)
+    return model(resp) if isinstance(resp, list) else model(**resp)
+
+
+def response_data(resp: Any) -> Any:
+    """Return the `data` of a decoded API response.
+
+    Args:
+        resp (Any): The decoded JSON response.
+
+    Returns:
+        Any: The response data, or the whole response if it has no `data` key.
+
+    Raises:
+        ValueError: If the API reports that the request failed.
+    """
+    if resp.get("success") is False:
+        raise ValueError(f"API request failed: {resp.get('message', 'Unknown error')}")
+    return resp.get("data", resp)
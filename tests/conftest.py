@@ -0,0 +1,122 @@
+"""Shared fixtures for the testing suite.
+
+This module provides a local HTTP server that mimics the DataScribe API for tests that exercise the real
+networking stack of the clients without requiring API access.
+"""
+
+import json
+import operator
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "is null": lambda value, _: value is None,
+    "is not null": lambda value, _: value is not None,
+}
+
+
+class LocalAPI:
+    """A local stand-in for the DataScribe API serving one in-memory table.
+
+    Attributes:
+        rows (list[dict]): The rows of the table.
+        columns (list[dict]): The columns of the table, as returned by `get_data_table_columns`.
+        requests (list[tuple[str, dict]]): The path and query parameters of every request received.
+        responses (list[tuple[int, dict, dict]]): Queued status, body and headers returned before regular responses.
+        delay (float): The number of seconds each response is delayed by.
+        delays (list[float]): Queued delays applied, in order, to the next responses instead of `delay`.
+    """
+
+    def __init__(self, total_rows: int = 100) -> None:
+        """Create the API with a table of `total_rows` rows."""
+        self.rows = [{"id": i, "name": f"row-{i}"} for i in range(total_rows)]
+        self.columns = [
+            {"column_name": "id", "data_type": "integer", "is_nullable": "NO"},
+            {"column_name": "name", "data_type": "text", "is_nullable": "YES"},
+        ]
+        self.requests: list[tuple[str, dict]] = []
+        self.responses: list[tuple[int, dict, dict]] = []
+        self.delay = 0.0
+        self.delays: list[float] = []
+        self.lock = threading.Lock()
+        self.server: ThreadingHTTPServer | None = None
+
+    @property
+    def base(self) -> str:
+        """The base URL of the server."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def matching_rows(self, params: dict) -> list[dict]:
+        """Return the rows matching the comparison filters of a request."""
+        filters = json.loads(params.get("filters", "[]"))
+        filters = [filters] if isinstance(filters, dict) else filters
+        return [
+            row
+            for row in self.rows
+            if all(
+                (row[f["column"]] is not None or f["operator"] in ("is null", "is not null"))
+                and OPERATORS[f["operator"]](row[f["column"]], f["value"])
+                for f in filters
+            )
+        ]
+
+    def respond(self, path: str, params: dict) -> tuple[int, dict, dict]:
+        """Build the status, body and headers of the response to a request."""
+        with self.lock:
+            self.requests.append((path, params))
+            if self.responses:
+                return self.responses.pop(0)
+        rows = self.matching_rows(params)
+        if path == "/data/data-table-rows-count":
+            return 200, {"success": True, "data": {"total_rows": len(rows)}}, {}
+        if path == "/data/data-table-columns":
+            return 200, {"success": True, "data": {"table_name": "t", "display_name": "T", "columns": self.columns}}, {}
+        start, size = int(params.get("startingRow", 0)), int(params.get("numRows", 100))
+        return 200, {"success": True, "data": rows[start : start + size]}, {}
+
+
+@pytest.fixture
+def local_api():
+    """Run a LocalAPI on an ephemeral localhost port for the duration of a test."""
+    api = LocalAPI()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - name required by BaseHTTPRequestHandler
+            url = urlparse(self.path)
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            status, body, headers = api.respond(url.path, params)
+            with api.lock:
+                delay = api.delays.pop(0) if api.delays else api.delay
+            if delay:
+                threading.Event().wait(delay)
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    api.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    api.server.daemon_threads = True
+    thread = threading.Thread(target=api.server.serve_forever, daemon=True)
+    thread.start()
+    yield api
+    api.server.shutdown()
+    api.server.server_close()
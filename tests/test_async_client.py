@@ -0,0 +1,138 @@
+"""Testing suite for the async client module.
+
+This module contains unittests for the AsyncDataScribeClient. The request handling is exercised against an
+in-process httpx transport, and the endpoints are exercised against the live API when a token is available.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from requests.exceptions import HTTPError
+
+from datascribe_api import AsyncDataScribeClient
+from datascribe_api.filter import Filter
+from datascribe_api.models import DataTableRows, DataTables
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.routes import ROUTES
+
+httpx = pytest.importorskip("httpx")
+
+API_TOKEN: str | None = os.environ.get("DATASCRIBE_API_TOKEN")
+
+
+def make_client(handler) -> AsyncDataScribeClient:
+    """Create an AsyncDataScribeClient whose requests are served by the given handler."""
+    client = AsyncDataScribeClient(api_key="test-key", base="https://example.test/")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncDataScribeClientOffline:
+    """Unit tests for the AsyncDataScribeClient that do not require API access."""
+
+    def test_maps_response_to_model_and_serializes_params(self) -> None:
+        """Ensure query parameters are prepared like the sync client and the response is mapped to its model."""
+        seen = {}
+
+        def handler(request):
+            seen.update(request.url.params)
+            return httpx.Response(200, json={"success": True, "data": [{"id": 1}, {"id": 2}]})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_data_table_rows(tableName="t", columns=["id"], filters=Filter("id") > 0)
+
+        rows = asyncio.run(run())
+        assert isinstance(rows, DataTableRows)
+        assert len(rows) == 2
+        assert seen["tableName"] == "t"
+        assert json.loads(seen["filters"]) == {"column": "id", "operator": ">", "value": 0}
+
+    def test_raises_http_error_with_api_message(self) -> None:
+        """Ensure error responses are raised as HTTPError carrying the API message."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(404, json={"message": "Table not found"})) as client:
+                await client.get_data_table(tableName="missing")
+
+        with pytest.raises(HTTPError, match="HTTP Error 404 - Table not found"):
+            asyncio.run(run())
+
+    def test_retries_transient_status(self) -> None:
+        """Ensure transient statuses are retried before the response is returned."""
+        policy = RetryPolicy(backoff_factor=0)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, json={})
+            return httpx.Response(200, json={"success": True, "data": {"total_rows": 7}})
+
+        async def run():
+            async with make_client(handler) as client:
+                client._retry_policy = policy
+                return await client.get_data_table_rows_count(tableName="t")
+
+        assert asyncio.run(run()).total_rows == 7
+        assert len(calls) == 3
+        assert policy.stats()["retries"] == 2
+
+    def test_deadline_raises_timeout_error(self) -> None:
+        """Ensure a call exceeding its deadline raises TimeoutError."""
+
+        async def handler(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"success": True, "data": []})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.get_data_tables_for_user(deadline=0.01)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
+
+    def test_missing_required_param(self) -> None:
+        """Ensure missing required parameters raise a ValueError."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(200, json={})) as client:
+                await client.get_data_table()
+
+        with pytest.raises(ValueError, match="Missing required parameters"):
+            asyncio.run(run())
+
+    def test_dir_lists_routes(self) -> None:
+        """Ensure __dir__ includes every endpoint defined in ROUTES."""
+        client = AsyncDataScribeClient(api_key="test-key")
+        assert set(ROUTES.keys()).issubset(dir(client))
+        asyncio.run(client.close())
+
+
+@pytest.mark.skipif(not API_TOKEN, reason="DATASCRIBE_API_TOKEN not set in environment")
+class TestAsyncDataScribeClient:
+    """Unit tests for the AsyncDataScribeClient API."""
+
+    def test_get_data_tables_for_user(self) -> None:
+        """Test retrieving all data tables for the user."""
+
+        async def run():
+            async with AsyncDataScribeClient(api_key=API_TOKEN) as client:
+                return await client.get_data_tables_for_user()
+
+        tables = asyncio.run(run())
+        assert isinstance(tables, DataTables)
+
+    def test_concurrent_requests(self) -> None:
+        """Test issuing several requests concurrently from one client."""
+
+        async def run():
+            async with AsyncDataScribeClient(api_key=API_TOKEN) as client:
+                tables = await client.get_data_tables_for_user()
+                table_name = tables[-2].table_name
+                return await asyncio.gather(*(client.get_data_table(tableName=table_name, numRows=5) for _ in range(3)))
+
+        results = asyncio.run(run())
+        assert all(isinstance(rows, DataTableRows) for rows in results)
@@ -0,0 +1,164 @@
+"""Testing suite for the autotune module.
+
+This module contains unittests for the page-size tuner and for the auto page sizes of the row pagination of the
+DataScribeClient, which are exercised against a local server so these tests do not require API access.
+"""
+
+import pytest
+from requests import Timeout
+
+from datascribe_api import DataScribeClient
+from datascribe_api.autotune import PageSizeTuner, is_overload, resolve_tuner
+from datascribe_api.utils import http_error, record_response
+
+ERROR = (500, {"success": False, "message": "statement timeout"}, {})
+
+
+class TestPageSizeTuner:
+    """Unit tests for PageSizeTuner."""
+
+    def test_grows_while_throughput_improves(self) -> None:
+        """Ensure the size grows after fast pages, and holds once a larger page is no faster per row."""
+        tuner = PageSizeTuner(initial=100, max_size=1000)
+        tuner.observe(100, 0.1)
+        assert tuner.size == 200  # noqa: PLR2004
+        tuner.observe(200, 0.1)
+        assert tuner.size == 400  # noqa: PLR2004
+        tuner.observe(400, 0.4)
+        assert tuner.size == 400  # noqa: PLR2004
+        tuner.observe(400, 0.01)
+        assert tuner.size == 800  # noqa: PLR2004
+        tuner.observe(800, 0.01)
+        assert tuner.size == 1000  # noqa: PLR2004
+
+    def test_shrinks_toward_target_latency(self) -> None:
+        """Ensure a slow page shrinks the size to the rows expected within the target latency."""
+        tuner = PageSizeTuner(initial=1000, target_latency=2.0)
+        tuner.observe(1000, 4.0)
+        assert tuner.size == 500  # noqa: PLR2004
+        tuner.observe(500, 100.0)
+        assert tuner.size == tuner.min_size
+
+    def test_caps_response_size(self) -> None:
+        """Ensure the size does not grow past the rows expected to fit in `max_bytes`."""
+        tuner = PageSizeTuner(initial=100, max_bytes=1000)
+        tuner.observe(100, 0.01, nbytes=500)
+        assert tuner.size == 200  # noqa: PLR2004
+        tuner.observe(200, 0.001, nbytes=1000)
+        assert tuner.size == 200  # noqa: PLR2004
+        tuner.observe(200, 0.001, nbytes=4000)
+        assert tuner.size == 50  # noqa: PLR2004
+
+    def test_failure_halves_size(self) -> None:
+        """Ensure failures halve the size down to the minimum."""
+        tuner = PageSizeTuner(initial=40, min_size=15)
+        tuner.failure()
+        assert tuner.size == 20  # noqa: PLR2004
+        tuner.failure()
+        assert tuner.size == 15  # noqa: PLR2004
+        assert tuner.stats()["failures"] == 2  # noqa: PLR2004
+
+    def test_call_records_received_responses(self) -> None:
+        """Ensure pages are recorded with their response bytes, and pages served without a request are not."""
+        tuner = PageSizeTuner()
+
+        def fetch() -> list[int]:
+            record_response(300)
+            return [1, 2, 3]
+
+        assert tuner.call(lambda: [1, 2]) == [1, 2]
+        assert tuner.stats()["pages"] == 0
+        assert tuner.call(fetch) == [1, 2, 3]
+        stats = tuner.stats()
+        assert (stats["pages"], stats["rows"], stats["bytes"]) == (1, 3, 300)
+
+    def test_call_records_overload(self) -> None:
+        """Ensure timeouts shrink the size, while other errors leave it unchanged."""
+        tuner = PageSizeTuner(initial=100)
+
+        def fail(error: Exception) -> None:
+            raise error
+
+        with pytest.raises(ValueError):
+            tuner.call(lambda: fail(ValueError("bad filter")))
+        assert tuner.size == 100  # noqa: PLR2004
+        with pytest.raises(Timeout):
+            tuner.call(lambda: fail(Timeout()))
+        assert tuner.size == 50  # noqa: PLR2004
+
+    def test_rejects_invalid_bounds(self) -> None:
+        """Ensure unordered sizes and a growth factor of at most 1 are refused."""
+        with pytest.raises(ValueError, match="min_size"):
+            PageSizeTuner(initial=5, min_size=10)
+        with pytest.raises(ValueError, match="growth"):
+            PageSizeTuner(growth=1)
+
+
+class TestHelpers:
+    """Unit tests for is_overload and resolve_tuner."""
+
+    def test_is_overload(self) -> None:
+        """Ensure timeouts and server errors count as overload, while client errors do not."""
+        assert is_overload(Timeout())
+        assert is_overload(http_error(500, {}, "Internal Server Error"))
+        assert not is_overload(http_error(404, {}, "Not Found"))
+        assert not is_overload(ValueError())
+
+    def test_resolve_tuner(self) -> None:
+        """Ensure "auto" creates a tuner, tuners are kept, and fixed sizes are validated."""
+        tuner = PageSizeTuner()
+        assert isinstance(resolve_tuner("auto"), PageSizeTuner)
+        assert resolve_tuner(tuner) is tuner
+        assert resolve_tuner(100) is None
+        with pytest.raises(ValueError, match="page_size must be a positive integer or 'auto'"):
+            resolve_tuner(0)
+        with pytest.raises(ValueError, match="size must be"):
+            resolve_tuner("large", "size")
+
+
+class TestAutoPagination:
+    """Integration tests for the auto page sizes of the row pagination of DataScribeClient."""
+
+    def test_iter_table_rows_grows_pages(self, local_api) -> None:
+        """Ensure fast pages grow the page size while every row is still yielded once, in order."""
+        tuner = PageSizeTuner(initial=5, min_size=5)
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = list(client.iter_table_rows(tableName="t", columns=["id", "name"], page_size=tuner, prefetch=0))
+        assert [row.model_dump() for row in rows] == local_api.rows
+        sizes = [int(params["numRows"]) for _, params in local_api.requests]
+        assert sizes[0] == 5  # noqa: PLR2004
+        assert max(sizes) > 5  # noqa: PLR2004
+        assert tuner.stats()["rows"] == len(local_api.rows)
+
+    def test_iter_table_rows_splits_failed_page(self, local_api) -> None:
+        """Ensure a page failing with a server error is requested again as smaller pages."""
+        local_api.responses = [ERROR]
+        tuner = PageSizeTuner(initial=40, min_size=5)
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = list(client.iter_table_rows(tableName="t", columns=["id", "name"], page_size=tuner, prefetch=0))
+        assert [row.model_dump() for row in rows] == local_api.rows
+        requested = [(int(params["startingRow"]), int(params["numRows"])) for _, params in local_api.requests]
+        assert requested[:3] == [(0, 40), (0, 20), (20, 20)]
+        assert tuner.stats()["failures"] == 1
+
+    def test_failure_at_minimum_size_raises(self, local_api) -> None:
+        """Ensure a page that fails at the minimum size is not retried."""
+        local_api.responses = [ERROR]
+        tuner = PageSizeTuner(initial=10, min_size=10)
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client, pytest.raises(Exception, match="500"):
+            list(client.iter_table_rows(tableName="t", columns=["id", "name"], page_size=tuner, prefetch=0))
+
+    def test_iter_keyset_auto(self, local_api) -> None:
+        """Ensure keyset pages use the tuner's size and retry a failed page with a smaller one."""
+        local_api.responses = [ERROR]
+        tuner = PageSizeTuner(initial=40, min_size=5)
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = list(client.iter_keyset(tableName="t", columns=["id", "name"], key="id", page_size=tuner))
+        assert [row.id for row in rows] == [row["id"] for row in local_api.rows]
+        assert [int(params["numRows"]) for _, params in local_api.requests[:2]] == [40, 20]
+
+    def test_iter_dataframes_auto(self, local_api) -> None:
+        """Ensure DataFrame chunks accept the auto page size."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.to_dataframe(tableName="t", columns=["id", "name"], page_size="auto")
+        assert df.to_dict("records") == local_api.rows
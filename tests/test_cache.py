@@ -0,0 +1,347 @@
+"""Testing suite for the cache module.
+
+This module tests the ResponseCache and its use by the DataScribeClient. HTTP responses are served by a stub
+session, so these tests do not require API access.
+"""
+
+import json
+import multiprocessing
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response
+
+from datascribe_api import DataScribeClient
+from datascribe_api.cache import BaseCache, DiskCache, ResponseCache, TieredCache, canonical_key
+from datascribe_api.filter import Filter
+from datascribe_api.utils import prepare_params
+
+COLUMNS_PATH = "/data/data-table-columns"
+ROWS_PATH = "/data/data-table-rows"
+
+
+def make_response(payload: dict, status_code: int = 200) -> Response:
+    """Build a requests Response carrying a JSON payload."""
+    resp = Response()
+    resp.status_code = status_code
+    resp._content = json.dumps(payload).encode()
+    return resp
+
+
+@pytest.fixture
+def requests_made(monkeypatch) -> list[dict]:
+    """Serve every session request with an empty rows payload and record its parameters."""
+    made = []
+
+    def get(self, url, params=None, **kwargs):
+        made.append({"url": url, **params})
+        return make_response({"success": True, "data": []})
+
+    monkeypatch.setattr("requests.Session.get", get)
+    return made
+
+
+class TestCanonicalKey:
+    """Unit tests for canonical_key."""
+
+    def test_ignores_parameter_order(self) -> None:
+        """Ensure the key does not depend on the order of the parameters."""
+        assert canonical_key(ROWS_PATH, {"tableName": "t", "numRows": 10}) == canonical_key(
+            ROWS_PATH, {"numRows": 10, "tableName": "t"}
+        )
+
+    def test_equivalent_filters_share_a_key(self) -> None:
+        """Ensure a Filter and the equivalent dict with reordered keys produce the same key."""
+        a = prepare_params({"tableName": "t", "filters": Filter("age") > 30})
+        b = prepare_params({"filters": {"value": 30, "operator": ">", "column": "age"}, "tableName": "t"})
+        assert canonical_key(ROWS_PATH, a) == canonical_key(ROWS_PATH, b)
+
+    def test_joined_lists_share_a_key(self) -> None:
+        """Ensure list-valued ids and their comma-joined form produce the same key."""
+        a = prepare_params({"ids": ["mp-1", "mp-2"], "providers": ["MP"]})
+        b = prepare_params({"providers": "MP", "ids": "mp-1,mp-2"})
+        assert canonical_key("/materials", a) == canonical_key("/materials", b)
+
+    def test_drops_none_parameters(self) -> None:
+        """Ensure parameters set to None do not change the key."""
+        assert canonical_key(ROWS_PATH, {"tableName": "t", "filters": None}) == canonical_key(ROWS_PATH, {"tableName": "t"})
+
+
+class TestResponseCache:
+    """Unit tests for the ResponseCache."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Ensure lookups update the hit and miss counters."""
+        cache = ResponseCache()
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) is None
+        cache.set(COLUMNS_PATH, {"tableName": "t"}, {"data": 1})
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) == {"data": 1}
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Ensure the least recently used entry is evicted once the cache is full."""
+        cache = ResponseCache(maxsize=2)
+        cache.set(COLUMNS_PATH, {"tableName": "a"}, 1)
+        cache.set(COLUMNS_PATH, {"tableName": "b"}, 2)
+        cache.get(COLUMNS_PATH, {"tableName": "a"})
+        cache.set(COLUMNS_PATH, {"tableName": "c"}, 3)
+        assert cache.get(COLUMNS_PATH, {"tableName": "b"}) is None
+        assert cache.get(COLUMNS_PATH, {"tableName": "a"}) == 1
+        assert cache.evictions == 1
+
+    def test_expires_entries(self, monkeypatch) -> None:
+        """Ensure entries expire after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=10)
+        cache.set(COLUMNS_PATH, {"tableName": "t"}, 1)
+        now[0] += 11
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) is None
+        assert len(cache) == 0
+
+    def test_per_endpoint_ttl(self) -> None:
+        """Ensure an endpoint with a TTL of 0 is never cached."""
+        cache = ResponseCache(ttls={"get_data_table_rows": 0, "get_data_table_columns": None})
+        cache.set(ROWS_PATH, {"tableName": "t"}, 1)
+        cache.set(COLUMNS_PATH, {"tableName": "t"}, 2)
+        assert cache.get(ROWS_PATH, {"tableName": "t"}) is None
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) == 2
+
+    def test_unknown_endpoint_ttl(self) -> None:
+        """Ensure TTL overrides for unknown endpoints are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={"not_an_endpoint": 1})
+
+    def test_returns_copies(self) -> None:
+        """Ensure modifying a stored or returned response does not change the cache entry."""
+        cache = ResponseCache()
+        value = {"data": [{"name": "a"}]}
+        cache.set(ROWS_PATH, {"tableName": "t"}, value)
+        value["data"][0]["name"] = "stored"
+        cache.get(ROWS_PATH, {"tableName": "t"})["data"][0]["name"] = "returned"
+        cache.get_stale(ROWS_PATH, {"tableName": "t"})["data"].clear()
+        assert cache.get(ROWS_PATH, {"tableName": "t"}) == {"data": [{"name": "a"}]}
+
+    def test_incomplete_subclass(self) -> None:
+        """Ensure a cache that does not implement the storage methods cannot be created."""
+
+        class LookupOnly(BaseCache):
+            def get(self, path, params):
+                return None
+
+        with pytest.raises(TypeError, match="abstract"):
+            LookupOnly()
+
+
+def write_entries(directory: str, worker: int) -> None:
+    """Write a batch of entries to a disk cache from a separate process."""
+    cache = DiskCache(directory)
+    for i in range(20):
+        cache.set(COLUMNS_PATH, {"tableName": f"{worker}-{i}"}, {"worker": worker, "i": i})
+
+
+class TestDiskCache:
+    """Unit tests for the DiskCache."""
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        """Ensure entries written by one instance are read by another."""
+        DiskCache(tmp_path).set(COLUMNS_PATH, {"tableName": "t"}, {"data": [1, 2, 3]})
+        cache = DiskCache(tmp_path)
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) == {"data": [1, 2, 3]}
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entries_are_stale(self, monkeypatch, tmp_path) -> None:
+        """Ensure expired entries are missed but still available as stale entries."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.time", lambda: now[0])
+        cache = DiskCache(tmp_path, ttls={"get_data_table_columns": 10})
+        cache.set(COLUMNS_PATH, {"tableName": "t"}, 1)
+        now[0] += 11
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) is None
+        assert cache.get_stale(COLUMNS_PATH, {"tableName": "t"}) == 1
+
+    def test_evicts_to_max_bytes(self, tmp_path) -> None:
+        """Ensure the least recently used entries are evicted to respect max_bytes."""
+        payload = {"data": [str(i) * 40 for i in range(100)]}
+        probe = DiskCache(tmp_path / "probe")
+        probe.set(COLUMNS_PATH, {"tableName": "probe"}, payload)
+        size = probe.stats()["bytes"]
+        cache = DiskCache(tmp_path / "cache", max_bytes=size * 2)
+        for name in ("a", "b", "c"):
+            cache.set(COLUMNS_PATH, {"tableName": name}, payload)
+        assert cache.get(COLUMNS_PATH, {"tableName": "a"}) is None
+        assert cache.get(COLUMNS_PATH, {"tableName": "c"}) == payload
+        assert cache.stats()["bytes"] <= size * 2
+        assert cache.evictions == 1
+
+    def test_concurrent_processes(self, tmp_path) -> None:
+        """Ensure several processes can write to the same cache."""
+        ctx = multiprocessing.get_context("spawn")
+        processes = [ctx.Process(target=write_entries, args=(str(tmp_path), worker)) for worker in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert all(process.exitcode == 0 for process in processes)
+        assert len(DiskCache(tmp_path)) == 60
+
+
+class TestTieredCache:
+    """Unit tests for the TieredCache."""
+
+    def test_promotes_lower_tier_hits(self, tmp_path) -> None:
+        """Ensure a disk hit is copied into the memory tier."""
+        memory, disk = ResponseCache(), DiskCache(tmp_path)
+        disk.set(COLUMNS_PATH, {"tableName": "t"}, 1)
+        cache = TieredCache(memory, disk)
+        assert cache.get(COLUMNS_PATH, {"tableName": "t"}) == 1
+        assert memory.get(COLUMNS_PATH, {"tableName": "t"}) == 1
+        assert cache.offline is True
+
+
+class TestClientCache:
+    """Unit tests for the DataScribeClient response cache."""
+
+    def test_repeated_calls_are_served_from_cache(self, requests_made) -> None:
+        """Ensure identical calls reach the network once."""
+        with DataScribeClient(api_key="test-key", cache=True) as client:
+            client.get_data_table_rows(tableName="t", columns=["id"], filters=Filter("id") > 1)
+            client.get_data_table_rows(columns=["id"], filters=Filter("id") > 1, tableName="t")
+            assert len(requests_made) == 1
+            assert client.cache.stats()["hits"] == 1
+
+    def test_modified_results_are_not_cached(self, local_api) -> None:
+        """Ensure editing a returned result does not change the results of later cached calls."""
+        with DataScribeClient(api_key="test-key", base=local_api.base, cache=True) as client:
+            records = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=5, as_="records")
+            records[0]["name"] = "MUTATED"
+            rows = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=5)
+            again = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=5, as_="records")
+        assert rows[0].name == "row-0"
+        assert again[0]["name"] == "row-0"
+        assert len(local_api.requests) == 1
+
+    def test_client_without_cache(self, requests_made) -> None:
+        """Ensure every call reaches the network when caching is disabled."""
+        with DataScribeClient(api_key="test-key") as client:
+            client.get_data_table_rows(tableName="t", columns=["id"])
+            client.get_data_table_rows(tableName="t", columns=["id"])
+            assert client.cache is None
+            assert len(requests_made) == 2
+
+    def test_offline_serves_stale_entry(self, monkeypatch, tmp_path) -> None:
+        """Ensure an expired entry is served when the API cannot be reached."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.time", lambda: now[0])
+        cache = DiskCache(tmp_path, ttl=10)
+        cache.set(
+            COLUMNS_PATH, {"tableName": "t"}, {"success": True, "data": {"table_name": "t", "display_name": "T", "columns": []}}
+        )
+        now[0] += 11
+
+        def get(self, url, params=None, **kwargs):
+            raise RequestsConnectionError("network is down")
+
+        monkeypatch.setattr("requests.Session.get", get)
+        with DataScribeClient(api_key="test-key", cache=cache) as client:
+            assert client.get_data_table_columns(tableName="t").table_name == "t"
+            with pytest.raises(RequestsConnectionError):
+                client.get_data_table_columns(tableName="other")
+
+
+class VersionedServer:
+    """A stub API serving a catalog with one table whose version can be bumped."""
+
+    def __init__(self) -> None:
+        """Create the server with the table at its first version."""
+        self.version = "2025-01-01T00:00:00"
+        self.paths: list[str] = []
+
+    def get(self, url, params=None, **kwargs) -> Response:
+        """Serve a request made through `requests.Session.get`."""
+        path = url.removeprefix("https://datascribe.cloud")
+        self.paths.append(path)
+        if path == "/data/data-tables-for-user":
+            table = {
+                "table_name": "t",
+                "display_name": "T",
+                "user_id": 1,
+                "database_schema": {"table_name": "t", "description": "", "columns": []},
+                "created_on": "2025-01-01T00:00:00",
+                "last_updated": self.version,
+                "table_type": "permanent",
+                "visibility": "private",
+            }
+            return make_response({"success": True, "data": [table]})
+        return make_response({"success": True, "data": {"table_name": "t", "display_name": self.version, "columns": []}})
+
+
+class TestVersionedCache:
+    """Unit tests for table version stamping of cached responses."""
+
+    @pytest.fixture
+    def server(self, monkeypatch) -> VersionedServer:
+        """Serve session requests from a VersionedServer."""
+        server = VersionedServer()
+        monkeypatch.setattr("requests.Session.get", lambda session, *args, **kwargs: server.get(*args, **kwargs))
+        return server
+
+    def test_versioned_entries_do_not_expire(self, server, monkeypatch) -> None:
+        """Ensure entries of a table with a known version outlive their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.monotonic", lambda: now[0])
+        with DataScribeClient(api_key="test-key", cache=ResponseCache(ttl=10, revalidate_after=None)) as client:
+            client.get_data_tables_for_user()
+            client.get_data_table_columns(tableName="t")
+            now[0] += 3600
+            client.get_data_table_columns(tableName="t")
+            assert server.paths.count(COLUMNS_PATH) == 1
+
+    def test_revalidate_tables_invalidates_changed_table(self, server) -> None:
+        """Ensure a version bump seen by revalidate_tables invalidates the table's entries."""
+        with DataScribeClient(api_key="test-key", cache=ResponseCache(revalidate_after=None)) as client:
+            client.get_data_tables_for_user()
+            assert client.get_data_table_columns(tableName="t").display_name == "2025-01-01T00:00:00"
+            assert client.revalidate_tables() == []
+            server.version = "2025-02-01T00:00:00"
+            assert client.revalidate_tables() == ["t"]
+            assert client.get_data_table_columns(tableName="t").display_name == "2025-02-01T00:00:00"
+            assert server.paths.count(COLUMNS_PATH) == 2
+
+    def test_revalidation_forgets_dtypes_of_changed_table(self, server) -> None:
+        """Ensure the dtypes kept for a table are fetched again once its version changes."""
+        with DataScribeClient(api_key="test-key", cache=ResponseCache(revalidate_after=None)) as client:
+            client.get_data_tables_for_user()
+            client.table_dtypes("t")
+            server.version = "2025-02-01T00:00:00"
+            assert client.revalidate_tables() == ["t"]
+            client.table_dtypes("t")
+            assert server.paths.count(COLUMNS_PATH) == 2  # noqa: PLR2004
+
+    def test_revalidates_automatically(self, server, monkeypatch) -> None:
+        """Ensure the versions are refreshed with one catalog request once revalidate_after has elapsed."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.monotonic", lambda: now[0])
+        with DataScribeClient(api_key="test-key", cache=ResponseCache(ttl=None, revalidate_after=60)) as client:
+            client.get_data_tables_for_user()
+            client.get_data_table_columns(tableName="t")
+            server.version = "2025-02-01T00:00:00"
+            assert client.get_data_table_columns(tableName="t").display_name == "2025-01-01T00:00:00"
+            now[0] += 61
+            assert client.get_data_table_columns(tableName="t").display_name == "2025-02-01T00:00:00"
+            assert server.paths.count("/data/data-tables-for-user") == 2
+
+    def test_versions_outside_revalidation_keep_ttl(self, monkeypatch) -> None:
+        """Ensure entries of a table whose version is only known from its metadata still expire after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("datascribe_api.cache.time.monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=10, revalidate_after=None)
+        cache.observe_versions("/data/data-table-metadata", {"success": True, "data": {"table_name": "u", "last_updated": "v1"}})
+        cache.observe_versions(
+            "/data/data-tables-for-user", {"success": True, "data": [{"table_name": "t", "last_updated": "v1"}]}
+        )
+        for table in ("t", "u"):
+            cache.set(ROWS_PATH, {"tableName": table}, {"success": True, "data": [{"id": 1}]})
+        now[0] += 11
+        assert cache.get(ROWS_PATH, {"tableName": "t"}) is not None
+        assert cache.get(ROWS_PATH, {"tableName": "u"}) is None
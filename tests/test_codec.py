@@ -0,0 +1,53 @@
+"""Testing suite for the codec module.
+
+This module contains unittests for the JSON codecs used to encode filters and decode responses.
+"""
+
+import pytest
+
+from datascribe_api import DataScribeClient
+from datascribe_api.codec import DEFAULT_CODEC, JSONCodec, available_codecs, get_codec
+from datascribe_api.filter import Filter
+from datascribe_api.utils import prepare_params
+
+DOCUMENT = {"success": True, "data": [{"id": 1, "name": "ünïcødé", "score": -1.5, "tags": ["a", None]}], "total": 1}
+
+
+class TestCodecs:
+    """Unit tests for the JSON codecs."""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_round_trip(self, name) -> None:
+        """Ensure every installed codec encodes compact JSON that every codec decodes."""
+        codec = get_codec(name)
+        assert codec.name == name
+        assert codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        for other in available_codecs():
+            assert get_codec(other).loads(codec.encode(DOCUMENT)) == DOCUMENT
+            assert get_codec(other).loads(codec.dumps(DOCUMENT)) == DOCUMENT
+
+    def test_default_codec(self, monkeypatch) -> None:
+        """Ensure the fastest installed codec is the default and the environment variable overrides it."""
+        assert DEFAULT_CODEC.name == available_codecs()[0]
+        assert get_codec() is DEFAULT_CODEC
+        monkeypatch.setenv("DATASCRIBE_JSON_CODEC", "json")
+        assert get_codec().name == "json"
+
+    def test_unknown_codec(self) -> None:
+        """Ensure an unknown backend name raises a ValueError."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_custom_codec(self) -> None:
+        """Ensure codec instances are passed through and used to encode filters."""
+        codec = JSONCodec()
+        assert get_codec(codec) is codec
+        params = prepare_params({"filters": Filter("id") > 1}, codec)
+        assert params["filters"] == '{"column":"id","operator":">","value":1}'
+
+    def test_client_decodes_with_codec(self, local_api) -> None:
+        """Ensure the client decodes responses with its codec."""
+        with DataScribeClient(api_key="test-key", base=local_api.base, codec="json") as client:
+            assert client.codec.name == "json"
+            rows = client.get_data_table_rows(tableName="t", columns=["id"], numRows=3)
+        assert [row.id for row in rows] == [0, 1, 2]
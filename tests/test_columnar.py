@@ -0,0 +1,183 @@
+"""Testing suite for the columnar module.
+
+This module contains unittests for building columnar results from decoded rows, and for the `as_` option of the
+DataScribeClient, which is exercised against a local server so these tests do not require API access.
+"""
+
+import importlib.util
+from array import array
+
+import pandas as pd
+import pytest
+
+from datascribe_api import DataScribeClient
+from datascribe_api.columnar import (
+    CompactRows,
+    build_frame,
+    column_dtype,
+    pack_column,
+    records_to_arrow,
+    records_to_columns,
+    records_to_typed_dataframe,
+)
+from datascribe_api.models import DataTableColumn
+from datascribe_api.utils import DeadlineExceeded
+
+RECORDS = [{"id": 1, "name": "a"}, {"id": 2}, {"id": 3, "name": "c", "extra": True}]
+
+
+class TestColumnar:
+    """Unit tests for the columnar builders."""
+
+    def test_records_to_columns(self) -> None:
+        """Ensure columns keep their order of first appearance and missing values become None."""
+        assert records_to_columns(RECORDS) == {
+            "id": [1, 2, 3],
+            "name": ["a", None, "c"],
+            "extra": [None, None, True],
+        }
+
+    def test_build_frame(self) -> None:
+        """Ensure records and pandas results hold the decoded rows."""
+        assert build_frame(iter(RECORDS), "records") == RECORDS
+        df = build_frame(RECORDS, "pandas")
+        assert list(df.columns) == ["id", "name", "extra"]
+        assert df["id"].tolist() == [1, 2, 3]
+        with pytest.raises(ValueError, match="Unsupported result format"):
+            build_frame(RECORDS, "numpy")
+
+    @pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+    def test_arrow_requires_pyarrow(self) -> None:
+        """Ensure a missing pyarrow is reported with the extra to install."""
+        with pytest.raises(ImportError, match=r"datascribe_api\[arrow\]"):
+            records_to_arrow(RECORDS)
+
+    def test_arrow_and_polars(self) -> None:
+        """Ensure Arrow and polars results hold the decoded rows."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("polars")
+        assert build_frame(RECORDS, "arrow").column("name").to_pylist() == ["a", None, "c"]
+        assert build_frame(RECORDS, "polars")["id"].to_list() == [1, 2, 3]
+
+
+class TestCompactRows:
+    """Unit tests for CompactRows."""
+
+    def test_packs_numeric_columns(self) -> None:
+        """Ensure integer and float columns are stored in typed arrays and other columns as lists."""
+        assert pack_column([1, 2]) == array("q", [1, 2])
+        assert pack_column([0.5, 1.5]) == array("d", [0.5, 1.5])
+        assert type(pack_column([1, 2**64])) is list
+        assert type(pack_column([1, None])) is list
+        assert type(pack_column([True, False])) is list
+
+    def test_matches_data_table_rows(self) -> None:
+        """Ensure rows read the same as from DataTableRows, with None for the columns a row lacks."""
+        rows = CompactRows.from_records(RECORDS)
+        assert len(rows) == len(RECORDS)
+        assert rows[0].name == "a"
+        assert rows[-1]["extra"] is True
+        assert rows[1].name is None
+        assert [row.id for row in rows] == [1, 2, 3]
+        assert rows[1:].to_list() == [{"id": 2, "name": None, "extra": None}, {"id": 3, "name": "c", "extra": True}]
+        assert rows.to_dataframe().equals(build_frame(RECORDS, "pandas"))
+        assert rows[0] == {"id": 1, "name": "a", "extra": None}
+        with pytest.raises(AttributeError):
+            _ = rows[0].missing
+        with pytest.raises(IndexError):
+            rows[3]
+
+
+def column(data_type: str, is_nullable: str = "YES", **kwargs) -> DataTableColumn:
+    """Build a table column of a type."""
+    return DataTableColumn(column_name="c", data_type=data_type, is_nullable=is_nullable, **kwargs)
+
+
+class TestTypedDataFrames:
+    """Unit tests for schema-aware dtypes."""
+
+    def test_column_dtype(self) -> None:
+        """Ensure column types map to compact dtypes."""
+        assert column_dtype(column("integer", "NO")) == "int32"
+        assert column_dtype(column("bigint")) == "Int64"
+        assert column_dtype(column("numeric", "NO", numeric_precision=4, numeric_scale=0)) == "int16"
+        assert column_dtype(column("numeric", numeric_precision=6, numeric_scale=2)) == "float32"
+        assert column_dtype(column("numeric", numeric_precision=30, numeric_scale=0)) is None
+        assert column_dtype(column("double precision")) == "float64"
+        assert column_dtype(column("timestamp with time zone")) == "datetime64[us, UTC]"
+        assert column_dtype(column("character varying")) == "category"
+        assert column_dtype(column("jsonb")) is None
+
+    def test_builds_columns_with_dtypes(self) -> None:
+        """Ensure each column is built with its dtype, and left to pandas when its values do not fit."""
+        records = [
+            {"n": i, "x": i / 2, "kind": "ab"[i % 2], "label": f"l{i}", "at": "2025-01-01", "bad": None if i else 1}
+            for i in range(10)
+        ]
+        dtypes = {
+            "n": "int16",
+            "x": "float32",
+            "kind": "category",
+            "label": "category",
+            "at": "datetime64[us]",
+            "bad": "int32",
+        }
+        df = records_to_typed_dataframe(records, dtypes)
+        assert df.dtypes.astype(str).to_dict() == {
+            "n": "int16",
+            "x": "float32",
+            "kind": "category",
+            "label": str(pd.DataFrame({"label": ["l"]}).dtypes["label"]),
+            "at": "datetime64[us]",
+            "bad": "float64",
+        }
+
+
+class TestClientResultFormats:
+    """Integration tests for the `as_` option of DataScribeClient."""
+
+    def test_rows_without_models(self, local_api, monkeypatch) -> None:
+        """Ensure row endpoints build frames straight from the decoded rows, without models."""
+        monkeypatch.setattr("datascribe_api.client.build_model", pytest.fail)
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=5, as_="pandas")
+            records = client.get_data_table(tableName="t", numRows=2, as_="records")
+        assert isinstance(df, pd.DataFrame)
+        assert df["name"].tolist() == [f"row-{i}" for i in range(5)]
+        assert records == local_api.rows[:2]
+
+    def test_typed_dataframes(self, local_api) -> None:
+        """Ensure typed DataFrames follow the column types, which are fetched once per table."""
+        local_api.rows = [{"id": i, "name": "ab"[i % 2]} for i in range(100)]
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=10, as_="typed")
+            table = client.fetch_table(tableName="t", columns=["id", "name"], page_size=30, as_="typed")
+        assert df.dtypes.astype(str).to_dict() == {"id": "int32", "name": "category"}
+        assert table["id"].tolist() == list(range(100))
+        assert table["name"].dtype == "category"
+        assert [path for path, _ in local_api.requests].count("/data/data-table-columns") == 1
+
+    def test_typed_columns_lookup_respects_deadline(self, local_api) -> None:
+        """Ensure the column lookup of a typed call is bounded by the call's deadline."""
+        local_api.delays = [1.0]
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client, pytest.raises(DeadlineExceeded):
+            client.get_data_table_rows(tableName="t", columns=["id"], numRows=5, as_="typed", deadline=0.2)
+        assert [path for path, _ in local_api.requests] == ["/data/data-table-columns"]
+
+    def test_rejects_non_row_endpoints(self, local_api) -> None:
+        """Ensure `as_` is refused for endpoints that do not return rows, before any request."""
+        client = DataScribeClient(api_key="test-key", base=local_api.base)
+        with client, pytest.raises(ValueError, match="does not return table rows"):
+            client.get_data_table_rows_count(tableName="t", as_="pandas")
+        assert local_api.requests == []
+
+    def test_fetch_table(self, local_api) -> None:
+        """Ensure whole-table downloads can be returned as columnar results."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.fetch_table(tableName="t", columns=["id", "name"], page_size=30, dataframe=True)
+            records = client.fetch_table(tableName="t", columns=["id", "name"], page_size=30, as_="records")
+            compact = client.fetch_table(tableName="t", columns=["id", "name"], page_size=30, as_="compact")
+        assert df["id"].tolist() == list(range(len(local_api.rows)))
+        assert records == local_api.rows
+        assert isinstance(compact.column("id"), array)
+        assert compact.to_list() == local_api.rows
@@ -0,0 +1,122 @@
+"""Testing suite for the export module.
+
+This module contains unittests for resumable table exports and the export-table CLI command, which are exercised
+against a local server so these tests do not require API access.
+"""
+
+import csv
+import functools
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from datascribe_api import DataScribeClient, export
+from datascribe_api.cli import app
+from datascribe_api.export import merge_ranges
+
+runner = CliRunner()
+
+
+def read_jsonl(directory, manifest) -> list[dict]:
+    """Read the rows of a JSON Lines export in row order."""
+    return [json.loads(line) for name in manifest["parts"] for line in (directory / name).read_text().splitlines()]
+
+
+class TestExportTable:
+    """Unit tests for export_table."""
+
+    def test_merge_ranges(self) -> None:
+        """Ensure overlapping and adjacent row ranges are merged."""
+        assert merge_ranges([[30, 60], [0, 30], [90, 100], [50, 70]]) == [[0, 70], [90, 100]]
+
+    def test_exports_all_pages(self, local_api, tmp_path) -> None:
+        """Ensure every page is written to its own part file and recorded in the manifest."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            manifest = client.export_table(tableName="t", path=tmp_path, columns=["id", "name"], page_size=30)
+        assert list(manifest["parts"]) == [f"part-{start:012d}.jsonl" for start in (0, 30, 60, 90)]
+        assert manifest["done"] == [[0, 100]]
+        assert manifest["rows"] == len(local_api.rows)
+        assert read_jsonl(tmp_path, manifest) == local_api.rows
+        assert json.loads((tmp_path / "manifest.json").read_text()) == manifest
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_resumes_interrupted_export(self, local_api, tmp_path, monkeypatch) -> None:
+        """Ensure a rerun only fetches the pages an interrupted export did not write."""
+        fetch_rows_page = export.fetch_rows_page
+
+        def failing_fetch(client, tableName, columns, filters, startingRow, numRows):
+            if startingRow == 60:  # noqa: PLR2004
+                raise ConnectionError("connection reset")
+            return fetch_rows_page(client, tableName, columns, filters, startingRow, numRows)
+
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            monkeypatch.setattr(export, "fetch_rows_page", failing_fetch)
+            with pytest.raises(ConnectionError):
+                client.export_table(tableName="t", path=tmp_path, columns=["id", "name"], page_size=30, workers=1)
+            interrupted = json.loads((tmp_path / "manifest.json").read_text())
+            assert [60, 90] not in interrupted["done"]
+
+            monkeypatch.setattr(export, "fetch_rows_page", fetch_rows_page)
+            local_api.requests.clear()
+            manifest = client.export_table(tableName="t", path=tmp_path, columns=["id", "name"], workers=1)
+        # A page the interrupted export had already sent may still be in flight, so only check no page was refetched.
+        missing = {str(start) for start in range(0, 100, 30) if not any(s <= start < e for s, e in interrupted["done"])}
+        assert {params["startingRow"] for _, params in local_api.requests} <= missing
+        assert manifest["done"] == [[0, 100]]
+        assert read_jsonl(tmp_path, manifest) == local_api.rows
+
+    def test_records_pages_in_journal(self, local_api, tmp_path, monkeypatch) -> None:
+        """Ensure the manifest is saved once when the export starts and once when it ends, not after every page."""
+        writes = []
+        write_manifest = export._write_manifest
+        monkeypatch.setattr(
+            export, "_write_manifest", lambda path, manifest: writes.append(path) or write_manifest(path, manifest)
+        )
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            manifest = client.export_table(tableName="t", path=tmp_path, columns=["id", "name"], page_size=10)
+        assert len(manifest["parts"]) == 10  # noqa: PLR2004
+        assert len(writes) == 2  # noqa: PLR2004
+        assert not (tmp_path / export.JOURNAL_NAME).exists()
+
+    def test_resumes_from_journal_of_killed_export(self, local_api, tmp_path) -> None:
+        """Ensure pages recorded in the journal of a killed export are not fetched again, ignoring a torn last line."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            client.export_table(tableName="t", path=tmp_path, columns=["id", "name"], page_size=30)
+            manifest = json.loads((tmp_path / "manifest.json").read_text())
+            entries = [
+                {"part": name, "start": start, "end": min(start + 30, 100), "rows": manifest["parts"][name]}
+                for start, name in zip(range(0, 100, 30), manifest["parts"], strict=True)
+            ]
+            journal = "".join(json.dumps(entry) + "\n" for entry in entries[:2]) + json.dumps(entries[2])[:10]
+            (tmp_path / export.JOURNAL_NAME).write_text(journal)
+            (tmp_path / "manifest.json").write_text(json.dumps({**manifest, "done": [], "rows": 0, "parts": {}}))
+            local_api.requests.clear()
+            resumed = client.export_table(tableName="t", path=tmp_path, columns=["id", "name"])
+        assert sorted(params["startingRow"] for _, params in local_api.requests) == ["60", "90"]
+        assert resumed["done"] == [[0, 100]]
+        assert read_jsonl(tmp_path, resumed) == local_api.rows
+
+    def test_rejects_different_export(self, local_api, tmp_path) -> None:
+        """Ensure a directory holding another export is not resumed with different parameters."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            client.export_table(tableName="t", path=tmp_path, columns=["id"])
+            with pytest.raises(ValueError, match="columns"):
+                client.export_table(tableName="t", path=tmp_path, columns=["name"])
+            with pytest.raises(ValueError, match="Unsupported export format"):
+                client.export_table(tableName="t", path=tmp_path / "other", format="xml")
+
+
+class TestExportCommand:
+    """Unit tests for the export-table CLI command."""
+
+    def test_exports_csv(self, local_api, tmp_path, monkeypatch) -> None:
+        """Ensure the command writes CSV part files with a header and reports the export."""
+        monkeypatch.setattr("datascribe_api.cli.DataScribeClient", functools.partial(DataScribeClient, base=local_api.base))
+        args = ["export-table", "-t", "t", "-o", str(tmp_path), "-c", "id,name", "-f", "csv", "--page-size", "50"]
+        result = runner.invoke(app, [*args, "--api-key", "test-key", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["rows"] == len(local_api.rows)
+        with (tmp_path / "part-000000000050.csv").open() as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0] == {"id": "50", "name": "row-50"}
@@ -0,0 +1,96 @@
+"""Testing suite for the lazy module.
+
+This module contains unittests for lazily validated list models and for the `lazy_validation` option of the
+DataScribeClient, which is exercised against a local server so these tests do not require API access.
+"""
+
+import datetime
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from datascribe_api import DataScribeClient
+from datascribe_api.lazy import LazyList, build_lazy_model, concat_items
+from datascribe_api.models import DataTableRow, DataTableRows, DataTables, MaterialSearchResults, MaterialSummary
+
+TABLE = {
+    "table_name": "t",
+    "display_name": "T",
+    "user_id": 1,
+    "database_schema": {"table_name": "t", "description": "", "columns": []},
+    "created_on": "2025-01-01T00:00:00",
+    "last_updated": "2025-01-02T00:00:00",
+    "table_type": "permanent",
+    "visibility": "private",
+}
+
+MATERIAL = {"material_id": "mp-1", "formula": "Fe", "elements": ["Fe"], "systems": [], "key_props": {}, "provenance": []}
+
+
+class TestLazyList:
+    """Unit tests for LazyList and the lazy model builders."""
+
+    def test_validates_items_on_access(self) -> None:
+        """Ensure items are validated once, when they are first accessed."""
+        tables = build_lazy_model(DataTables, [TABLE, {**TABLE, "user_id": "not a number"}])
+        assert len(tables) == 2  # noqa: PLR2004
+        assert tables.root.pending() == 2  # noqa: PLR2004
+        assert tables[0].created_on == datetime.datetime(2025, 1, 1)  # noqa: DTZ001
+        assert tables.root.pending() == 1
+        assert tables[0] is tables[0]
+        with pytest.raises(ValidationError):
+            tables[1]
+
+    def test_slices_and_iteration(self) -> None:
+        """Ensure slices and iteration return validated models."""
+        items = LazyList(DataTableRow, [{"id": i} for i in range(5)])
+        assert [row.id for row in items[1:4]] == [1, 2, 3]
+        assert [row.id for row in reversed(items)] == [4, 3, 2, 1, 0]
+        assert all(isinstance(row, DataTableRow) for row in items)
+        assert items.pending() == 0
+
+    def test_validates_the_rest_of_the_model(self) -> None:
+        """Ensure only the list items are deferred, while the other fields are validated as usual."""
+        results = build_lazy_model(MaterialSearchResults, {"results": [MATERIAL], "total": "1"})
+        assert results.total == 1
+        assert isinstance(results.results[0], MaterialSummary)
+        with pytest.raises(ValidationError):
+            build_lazy_model(MaterialSearchResults, {"results": [MATERIAL]})
+
+    def test_serializes_pending_items(self) -> None:
+        """Ensure serializing a lazy model validates its pending items, without serializer warnings."""
+        rows = build_lazy_model(DataTableRows, [{"id": 1}, {"id": 2}])
+        full = DataTableRows([{"id": 1}, {"id": 2}])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert rows.model_dump() == full.model_dump()
+            assert rows.model_dump_json() == full.model_dump_json()
+
+    def test_concat_items(self) -> None:
+        """Ensure concatenated lazy lists stay lazy."""
+        joined = concat_items([LazyList(DataTableRow, [{"id": 0}]), LazyList(DataTableRow, [{"id": 1}])])
+        assert isinstance(joined, LazyList)
+        assert joined.pending() == 2  # noqa: PLR2004
+        assert concat_items([[1], [2, 3]]) == [1, 2, 3]
+
+
+class TestClientLazyValidation:
+    """Integration tests for the `lazy_validation` option of DataScribeClient."""
+
+    def test_rows_are_validated_on_access(self, local_api) -> None:
+        """Ensure row endpoints and whole-table downloads return lazily validated rows."""
+        with DataScribeClient(api_key="test-key", base=local_api.base, lazy_validation=True) as client:
+            assert client.lazy_validation
+            rows = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=10)
+            table = client.fetch_table(tableName="t", columns=["id", "name"], page_size=30)
+        assert rows.root.pending() == len(rows)
+        assert rows[3].name == "row-3"
+        assert table.root.pending() == len(local_api.rows)
+        assert table.to_list() == local_api.rows
+
+    def test_disabled_by_default(self, local_api) -> None:
+        """Ensure responses are fully validated unless lazy validation is enabled."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = client.get_data_table_rows(tableName="t", columns=["id", "name"], numRows=10)
+        assert type(rows.root) is list
@@ -0,0 +1,222 @@
+"""Testing suite for the materials module.
+
+This module contains unittests for the bulk material lookups and searches of the DataScribeClient. Requests are
+served by in-memory fakes that replace the client's request methods, so these tests do not require API access.
+"""
+
+import random
+import threading
+
+import pytest
+
+from datascribe_api import DataScribeClient
+from datascribe_api.autotune import PageSizeTuner
+from datascribe_api.cache import ResponseCache
+from datascribe_api.materials import aligned_size, plan_id_chunks, size_unit
+from datascribe_api.models import MaterialByIdResults, MaterialSearchResults, MaterialSummary
+from datascribe_api.utils import http_error, record_response
+
+
+class FakeCatalog:
+    """An in-memory material catalog answering `get_material_by_id` requests."""
+
+    def __init__(self, providers: tuple[str, ...] = ("MP", "AFLOW"), unknown: frozenset[str] = frozenset()) -> None:
+        """Create a catalog knowing every id except `unknown`, each from every provider."""
+        self.providers = providers
+        self.unknown = unknown
+        self.wrap = True
+        self.requests: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def request(self, path: str, params: dict) -> dict:
+        """Serve a request made through `DataScribeClient._request`, with its results wrapped in `data` if `wrap`."""
+        ids = params["ids"].split(",")
+        with self.lock:
+            self.requests.append(ids)
+        results = [
+            {"provider": provider, "id": material_id, "data": {"formula": material_id.upper()}}
+            for material_id in ids
+            if material_id not in self.unknown
+            for provider in self.providers
+        ]
+        data = {"results": results, "total": len(results)}
+        return {"success": True, "data": data} if self.wrap else data
+
+
+class FakeSearch:
+    """An in-memory material search answering paginated `search_materials` requests."""
+
+    def __init__(self, total: int = 23) -> None:
+        """Create a search matching `total` materials."""
+        self.summaries = [
+            {
+                "material_id": f"mp-{i}",
+                "formula": "SiO2",
+                "elements": ["Si", "O"],
+                "systems": [],
+                "key_props": {},
+                "provenance": [],
+            }
+            for i in range(total)
+        ]
+        self.pages: list[int] = []
+        self.sizes: list[int] = []
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def get(self, path: str, params: dict) -> dict:
+        """Serve a request made through `DataScribeClient._get`, failing the first `errors` requests with a 503."""
+        page, size = params["page"], params["size"]
+        with self.lock:
+            self.pages.append(page)
+            self.sizes.append(size)
+            if self.errors:
+                self.errors -= 1
+                raise http_error(503, {}, "Service Unavailable")
+        record_response(100 * size)
+        results = self.summaries[(page - 1) * size : page * size]
+        return {"success": True, "data": {"results": results, "total": len(self.summaries)}}
+
+
+@pytest.fixture
+def search(monkeypatch) -> FakeSearch:
+    """Replace `DataScribeClient._get` with an in-memory material search."""
+    fake = FakeSearch()
+    monkeypatch.setattr(DataScribeClient, "_get", lambda self, path, params: fake.get(path, params))
+    return fake
+
+
+@pytest.fixture
+def catalog(monkeypatch) -> FakeCatalog:
+    """Replace `DataScribeClient._request` with an in-memory catalog."""
+    fake = FakeCatalog(unknown=frozenset({"mp-404"}))
+    monkeypatch.setattr(DataScribeClient, "_request", lambda self, path, params: fake.request(path, params))
+    return fake
+
+
+class TestFetchMaterials:
+    """Unit tests for DataScribeClient.fetch_materials."""
+
+    def test_plan_id_chunks(self) -> None:
+        """Ensure chunks respect the encoded length limit and keep the id order."""
+        ids = [f"mp-{i}" for i in range(100)]
+        chunks = plan_id_chunks(ids, max_length=50)
+        assert [material_id for chunk in chunks for material_id in chunk] == ids
+        assert all(len("%2C".join(chunk)) <= 50 for chunk in chunks)
+        assert plan_id_chunks(["x" * 10, "y"], max_length=5) == [["x" * 10], ["y"]]
+        assert plan_id_chunks([]) == []
+
+    def test_merges_chunks_without_duplicates(self, catalog) -> None:
+        """Ensure duplicate ids are requested once and the merged results have a correct total."""
+        ids = [f"mp-{i}" for i in range(200)] + ["mp-3", "mp-404"]
+        with DataScribeClient(api_key="test-key") as client:
+            results = client.fetch_materials(ids=ids, providers=["MP", "AFLOW"], workers=4, max_ids_length=100)
+        assert isinstance(results, MaterialByIdResults)
+        assert results.total == len(results.results) == 400
+        assert [result.id for result in results.results[:4]] == ["mp-0", "mp-0", "mp-1", "mp-1"]
+        requested = [material_id for chunk in catalog.requests for material_id in chunk]
+        assert sorted(requested) == sorted(set(ids))
+        assert len(catalog.requests) > 1
+
+    def test_skips_cached_ids(self, catalog) -> None:
+        """Ensure ids resolved earlier, including unknown ones, are served from the cache."""
+        with DataScribeClient(api_key="test-key", cache=ResponseCache()) as client:
+            client.fetch_materials(ids="mp-1,mp-2,mp-404", providers="MP")
+            results = client.fetch_materials(ids=["mp-2", "mp-3", "mp-404"], providers=["MP"])
+            single = client.get_material_by_id(ids="mp-1", providers="MP")
+        assert catalog.requests == [["mp-1", "mp-2", "mp-404"], ["mp-3"]]
+        assert [result.id for result in results.results] == ["mp-2", "mp-2", "mp-3", "mp-3"]
+        assert single.total == 2
+
+    def test_responses_without_data(self, catalog) -> None:
+        """Ensure responses without a `data` wrapper are read the same way whether fresh or cached."""
+        catalog.wrap = False
+        with DataScribeClient(api_key="test-key", cache=ResponseCache()) as client:
+            client.get_material_by_id(ids="mp-1", providers="MP")
+            results = client.fetch_materials(ids=["mp-1", "mp-2"], providers="MP")
+        assert [result.id for result in results.results] == ["mp-1", "mp-1", "mp-2", "mp-2"]
+        assert catalog.requests == [["mp-1"], ["mp-2"]]
+
+    def test_invalid_workers(self, catalog) -> None:
+        """Ensure a non-positive number of workers raises a ValueError."""
+        with DataScribeClient(api_key="test-key") as client, pytest.raises(ValueError):
+            client.fetch_materials(ids=["mp-1"], workers=0)
+
+
+class TestSearchMaterialsAll:
+    """Unit tests for DataScribeClient.iter_search_materials and search_materials_all."""
+
+    def test_iterates_all_pages_in_order(self, search) -> None:
+        """Ensure every result is yielded in page order and each page is requested once."""
+        with DataScribeClient(api_key="test-key") as client:
+            summaries = list(client.iter_search_materials(elements=["Si", "O"], size=5, workers=3))
+        assert [summary.material_id for summary in summaries] == [f"mp-{i}" for i in range(23)]
+        assert all(isinstance(summary, MaterialSummary) for summary in summaries)
+        assert sorted(search.pages) == [1, 2, 3, 4, 5]
+
+    def test_collects_results(self, search) -> None:
+        """Ensure the collected results carry the total reported by the API."""
+        with DataScribeClient(api_key="test-key") as client:
+            results = client.search_materials_all(formula="SiO2", page=2, size=10)
+        assert isinstance(results, MaterialSearchResults)
+        assert results.total == 23
+        assert [summary.material_id for summary in results.results] == [f"mp-{i}" for i in range(10, 23)]
+
+    def test_single_page(self, search) -> None:
+        """Ensure no further pages are requested when the first page holds every result."""
+        with DataScribeClient(api_key="test-key") as client:
+            assert len(client.search_materials_all(size=50).results) == 23
+        assert search.pages == [1]
+
+    def test_invalid_size(self, search) -> None:
+        """Ensure a non-positive page size raises a ValueError."""
+        with DataScribeClient(api_key="test-key") as client, pytest.raises(ValueError):
+            client.search_materials_all(size=0)
+
+    def test_aligned_size(self) -> None:
+        """Ensure page sizes are rounded down to power-of-two multiples of the unit whose pages start at the offset."""
+        assert aligned_size(0, 30, 10) == 20  # noqa: PLR2004
+        assert aligned_size(40, 100, 10) == 40  # noqa: PLR2004
+        assert aligned_size(120, 100, 10) == 40  # noqa: PLR2004
+        assert aligned_size(120, 5, 10) == 10  # noqa: PLR2004
+        assert (size_unit(100, 10), size_unit(1000, 10), size_unit(8, 1), size_unit(7, 1)) == (25, 125, 1, 7)
+
+    def test_aligned_size_stays_on_ladder(self) -> None:
+        """Ensure tuned page sizes stay at the initial size times a power of two, and never below the minimum."""
+        rng = random.Random(0)
+        unit = size_unit(100, 10)
+        offset = 0
+        for _ in range(1000):
+            size = aligned_size(offset, rng.randint(1, 10_000), unit)
+            assert offset % size == 0
+            assert size >= 10  # noqa: PLR2004
+            assert (size // unit) & (size // unit - 1) == 0
+            offset += size
+
+    def test_auto_size_grows_pages(self, search) -> None:
+        """Ensure auto-sized pages grow while every result is yielded once, in order."""
+        tuner = PageSizeTuner(initial=2, min_size=1)
+        with DataScribeClient(api_key="test-key") as client:
+            summaries = list(client.iter_search_materials(elements=["Si", "O"], size=tuner, workers=1))
+        assert [summary.material_id for summary in summaries] == [f"mp-{i}" for i in range(23)]
+        assert search.sizes[0] == 2  # noqa: PLR2004
+        assert max(search.sizes) > 2  # noqa: PLR2004
+
+    def test_auto_size_without_results(self, monkeypatch) -> None:
+        """Ensure an auto-sized search matching nothing returns an empty result with a zero total."""
+        empty = FakeSearch(total=0)
+        monkeypatch.setattr(DataScribeClient, "_get", lambda self, path, params: empty.get(path, params))
+        with DataScribeClient(api_key="test-key") as client:
+            results = client.search_materials_all(formula="Xx", size=PageSizeTuner(initial=5, min_size=1))
+            assert list(client.iter_search_materials(formula="Xx", size="auto")) == []
+        assert (results.results, results.total) == ([], 0)
+        assert empty.pages == [1, 1]
+
+    def test_auto_size_splits_failed_page(self, search) -> None:
+        """Ensure a page failing with a server error is requested again as smaller pages."""
+        search.errors = 1
+        tuner = PageSizeTuner(initial=8, min_size=1)
+        with DataScribeClient(api_key="test-key") as client:
+            results = client.search_materials_all(size=tuner, workers=1)
+        assert [summary.material_id for summary in results.results] == [f"mp-{i}" for i in range(23)]
+        assert list(zip(search.pages, search.sizes, strict=True))[:3] == [(1, 8), (1, 4), (2, 4)]
@@ -0,0 +1,226 @@
+"""Testing suite for the pagination module.
+
+This module contains unittests for the pagination helpers of the DataScribeClient. Requests are served by an
+in-memory table that replaces `DataScribeClient._get`, so these tests do not require API access.
+"""
+
+import json
+import threading
+
+import pytest
+
+from datascribe_api import DataScribeClient
+from datascribe_api.filter import Filter
+from datascribe_api.models import DataTableRow, DataTableRows
+from datascribe_api.pagination import plan_shards, plan_value_shards, split_range
+
+TOTAL_ROWS = 25
+
+
+class FakeTable:
+    """An in-memory table that answers paginated row requests."""
+
+    def __init__(self, total_rows: int = TOTAL_ROWS) -> None:
+        """Create a table with `total_rows` rows."""
+        self.rows = [{"id": i, "name": f"row-{i}"} for i in range(total_rows)]
+        self.requests: list[dict] = []
+        self.lock = threading.Lock()
+
+    def get(self, path: str, params: dict) -> dict:
+        """Serve a request made through `DataScribeClient._get`."""
+        with self.lock:
+            self.requests.append({"path": path, **params})
+        if path.endswith("rows-count"):
+            return {"success": True, "data": {"total_rows": len(self.rows)}}
+        start, size = params.get("startingRow", 0), params.get("numRows", 100)
+        return {"success": True, "data": self.rows[start : start + size]}
+
+
+@pytest.fixture
+def table(monkeypatch) -> FakeTable:
+    """Replace `DataScribeClient._get` with an in-memory table."""
+    fake = FakeTable()
+    monkeypatch.setattr(DataScribeClient, "_get", lambda self, path, params: fake.get(path, params))
+    return fake
+
+
+@pytest.fixture
+def client() -> DataScribeClient:
+    """Create a DataScribeClient that never reaches the network."""
+    with DataScribeClient(api_key="test-key") as client:
+        yield client
+
+
+class TestIterTableRows:
+    """Unit tests for DataScribeClient.iter_table_rows."""
+
+    def test_yields_every_row_in_order(self, table, client) -> None:
+        """Ensure all rows are yielded in table order across pages."""
+        rows = list(client.iter_table_rows(tableName="t", columns=["id", "name"], page_size=10, prefetch=3))
+        assert [row.id for row in rows] == list(range(TOTAL_ROWS))
+        assert all(isinstance(row, DataTableRow) for row in rows)
+
+    def test_yields_pages(self, table, client) -> None:
+        """Ensure whole pages are yielded when pages=True."""
+        pages = list(client.iter_table_rows(tableName="t", columns=["id"], page_size=10, pages=True))
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert all(isinstance(page, DataTableRows) for page in pages)
+
+    def test_exact_multiple_of_page_size(self, table, client) -> None:
+        """Ensure iteration stops on the empty page following a full final page."""
+        pages = list(client.iter_table_rows(tableName="t", columns=["id"], page_size=5, prefetch=0, pages=True))
+        assert [len(page) for page in pages] == [5] * 5
+
+    def test_uses_get_data_table_without_columns(self, table, client) -> None:
+        """Ensure the table endpoint is used when no columns are given."""
+        rows = list(client.iter_table_rows(tableName="t", page_size=10))
+        assert len(rows) == TOTAL_ROWS
+        assert {request["path"] for request in table.requests} == {"/data/data-table"}
+
+    def test_filters_require_columns(self, table, client) -> None:
+        """Ensure filtering without columns raises a ValueError."""
+        with pytest.raises(ValueError):
+            list(client.iter_table_rows(tableName="t", filters={"column": "id", "operator": ">", "value": 1}))
+
+    def test_close_stops_prefetching(self, table, client) -> None:
+        """Ensure closing the generator early does not request further pages."""
+        rows = client.iter_table_rows(tableName="t", columns=["id"], page_size=1, prefetch=2)
+        assert next(rows).id == 0
+        rows.close()
+        requested = len(table.requests)
+        assert requested <= 4
+
+    def test_invalid_page_size(self, client) -> None:
+        """Ensure a non-positive page size raises a ValueError."""
+        with pytest.raises(ValueError):
+            next(client.iter_table_rows(tableName="t", columns=["id"], page_size=0))
+
+
+class TestFetchTable:
+    """Unit tests for DataScribeClient.fetch_table."""
+
+    def test_plan_shards(self) -> None:
+        """Ensure the row range is split into contiguous shards."""
+        assert plan_shards(25, 10) == [(0, 10), (10, 10), (20, 5)]
+        assert plan_shards(0, 10) == []
+
+    def test_fetches_all_rows_in_order(self, table, client) -> None:
+        """Ensure the shards are reassembled in row order."""
+        rows = client.fetch_table(tableName="t", columns=["id", "name"], workers=4, page_size=4)
+        assert isinstance(rows, DataTableRows)
+        assert [row.id for row in rows] == list(range(TOTAL_ROWS))
+
+    def test_requests_row_count_once(self, table, client) -> None:
+        """Ensure the row count is requested once and one request is made per shard."""
+        client.fetch_table(tableName="t", columns=["id"], page_size=10)
+        paths = [request["path"] for request in table.requests]
+        assert paths.count("/data/data-table-rows-count") == 1
+        assert paths.count("/data/data-table-rows") == 3
+
+    def test_returns_dataframe(self, table, client) -> None:
+        """Ensure a DataFrame is returned when requested."""
+        df = client.fetch_table(tableName="t", columns=["id", "name"], page_size=7, dataframe=True)
+        assert list(df["id"]) == list(range(TOTAL_ROWS))
+        assert list(df.columns) == ["id", "name"]
+
+
+class TestValueShards:
+    """Unit and integration tests for value-range shards."""
+
+    def test_split_range(self) -> None:
+        """Ensure integer, float and timestamp ranges are split into sub-ranges of equal width."""
+        assert split_range(0, 100, 4) == [25, 50, 75]
+        assert split_range(0, 2, 4) == [1]
+        assert split_range(0.0, 1.0, 4) == [0.25, 0.5, 0.75]
+        assert split_range("2025-01-01T00:00:00", "2025-01-03T00:00:00", 2) == ["2025-01-02T00:00:00"]
+        with pytest.raises(TypeError):
+            split_range("a", "b", 2)
+
+    def test_plan_value_shards(self) -> None:
+        """Ensure the outer shards are open-ended and NULL values get their own shard."""
+        assert plan_value_shards("id", 0, 10, 2) == [
+            [{"column": "id", "operator": "<", "value": 5}],
+            [{"column": "id", "operator": ">=", "value": 5}],
+            [{"column": "id", "operator": "is null", "value": None}],
+        ]
+        assert len(plan_value_shards("id", 3, 3, 4)) == 2  # noqa: PLR2004
+
+    def test_fetches_every_row(self, local_api) -> None:
+        """Ensure every row is fetched once, with range filters combined with the caller's filters."""
+        local_api.rows.append({"id": None, "name": "null"})
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = client.fetch_table(
+                tableName="t",
+                columns=["id", "name"],
+                filters=Filter("name") != "row-7",
+                shard_on="id",
+                shards=4,
+                page_size=10,
+                as_="records",
+            )
+        assert rows == [row for row in local_api.rows if row["name"] != "row-7"]
+        scans = [json.loads(params["filters"]) for _, params in local_api.requests if params.get("numRows") == "10"]
+        assert all(scan[0] == {"column": "name", "operator": "!=", "value": "row-7"} for scan in scans)
+        ranges = {tuple((f["operator"], f["value"]) for f in scan[1:]) for scan in scans}
+        assert ranges == {(("<", 24),), ((">=", 24), ("<", 49)), ((">=", 49), ("<", 74)), ((">=", 74),), (("is null", None),)}
+
+    def test_seeks_within_shards(self, local_api) -> None:
+        """Ensure each shard is paged by seeking on the key, so no page is requested past row 0."""
+        local_api.rows.append({"id": None, "name": "null"})
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            records = client.fetch_table(
+                tableName="t", columns=["id", "name"], shard_on="id", shards=4, page_size=10, key="id", as_="records"
+            )
+            rows = client.fetch_table(tableName="t", columns=["id", "name"], shard_on="id", shards=4, page_size=10, key="id")
+        assert records == local_api.rows
+        assert [row.id for row in rows] == [row["id"] for row in local_api.rows]
+        scans = [params for _, params in local_api.requests if params.get("numRows") == "10"]
+        assert {params["startingRow"] for params in scans} == {"0"}
+
+    def test_requires_columns(self, local_api) -> None:
+        """Ensure sharding on a column is refused without columns, and a key without sharding on a column."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            with pytest.raises(ValueError, match="requires the columns"):
+                client.fetch_table(tableName="t", shard_on="id")
+            with pytest.raises(ValueError, match="key requires shard_on"):
+                client.fetch_table(tableName="t", columns=["id"], key="id")
+
+
+class TestIterKeyset:
+    """Integration tests for DataScribeClient.iter_keyset against a local server."""
+
+    def test_seeks_past_last_key(self, local_api) -> None:
+        """Ensure every page starts at row 0 and seeks past the last key of the previous page."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = list(client.iter_keyset(tableName="t", columns=["id", "name"], key="id", page_size=30))
+        assert [row.model_dump() for row in rows] == local_api.rows
+        assert {params["startingRow"] for _, params in local_api.requests} == {"0"}
+        seeks = [json.loads(params["filters"]) if "filters" in params else None for _, params in local_api.requests]
+        assert seeks == [None, *([{"column": "id", "operator": ">", "value": last}] for last in (29, 59, 89))]
+
+    def test_combines_filters(self, local_api) -> None:
+        """Ensure the caller's filters are kept on every page, and a scan can be resumed after a key."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            pages = list(
+                client.iter_keyset(
+                    tableName="t",
+                    columns=["id", "name"],
+                    key="id",
+                    filters=Filter("id") < 50,  # noqa: PLR2004
+                    page_size=20,
+                    after=9,
+                    pages=True,
+                    as_="records",
+                )
+            )
+        assert [len(page) for page in pages] == [20, 20]
+        assert [row["id"] for page in pages for row in page] == list(range(10, 50))
+
+    def test_rejects_unordered_rows(self, local_api) -> None:
+        """Ensure rows that are not ordered by the key are refused instead of silently skipped."""
+        local_api.rows.reverse()
+        client = DataScribeClient(api_key="test-key", base=local_api.base)
+        with client, pytest.raises(ValueError, match="ascending order of 'id'"):
+            list(client.iter_keyset(tableName="t", columns=["id", "name"], key="id"))
+        with client, pytest.raises(ValueError, match="key column"):
+            list(client.iter_keyset(tableName="t", columns=["name"], key="id"))
@@ -0,0 +1,130 @@
+"""Testing suite for the ratelimit module.
+
+This module contains unittests for the shared rate limiter and its use by the DataScribeClient, which is
+exercised against a local server so these tests do not require API access.
+"""
+
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from requests import HTTPError
+
+from datascribe_api import DataScribeClient
+from datascribe_api.ratelimit import RateLimiter, parse_retry_after
+from datascribe_api.utils import DeadlineExceeded
+
+
+class TestRateLimiter:
+    """Unit tests for RateLimiter."""
+
+    def test_parse_retry_after(self) -> None:
+        """Ensure seconds and HTTP dates are parsed and invalid values ignored."""
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after("1000") == 120
+        assert 5 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_aimd(self) -> None:
+        """Ensure the limit is halved once per window of throttled requests and grows back with successes."""
+        limiter = RateLimiter(max_concurrency=8, cooldown=0)
+        tickets = [limiter.acquire() for _ in range(4)]
+        for ticket in tickets:
+            limiter.throttle(ticket)
+        assert limiter.limit == 4
+        assert limiter.stats()["throttled"] == 4
+        for _ in range(12):
+            limiter.success(limiter.acquire())
+        assert 6 < limiter.limit < 8
+
+    def test_concurrency_limit(self) -> None:
+        """Ensure no more requests than the limit are admitted at once."""
+        limiter = RateLimiter(max_concurrency=2)
+        first, _ = limiter.acquire(), limiter.acquire()
+        admitted = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), admitted.set()))
+        thread.start()
+        assert not admitted.wait(0.1)
+        limiter.success(first)
+        assert admitted.wait(5)
+        thread.join()
+        assert limiter.stats()["in_flight"] == 2
+
+    def test_token_bucket(self) -> None:
+        """Ensure requests beyond the burst are paced at the configured rate."""
+        rate = 50
+        limiter = RateLimiter(rate=rate, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.success(limiter.acquire())
+        assert time.monotonic() - start >= 5 / rate * 0.9
+        assert limiter.throttled_seconds > 0
+
+    def test_retry_after_pauses_all_requests(self) -> None:
+        """Ensure Retry-After pauses every request, not only the throttled one."""
+        pause = 0.2
+        limiter = RateLimiter()
+        limiter.throttle(limiter.acquire(), retry_after=pause)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= pause * 0.75
+
+    def test_acquire_timeout(self) -> None:
+        """Ensure a pause ending after the timeout raises at once, and a full limit raises once the timeout passes."""
+        limiter = RateLimiter(max_concurrency=1)
+        limiter.throttle(limiter.acquire(), retry_after=5)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire(timeout=0.5)
+        assert time.monotonic() - start < 0.25  # noqa: PLR2004
+        limiter = RateLimiter(max_concurrency=1)
+        limiter.acquire()
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire(timeout=0.1)
+        assert time.monotonic() - start >= 0.1  # noqa: PLR2004
+
+    def test_invalid_parameters(self) -> None:
+        """Ensure out-of-range parameters raise a ValueError."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(min_concurrency=4, max_concurrency=2)
+
+
+class TestClientRateLimiting:
+    """Unit tests for rate limiting in DataScribeClient."""
+
+    def test_retries_throttled_requests(self, local_api) -> None:
+        """Ensure 429 responses are reported to the limiter and retried by the client."""
+        local_api.responses.append((429, {"message": "slow down"}, {"Retry-After": "0"}))
+        local_api.responses.append((503, {"message": "busy"}, {}))
+        limiter = RateLimiter(max_concurrency=8, cooldown=0.01)
+        with DataScribeClient(api_key="test-key", base=local_api.base, rate_limiter=limiter) as client:
+            rows = client.get_data_table_rows(tableName="t", columns=["id"], numRows=3)
+        assert [row.id for row in rows] == [0, 1, 2]
+        assert len(local_api.requests) == 3
+        stats = client.rate_limiter.stats()
+        assert stats["throttled"] == 2
+        assert stats["limit"] < 8
+
+    def test_gives_up_after_retries(self, local_api) -> None:
+        """Ensure persistent throttling surfaces as an HTTPError."""
+        local_api.responses.extend([(429, {"message": "slow down"}, {"Retry-After": "0"})] * 6)
+        with (
+            DataScribeClient(api_key="test-key", base=local_api.base, rate_limiter=RateLimiter(cooldown=0)) as client,
+            pytest.raises(HTTPError, match="HTTP Error 429 - slow down"),
+        ):
+            client.get_data_table_rows(tableName="t", columns=["id"])
+        assert len(local_api.requests) == 6
+
+    def test_retry_after_respects_deadline(self, local_api) -> None:
+        """Ensure a Retry-After pause longer than the deadline fails the call instead of waiting it out."""
+        local_api.responses.append((429, {"message": "slow down"}, {"Retry-After": "5"}))
+        with DataScribeClient(api_key="test-key", base=local_api.base, rate_limiter=RateLimiter()) as client:
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                client.get_data_table_rows(tableName="t", columns=["id"], deadline=0.5)
+            assert time.monotonic() - start < 1  # noqa: PLR2004
+        assert len(local_api.requests) == 1
@@ -0,0 +1,160 @@
+"""Testing suite for the resilience module.
+
+This module contains unittests for request hedging and the circuit breaker, and for their use by the
+DataScribeClient, which is exercised against a local server so these tests do not require API access.
+"""
+
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, wait
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Response
+from requests.exceptions import RetryError
+
+from datascribe_api import DataScribeClient
+from datascribe_api.resilience import CircuitBreaker, CircuitOpenError, HedgePolicy
+from datascribe_api.retry import RetryPolicy
+from datascribe_api.utils import DeadlineExceeded
+
+ROWS_PATH = "/data/data-table-rows"
+
+
+class TestHedgePolicy:
+    """Unit tests for HedgePolicy."""
+
+    def test_delay_follows_percentile(self) -> None:
+        """Ensure the hedging delay is the configured percentile of the recorded latencies."""
+        policy = HedgePolicy(percentile=90, min_delay=0, min_samples=10)
+        for latency in range(1, 10):
+            policy.observe("/p", latency)
+        assert policy.delay("/p") is None
+        policy.observe("/p", 10)
+        assert policy.delay("/p") == 9
+        assert policy.delay("/other") is None
+
+    def test_min_delay(self) -> None:
+        """Ensure the hedging delay is never shorter than min_delay."""
+        policy = HedgePolicy(min_delay=1, min_samples=1)
+        policy.observe("/p", 0)
+        assert policy.delay("/p") == 1
+
+    def test_client_hedges_slow_request(self, local_api) -> None:
+        """Ensure a slow request is duplicated and the faster response is used."""
+        policy = HedgePolicy(min_delay=0.05, min_samples=1)
+        policy.observe(ROWS_PATH, 0.01)
+        local_api.delays.append(5)
+        start = time.monotonic()
+        with DataScribeClient(api_key="test-key", base=local_api.base, hedge=policy) as client:
+            rows = client.get_data_table_rows(tableName="t", columns=["id"], numRows=2)
+        assert time.monotonic() - start < 2
+        assert [row.id for row in rows] == [0, 1]
+        assert len(local_api.requests) == 2
+        assert (policy.hedged, policy.won) == (1, 1)
+
+    def test_client_prefers_success_completed_together(self, monkeypatch) -> None:
+        """Ensure a success is used when it completes together with the failure of the other request."""
+        policy = HedgePolicy(min_delay=0.05, min_samples=1)
+        policy.observe(ROWS_PATH, 0.01)
+        calls = []
+
+        def send(self, url, params, timeout, stream=False) -> Response:
+            calls.append(url)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                raise RequestsConnectionError("connection reset")
+            resp = Response()
+            resp.status_code, resp._content = 200, b'{"success": true, "data": [{"id": 1}]}'
+            return resp
+
+        def wait_all(futures, timeout=None, return_when=ALL_COMPLETED):
+            if return_when != FIRST_COMPLETED:
+                return wait(futures, timeout=timeout)
+            done, pending = wait(futures)
+            # The failure is listed first, as a set may do.
+            return sorted(done, key=lambda future: future.exception() is None), pending
+
+        monkeypatch.setattr(DataScribeClient, "_send", send)
+        monkeypatch.setattr("datascribe_api.client.wait", wait_all)
+        with DataScribeClient(api_key="test-key", hedge=policy) as client:
+            rows = client.get_data_table_rows(tableName="t", columns=["id"])
+        assert [row.id for row in rows] == [1]
+        assert (policy.hedged, policy.won) == (1, 1)
+
+    def test_client_does_not_hedge_fast_request(self, local_api) -> None:
+        """Ensure requests answered within the hedging delay are sent once."""
+        policy = HedgePolicy(min_delay=1, min_samples=1)
+        policy.observe(ROWS_PATH, 0.01)
+        with DataScribeClient(api_key="test-key", base=local_api.base, hedge=policy) as client:
+            client.get_data_table_rows(tableName="t", columns=["id"])
+        assert len(local_api.requests) == 1
+        assert policy.hedged == 0
+
+
+class TestCircuitBreaker:
+    """Unit tests for CircuitBreaker."""
+
+    def test_opens_and_recovers(self, monkeypatch) -> None:
+        """Ensure the circuit opens after repeated failures and lets one trial request through after the timeout."""
+        now = [0.0]
+        monkeypatch.setattr("datascribe_api.resilience.time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        breaker.check("/p")
+        breaker.record("/p", success=False)
+        breaker.record("/p", success=False)
+        assert breaker.state("/p") == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.check("/p")
+        breaker.check("/other")
+
+        now[0] = 11
+        assert breaker.state("/p") == "half-open"
+        breaker.check("/p")
+        with pytest.raises(CircuitOpenError):
+            breaker.check("/p")
+        breaker.record("/p", success=False)
+        assert breaker.state("/p") == "open"
+
+        now[0] = 22
+        breaker.check("/p")
+        breaker.record("/p", success=True)
+        assert breaker.state("/p") == "closed"
+
+    def test_client_fails_fast(self, local_api) -> None:
+        """Ensure the client stops sending requests to an endpoint whose circuit is open."""
+        local_api.responses.extend([(500, {"message": "internal error"}, {})] * 2)
+        with DataScribeClient(
+            api_key="test-key", base=local_api.base, circuit_breaker=CircuitBreaker(failure_threshold=2)
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(HTTPError):
+                    client.get_data_table_rows(tableName="t", columns=["id"])
+            with pytest.raises(CircuitOpenError):
+                client.get_data_table_rows(tableName="t", columns=["id"])
+            client.get_data_table_rows_count(tableName="t")
+        assert len(local_api.requests) == 3
+
+    def test_client_counts_exhausted_retries(self, local_api) -> None:
+        """Ensure gateway errors that exhaust the retries of the session count as failures of the endpoint."""
+        local_api.responses.extend([(503, {"message": "unavailable"}, {"Retry-After": "0"})] * 8)
+        breaker = CircuitBreaker(failure_threshold=2)
+        policy = RetryPolicy(total=1, backoff_factor=0)
+        with DataScribeClient(api_key="test-key", base=local_api.base, circuit_breaker=breaker, retry_policy=policy) as client:
+            for _ in range(2):
+                with pytest.raises(RetryError):
+                    client.get_data_table_rows(tableName="t", columns=["id"])
+            assert breaker.state(ROWS_PATH) == "open"
+            with pytest.raises(CircuitOpenError):
+                client.get_data_table_rows(tableName="t", columns=["id"])
+        assert len(local_api.requests) == 4  # noqa: PLR2004
+
+    def test_caller_deadline_is_not_a_failure(self, local_api) -> None:
+        """Ensure requests running out of the caller's deadline do not open the circuit for other callers."""
+        local_api.delay = 0.5
+        breaker = CircuitBreaker(failure_threshold=1)
+        with DataScribeClient(api_key="test-key", base=local_api.base, circuit_breaker=breaker) as client:
+            for _ in range(2):
+                with pytest.raises(DeadlineExceeded):
+                    client.get_data_table_rows(tableName="t", columns=["id"], numRows=5, deadline=0.1)
+            assert breaker.state(ROWS_PATH) == "closed"
+            assert len(client.get_data_table_rows(tableName="t", columns=["id"], numRows=5)) == 5  # noqa: PLR2004
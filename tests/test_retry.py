@@ -0,0 +1,118 @@
+"""Testing suite for the retry module.
+
+This module contains unittests for the retry policy and retry budget, and for their use by the DataScribeClient,
+which is exercised against a local server so these tests do not require API access.
+"""
+
+import backoff
+import pytest
+from requests import HTTPError
+from requests.exceptions import RetryError
+
+from datascribe_api import DataScribeClient
+from datascribe_api.ratelimit import RateLimiter
+from datascribe_api.retry import RetryBudget, RetryPolicy
+
+UNAVAILABLE = (503, {}, {})
+
+
+class TestRetryPolicy:
+    """Unit tests for RetryPolicy."""
+
+    def test_backoff_without_jitter_matches_urllib3(self) -> None:
+        """Ensure the schedule without jitter is urllib3's exponential backoff."""
+        policy = RetryPolicy(jitter=None)
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [0, 8, 16, 32]
+        assert policy.backoff(10) == policy.backoff_max
+
+    def test_decorrelated_jitter(self) -> None:
+        """Ensure decorrelated delays stay between the backoff factor and three times the previous delay."""
+        policy = RetryPolicy(backoff_factor=1, backoff_max=30)
+        assert policy.backoff(1) == 0
+        previous = 0.0
+        for attempt in range(2, 50):
+            delay = policy.backoff(attempt, previous)
+            assert 1 <= delay <= min(30, max(1, previous) * 3)
+            previous = delay
+
+    def test_backoff_package_jitter(self) -> None:
+        """Ensure jitter functions of the backoff package spread the exponential delay."""
+        policy = RetryPolicy(jitter=backoff.full_jitter)
+        assert all(0 <= policy.backoff(3) <= 16 for _ in range(20))  # noqa: PLR2004
+        with pytest.raises(ValueError, match="Unknown jitter"):
+            RetryPolicy(jitter="equal")
+
+    def test_next_delay_reports_attempts(self) -> None:
+        """Ensure retries stop once exhausted and every decision reaches the hook."""
+        events = []
+        policy = RetryPolicy(total=1, jitter=None, on_attempt=events.append)
+        assert policy.next_delay("https://x", 1, status=503) == 0
+        assert policy.next_delay("https://x", 2, status=503) is None
+        assert [event["outcome"] for event in events] == ["retry", "exhausted"]
+        assert policy.stats()["exhausted"] == 1
+
+
+class TestRetryBudget:
+    """Unit tests for RetryBudget."""
+
+    def test_caps_retries_to_ratio_of_requests(self) -> None:
+        """Ensure retries beyond the reserve are only allowed in proportion to the requests."""
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+
+class TestClientRetries:
+    """Integration tests for the retries of DataScribeClient against a local server."""
+
+    def test_reports_every_attempt(self, local_api) -> None:
+        """Ensure retried responses and the final response are reported to the hook."""
+        events = []
+        policy = RetryPolicy(backoff_factor=0, on_attempt=events.append)
+        local_api.responses.extend([UNAVAILABLE, UNAVAILABLE])
+        with DataScribeClient(api_key="test-key", base=local_api.base, retry_policy=policy) as client:
+            assert client.get_data_table_rows_count(tableName="t").total_rows == len(local_api.rows)
+        assert [(event["attempt"], event["outcome"], event["status"]) for event in events] == [
+            (1, "retry", 503),
+            (2, "retry", 503),
+            (3, "response", 200),
+        ]
+        assert events[0]["url"].startswith(local_api.base)
+        assert policy.stats()["requests"] == 1
+
+    def test_budget_stops_retries(self, local_api) -> None:
+        """Ensure a spent retry budget fails the request instead of retrying it."""
+        events = []
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, min_retries=0), on_attempt=events.append)
+        local_api.responses.append(UNAVAILABLE)
+        client = DataScribeClient(api_key="test-key", base=local_api.base, retry_policy=policy)
+        with client, pytest.raises(RetryError):
+            client.get_data_table_rows_count(tableName="t")
+        assert len(local_api.requests) == 1
+        assert [event["outcome"] for event in events] == ["budget"]
+
+    def test_budget_stops_throttled_retries(self, local_api) -> None:
+        """Ensure the retries of throttled requests made with a rate limiter are paid from the retry budget."""
+        events = []
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, min_retries=0), on_attempt=events.append)
+        local_api.responses.extend([(429, {"message": "slow down"}, {"Retry-After": "0"})] * 4)
+        client = DataScribeClient(api_key="test-key", base=local_api.base, retry_policy=policy, rate_limiter=RateLimiter())
+        with client, pytest.raises(HTTPError, match="429"):
+            client.get_data_table_rows_count(tableName="t")
+        assert len(local_api.requests) == 1
+        assert [(event["attempt"], event["outcome"], event["status"]) for event in events] == [(1, "budget", 429)]
+
+    def test_reports_throttled_retries(self, local_api) -> None:
+        """Ensure the retries of throttled requests made with a rate limiter are reported once per attempt."""
+        events = []
+        policy = RetryPolicy(on_attempt=events.append)
+        local_api.responses.append((429, {"message": "slow down"}, {"Retry-After": "0"}))
+        limiter = RateLimiter(cooldown=0)
+        with DataScribeClient(api_key="test-key", base=local_api.base, retry_policy=policy, rate_limiter=limiter) as client:
+            assert client.get_data_table_rows_count(tableName="t").total_rows == len(local_api.rows)
+        assert [(event["outcome"], event["status"]) for event in events] == [("retry", 429), ("response", 200)]
+        assert policy.stats()["retries"] == 1
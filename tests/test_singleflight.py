@@ -0,0 +1,179 @@
+"""Testing suite for the singleflight module.
+
+This module contains unittests for the coalescing of identical concurrent requests, using a local server and a
+mocked transport so they do not require API access.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from datascribe_api import AsyncDataScribeClient, DataScribeClient
+from datascribe_api.singleflight import AsyncSingleFlight, SingleFlight
+from datascribe_api.utils import DeadlineExceeded
+
+CALLERS = 8
+
+
+class TestSingleFlight:
+    """Unit tests for SingleFlight."""
+
+    def test_shares_result(self) -> None:
+        """Ensure concurrent callers with the same key share one call."""
+        flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+        def call() -> object:
+            started.set()
+            release.wait(5)
+            return object()
+
+        with ThreadPoolExecutor(CALLERS) as executor:
+            leader = executor.submit(flight.do, "k", call)
+            started.wait(5)
+            followers = [executor.submit(flight.do, "k", call) for _ in range(CALLERS - 1)]
+            while flight.shared < CALLERS - 1:
+                threading.Event().wait(0.01)
+            release.set()
+            results = {id(future.result()) for future in [leader, *followers]}
+        assert len(results) == 1
+        assert (flight.calls, flight.shared) == (1, CALLERS - 1)
+
+    def test_shares_exception(self) -> None:
+        """Ensure followers receive the exception raised by the call and later calls run again."""
+        flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+        def call() -> None:
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "k", call)
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", call)
+            while flight.shared < 1:
+                threading.Event().wait(0.01)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError, match="boom"):
+                    future.result()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.calls == 2
+
+    def test_retries_caller_specific_exception(self) -> None:
+        """Ensure a follower makes the call itself when the leader fails with an exception listed in `retry_on`."""
+        flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+        def fail() -> None:
+            started.set()
+            release.wait(5)
+            raise DeadlineExceeded("leader deadline")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "k", fail, retry_on=(DeadlineExceeded,))
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", lambda: 42, retry_on=(DeadlineExceeded,))
+            while flight.shared < 1:
+                threading.Event().wait(0.01)
+            release.set()
+            with pytest.raises(DeadlineExceeded, match="leader deadline"):
+                leader.result()
+            assert follower.result() == 42  # noqa: PLR2004
+        assert (flight.calls, flight.shared) == (2, 1)
+
+    def test_shares_copies(self) -> None:
+        """Ensure followers receive the result passed through `share`, while the leader keeps the original."""
+        flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+        original = {"rows": [1, 2]}
+
+        def call() -> dict:
+            started.set()
+            release.wait(5)
+            return original
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "k", call, share=dict)
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", call, share=dict)
+            while flight.shared < 1:
+                threading.Event().wait(0.01)
+            release.set()
+            assert leader.result() is original
+            assert follower.result() == original
+            assert follower.result() is not original
+
+
+class TestClientCoalescing:
+    """Unit tests for request coalescing in the clients."""
+
+    @pytest.mark.parametrize(("coalesce", "expected"), [(True, 1), (False, CALLERS)])
+    def test_sync_client(self, local_api, coalesce, expected) -> None:
+        """Ensure identical concurrent calls from several threads share one HTTP request."""
+        local_api.delay = 0.3
+        barrier = threading.Barrier(CALLERS)
+
+        def call(client: DataScribeClient):
+            barrier.wait()
+            return client.get_data_table_rows(tableName="t", columns=["id"], numRows=5)
+
+        with (
+            DataScribeClient(api_key="test-key", base=local_api.base, coalesce=coalesce) as client,
+            ThreadPoolExecutor(CALLERS) as executor,
+        ):
+            results = list(executor.map(call, [client] * CALLERS))
+        assert len(local_api.requests) == expected
+        assert all([row.id for row in rows] == list(range(5)) for rows in results)
+
+    def test_sync_client_leader_deadline(self, local_api) -> None:
+        """Ensure a caller without a deadline is not failed by the deadline of the caller it shared a request with."""
+        local_api.delays = [1.0]
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client, ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(client.get_data_table_rows, tableName="t", columns=["id"], numRows=5, deadline=0.3)
+            while not local_api.requests:
+                threading.Event().wait(0.01)
+            follower = executor.submit(client.get_data_table_rows, tableName="t", columns=["id"], numRows=5)
+            with pytest.raises(DeadlineExceeded):
+                leader.result()
+            assert [row.id for row in follower.result()] == list(range(5))
+        assert client._flight.shared == 1
+        assert len(local_api.requests) == 2  # noqa: PLR2004
+
+    def test_async_client(self) -> None:
+        """Ensure identical concurrent calls from several tasks share one HTTP request, and distinct calls do not."""
+        httpx = pytest.importorskip("httpx")
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"success": True, "data": [{"id": 1}]})
+
+        async def run():
+            async with AsyncDataScribeClient(api_key="test-key", base="https://example.test/") as client:
+                client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                same = [client.get_data_table_rows(tableName="t", columns=["id"]) for _ in range(CALLERS)]
+                other = client.get_data_table_rows(tableName="u", columns=["id"])
+                return await asyncio.gather(*same, other)
+
+        results = asyncio.run(run())
+        assert len(results) == CALLERS + 1
+        assert len(requests) == 2
+
+    def test_async_cancelled_caller(self) -> None:
+        """Ensure cancelling one caller does not cancel the shared call for the others."""
+
+        async def run():
+            flight = AsyncSingleFlight()
+
+            async def call():
+                await asyncio.sleep(0.05)
+                return 42
+
+            first = asyncio.create_task(flight.do("k", call))
+            second = asyncio.create_task(flight.do("k", call))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled()
+
+        assert asyncio.run(run()) == (42, True)
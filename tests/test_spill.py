@@ -0,0 +1,86 @@
+"""Testing suite for the spill module.
+
+This module contains unittests for memory-bounded DataFrames and for the chunked DataFrame downloads of the
+DataScribeClient, which are exercised against a local server so these tests do not require API access.
+"""
+
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from datascribe_api import DataScribeClient
+from datascribe_api.spill import collect_chunks
+
+CHUNKS = [pd.DataFrame({"id": range(start, start + 10)}, index=range(start, start + 10)) for start in (0, 10, 20)]
+
+
+class TestCollectChunks:
+    """Unit tests for collect_chunks and ChunkedFrame."""
+
+    def test_keeps_chunks_within_limit(self) -> None:
+        """Ensure chunks are kept in memory while they fit, without touching the disk."""
+        frame = collect_chunks(CHUNKS, max_memory=1024**2)
+        assert frame.spilled == []
+        assert frame.directory is None
+        assert len(frame) == 30  # noqa: PLR2004
+        assert frame.to_pandas()["id"].tolist() == list(range(30))
+
+    @pytest.mark.parametrize("spill_format", ["parquet", "feather"])
+    def test_spills_beyond_limit(self, tmp_path, spill_format) -> None:
+        """Ensure chunks beyond the limit are written to files, read back in order, and deleted on close."""
+        pytest.importorskip("pyarrow")
+        limit = int(CHUNKS[0].memory_usage(deep=True).sum())
+        with collect_chunks(CHUNKS, max_memory=limit, spill_dir=tmp_path, spill_format=spill_format) as frame:
+            assert [path.name for path in frame.spilled] == [f"chunk-000001.{spill_format}", f"chunk-000002.{spill_format}"]
+            assert [df.index[0] for df in frame] == [0, 10, 20]
+            assert frame.to_pandas()["id"].tolist() == list(range(30))
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+    def test_spilling_requires_pyarrow(self, tmp_path) -> None:
+        """Ensure a missing pyarrow is reported with the extra to install, leaving no files behind."""
+        with pytest.raises(ImportError, match=r"datascribe_api\[arrow\]"):
+            collect_chunks(CHUNKS, max_memory=0, spill_dir=tmp_path / "spill")
+        assert not list((tmp_path / "spill").iterdir())
+
+    def test_rejects_invalid_arguments(self) -> None:
+        """Ensure a negative limit and unknown formats are refused."""
+        with pytest.raises(ValueError, match="max_memory"):
+            collect_chunks(CHUNKS, max_memory=-1)
+        with pytest.raises(ValueError, match="Unsupported spill format"):
+            collect_chunks(CHUNKS, max_memory=0, spill_format="csv")
+
+
+class TestClientDataFrames:
+    """Integration tests for DataScribeClient.iter_dataframes and DataScribeClient.to_dataframe."""
+
+    def test_iter_dataframes(self, local_api) -> None:
+        """Ensure the table is yielded in chunks of whole pages with continuous row positions."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            chunks = list(client.iter_dataframes(tableName="t", columns=["id", "name"], chunk_rows=40, page_size=30))
+        assert [len(df) for df in chunks] == [60, 40]
+        assert chunks[1].index[0] == 60  # noqa: PLR2004
+        assert pd.concat(chunks).to_dict("records") == local_api.rows
+
+    def test_to_dataframe(self, local_api) -> None:
+        """Ensure the table is returned as one DataFrame, or as chunks when a memory limit is given."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.to_dataframe(tableName="t", columns=["id", "name"], chunk_rows=50, page_size=50)
+            frame = client.to_dataframe(tableName="t", columns=["id", "name"], max_memory=1024**2, chunk_rows=50)
+        assert df.to_dict("records") == local_api.rows
+        assert len(frame) == len(local_api.rows)
+        assert frame.to_pandas().equals(df)
+
+    def test_typed_categories_across_chunks(self, local_api) -> None:
+        """Ensure a text column stays categorical, with the categories of every chunk, when chunks are joined."""
+        local_api.rows = [{"id": i, "name": "abcd"[i // 25]} for i in range(100)]
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = client.to_dataframe(tableName="t", columns=["id", "name"], chunk_rows=25, page_size=25, typed=True)
+            frame = client.to_dataframe(
+                tableName="t", columns=["id", "name"], max_memory=1024**2, chunk_rows=25, page_size=25, typed=True
+            )
+        assert df["name"].dtype == "category"
+        assert list(df["name"].cat.categories) == ["a", "b", "c", "d"]
+        assert df["name"].tolist() == [row["name"] for row in local_api.rows]
+        assert frame.to_pandas()["name"].dtype == "category"
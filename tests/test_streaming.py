@@ -0,0 +1,117 @@
+"""Testing suite for the streaming module.
+
+This module contains unittests for the incremental JSON decoding of large responses and for
+`DataScribeClient.stream_table_rows`, which is exercised against a local server so it does not require API access.
+"""
+
+import json
+
+import pytest
+from requests import HTTPError
+
+from datascribe_api import DataScribeClient
+from datascribe_api.models import DataTableRow
+from datascribe_api.ratelimit import RateLimiter
+from datascribe_api.resilience import CircuitBreaker, CircuitOpenError
+from datascribe_api.streaming import iter_json_array, records_to_dataframe
+
+
+def split(text: str, size: int) -> list[bytes]:
+    """Split the UTF-8 encoding of a text into chunks of `size` bytes."""
+    data = text.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    """Unit tests for iter_json_array."""
+
+    BODY = {
+        "success": True,
+        "data": [{"id": 12345, "name": "ünïcødé", "score": -1.5e3}, {"id": 7, "tags": [1, [2]]}, None],
+        "total": 3,
+    }
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1024])
+    def test_decodes_across_chunk_boundaries(self, size) -> None:
+        """Ensure values, numbers and multi-byte characters split across chunks are decoded intact."""
+        fields: dict = {}
+        items = list(iter_json_array(split(json.dumps(self.BODY, ensure_ascii=False), size), "data", fields))
+        assert items == self.BODY["data"]
+        assert fields == {"success": True, "total": 3}
+
+    def test_whitespace_and_empty_array(self) -> None:
+        """Ensure whitespace between tokens and empty arrays are handled."""
+        fields: dict = {}
+        assert list(iter_json_array(split('{ "data" : [ ] ,\n "success" : false }', 2), "data", fields)) == []
+        assert fields == {"success": False}
+
+    def test_non_array_value_is_reported(self) -> None:
+        """Ensure a non-array value under the key is stored in fields instead of yielded."""
+        fields: dict = {}
+        assert list(iter_json_array([b'{"data": {"total_rows": 3}}'], "data", fields)) == []
+        assert fields == {"data": {"total_rows": 3}}
+
+    def test_invalid_document(self) -> None:
+        """Ensure truncated or non-object documents raise a JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([b'{"data": [1, 2']))
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([b"[1, 2]"]))
+
+
+class TestRecordsToDataFrame:
+    """Unit tests for records_to_dataframe."""
+
+    def test_builds_columns(self) -> None:
+        """Ensure records with differing keys are aligned into columns."""
+        df = records_to_dataframe(iter([{"id": 1}, {"id": 2, "name": "b"}, {"name": "c"}]))
+        assert list(df.columns) == ["id", "name"]
+        assert df["name"].isna().tolist() == [True, False, False]
+        assert df["id"].isna().tolist() == [False, False, True]
+
+
+class TestStreamTableRows:
+    """Unit tests for DataScribeClient.stream_table_rows."""
+
+    def test_streams_rows(self, local_api) -> None:
+        """Ensure rows are streamed as DataTableRow objects from the rows endpoint."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = list(client.stream_table_rows(tableName="t", columns=["id", "name"], startingRow=10, numRows=50))
+        assert [row.id for row in rows] == list(range(10, 60))
+        assert all(isinstance(row, DataTableRow) for row in rows)
+        assert local_api.requests[0][0] == "/data/data-table-rows"
+
+    def test_streams_raw_records(self, local_api) -> None:
+        """Ensure raw records can be collected into a DataFrame from the table endpoint."""
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            df = records_to_dataframe(client.stream_table_rows(tableName="t", numRows=1000, raw=True))
+        assert df["id"].tolist() == list(range(100))
+        assert local_api.requests[0][0] == "/data/data-table"
+
+    def test_reports_failures(self, local_api) -> None:
+        """Ensure a failed request raises a ValueError."""
+        local_api.responses.append((200, {"success": False, "message": "no such table", "data": []}, {}))
+        with (
+            DataScribeClient(api_key="test-key", base=local_api.base) as client,
+            pytest.raises(ValueError, match="no such table"),
+        ):
+            list(client.stream_table_rows(tableName="t", columns=["id"]))
+
+    def test_uses_rate_limiter_and_circuit_breaker(self, local_api) -> None:
+        """Ensure streamed requests are paced by the rate limiter and fail fast once the circuit is open."""
+        local_api.responses.append((500, {"message": "internal error"}, {}))
+        limiter = RateLimiter()
+        with DataScribeClient(
+            api_key="test-key", base=local_api.base, rate_limiter=limiter, circuit_breaker=CircuitBreaker(failure_threshold=1)
+        ) as client:
+            with pytest.raises(HTTPError):
+                list(client.stream_table_rows(tableName="t", columns=["id"]))
+            with pytest.raises(CircuitOpenError):
+                list(client.stream_table_rows(tableName="t", columns=["id"]))
+        assert len(local_api.requests) == 1
+        assert limiter.stats()["requests"] == 1
+
+    def test_filters_require_columns(self) -> None:
+        """Ensure filtering without columns raises a ValueError."""
+        with DataScribeClient(api_key="test-key") as client, pytest.raises(ValueError):
+            client.stream_table_rows(tableName="t", filters={"column": "id", "operator": ">", "value": 1})
@@ -0,0 +1,111 @@
+"""Testing suite for the utils module.
+
+This module tests the session, retry and parameter helpers of the DataScribe API client. Network behavior is
+exercised against a local HTTP server, so these tests do not require API access.
+"""
+
+import socket
+import time
+
+import pytest
+from requests import Session
+
+from datascribe_api import DataScribeClient
+from datascribe_api.utils import (
+    DeadlineExceeded,
+    deadline_scope,
+    keepalive_socket_options,
+    pool_stats,
+    prepare_params,
+    remaining_time,
+    request_timeout,
+    resolve_timeouts,
+    retry_session,
+)
+
+
+class TestRetrySession:
+    """Unit tests for retry_session and its connection pools."""
+
+    def test_returns_session_with_pool_settings(self) -> None:
+        """Ensure the adapters carry the requested pool settings."""
+        session = retry_session(pool_maxsize=8, pool_block=True)
+        adapter = session.get_adapter("https://datascribe.cloud")
+        assert isinstance(session, Session)
+        assert adapter._pool_maxsize == 8
+        assert adapter._pool_block is True
+
+    def test_keepalive_socket_options(self) -> None:
+        """Ensure keep-alive probes are enabled on pooled sockets."""
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in keepalive_socket_options()
+        assert "socket_options" not in retry_session(keepalive=False).get_adapter("https://x").poolmanager.connection_pool_kw
+
+    def test_parallel_scan_reuses_connections(self, local_api) -> None:
+        """Ensure a parallel scan with N workers opens at most N connections."""
+        workers = 4
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            rows = client.fetch_table(tableName="t", columns=["id"], workers=workers, page_size=5)
+            assert len(rows) == len(local_api.rows)
+            (stats,) = pool_stats(client._session)
+            assert stats == client.pool_stats()[0]
+            assert stats["requests"] == len(local_api.requests)
+            assert stats["connections"] <= workers
+            assert stats["in_use"] == 0
+            assert stats["idle"] == stats["connections"]
+
+
+class TestHelpers:
+    """Unit tests for the request helpers."""
+
+    def test_prepare_params(self) -> None:
+        """Ensure list parameters are joined and filters serialized."""
+        params = prepare_params({"ids": ["a", "b"], "providers": ["MP", "AFLOW"], "filters": {"column": "x"}})
+        assert params == {"providers": "MP,AFLOW", "filters": '{"column":"x"}', "ids": "a,b"}
+
+
+class TestTimeouts:
+    """Unit tests for per-endpoint timeouts and deadlines."""
+
+    def test_resolve_timeouts(self) -> None:
+        """Ensure overrides replace the default timeouts of the named endpoints only."""
+        timeouts = resolve_timeouts({"get_data_table_metadata": (2, 5), "get_data_tables": 7})
+        assert timeouts["/data/data-table-metadata"] == (2, 5)
+        assert timeouts["/data/data-tables"] == (10.0, 7.0)
+        assert timeouts["/data/data-table-rows"] == (10.0, 600.0)
+        with pytest.raises(ValueError, match="get_rows"):
+            resolve_timeouts({"get_rows": 1})
+
+    def test_deadline_scope(self) -> None:
+        """Ensure nested scopes only shorten the deadline and timeouts are capped at the remaining time."""
+        connect = 0.5
+        assert remaining_time() is None
+        with deadline_scope(1):
+            with deadline_scope(60):
+                assert remaining_time() <= 1
+            assert request_timeout((10, 600))[1] <= 1
+            assert request_timeout((connect, 600))[0] == connect
+        assert remaining_time() is None
+        with deadline_scope(0), pytest.raises(DeadlineExceeded):
+            remaining_time()
+
+    def test_client_deadline(self, local_api) -> None:
+        """Ensure a call that outlives its deadline raises DeadlineExceeded instead of waiting for the response."""
+        local_api.delays.append(5)
+        start = time.monotonic()
+        with DataScribeClient(api_key="test-key", base=local_api.base) as client:
+            with pytest.raises(DeadlineExceeded):
+                client.get_data_tables(deadline=0.2)
+            assert time.monotonic() - start < 2
+            assert client.get_data_table_rows_count(tableName="t", deadline=5).total_rows == len(local_api.rows)
+
+    def test_client_endpoint_timeout(self, local_api) -> None:
+        """Ensure the read timeout of an endpoint can be overridden, so a stalled request is retried sooner."""
+        local_api.delays.append(5)
+        local_api.responses.extend([(200, {"success": True, "data": {"total_rows": 3}}, {})] * 2)
+        timeouts = {"get_data_table_rows_count": 0.2}
+        start = time.monotonic()
+        with DataScribeClient(api_key="test-key", base=local_api.base, timeouts=timeouts) as client:
+            assert client._timeouts["/data/data-table-rows-count"] == (10.0, 0.2)
+            assert client.get_data_table_rows_count(tableName="t").total_rows == 3
+        assert time.monotonic() - start < 2
+        assert len(local_api.requests) == 2